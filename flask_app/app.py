@@ -285,6 +285,7 @@ def translate_to_isl():
             'animation_frames': animation_result.get('frames', []),
             'schedule': animation_result.get('schedule', []),
             'total_duration': animation_result.get('total_duration', 0),
+            'connections': animation_result.get('connections', []),
             'processing_details': processing_details,
             'input_text': text
         })
@@ -1,6 +1,5 @@
-from .speech_recognition import SpeechRecognizer
 from .nlp_processor import NLPProcessor, nlp_processor
-from .sign_database import ISLDatabase, isl_database
+from .sign_database import ISLDatabase, isl_database, Landmark
 from .animation_generator import AnimationGenerator, animation_generator
 from .isl_mapper_new import ISLMapper, isl_mapper
 from .avatar_renderer_new import AvatarRenderer, avatar_renderer
@@ -8,8 +7,17 @@ from .avatar_renderer_new import AvatarRenderer, avatar_renderer
 __all__ = [
     'SpeechRecognizer',
     'NLPProcessor', 'nlp_processor',
-    'ISLDatabase', 'isl_database', 
+    'ISLDatabase', 'isl_database', 'Landmark',
     'AnimationGenerator', 'animation_generator',
     'ISLMapper', 'isl_mapper',
     'AvatarRenderer', 'avatar_renderer'
 ]
+
+
+def __getattr__(name):
+    # The recognizer pulls in SpeechRecognition, torch and transformers, so it
+    # is only imported when first asked for (PEP 562)
+    if name == 'SpeechRecognizer':
+        from .speech_recognition import SpeechRecognizer
+        return SpeechRecognizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
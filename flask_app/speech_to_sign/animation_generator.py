@@ -248,13 +248,13 @@ class AnimationGenerator:
         from_hand = from_keyframes[-1]['right_hand'] if from_keyframes else self.sign_db._create_base_hand()
         to_hand = to_keyframes[0]['right_hand'] if to_keyframes else self.sign_db._create_base_hand()
         
-        for frame_num in range(total_frames):
-            progress = frame_num / max(total_frames - 1, 1)
-            eased = self._ease_in_out_cubic(progress)
-            
-            # Interpolate hand positions
-            interpolated_hand = self.sign_db._interpolate_landmarks(from_hand, to_hand, eased)
-            
+        eased_progresses = [self._ease_in_out_cubic(frame_num / max(total_frames - 1, 1))
+                            for frame_num in range(total_frames)]
+        
+        # Interpolate hand positions for every frame at once
+        hands = self.sign_db._interpolate_landmark_frames(from_hand, to_hand, eased_progresses)
+        
+        for frame_num, (eased, interpolated_hand) in enumerate(zip(eased_progresses, hands)):
             frame = {
                 'frame_number': frame_num,
                 'total_frames': total_frames,
@@ -7,11 +7,61 @@ Generates animation frames for frontend visualization.
 """
 
 import math
+from functools import lru_cache
 from typing import List, Dict, Tuple
-from .sign_database import ISLDatabase, isl_database
+import numpy as np
+from .constants import CLASS_LABELS, CLASS_LABELS_SET
+from .sign_database import ISLDatabase, isl_database, _mirror
 from .animation_generator import AnimationGenerator, animation_generator
 
 
+# Finger connections for drawing (sent once per response, not per frame)
+FINGER_CONNECTIONS = (
+    # Thumb
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    # Index
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    # Middle
+    (0, 9), (9, 10), (10, 11), (11, 12),
+    # Ring
+    (0, 13), (13, 14), (14, 15), (15, 16),
+    # Pinky
+    (0, 17), (17, 18), (18, 19), (19, 20),
+    # Palm
+    (5, 9), (9, 13), (13, 17)
+)
+
+# Base facial expression values (read-only; callers get a fresh dict per frame)
+_EXPRESSIONS = {
+    'neutral': {'eyebrows': 0, 'eye_openness': 1.0, 'mouth_curve': 0, 'mouth_openness': 0},
+    'smile': {'eyebrows': 0.1, 'eye_openness': 0.9, 'mouth_curve': 0.5, 'mouth_openness': 0.1},
+    'sad': {'eyebrows': -0.3, 'eye_openness': 0.8, 'mouth_curve': -0.4, 'mouth_openness': 0},
+    'question': {'eyebrows': 0.4, 'eye_openness': 1.1, 'mouth_curve': 0, 'mouth_openness': 0.2},
+    'calm': {'eyebrows': 0, 'eye_openness': 0.7, 'mouth_curve': 0.1, 'mouth_openness': 0},
+    'frown': {'eyebrows': -0.4, 'eye_openness': 0.9, 'mouth_curve': -0.3, 'mouth_openness': 0},
+    'intense': {'eyebrows': 0.3, 'eye_openness': 1.2, 'mouth_curve': 0, 'mouth_openness': 0.3}
+}
+
+# Body pose per region as (head_tilt, shoulder_offset)
+_POSES = {
+    'neutral': (0, 0),
+    'head': (5, 0),
+    'face': (0, 0),
+    'forehead': (-5, 0),
+    'chin': (10, 0),
+    'chest': (0, 0),
+    'ear': (0, 5),
+    'ears': (0, 5),
+    'temple': (-3, 3),
+    'eyes': (-5, 0),
+    'nose': (0, 0),
+    'mouth': (5, 0),
+    'lips': (5, 0),
+    'cheek': (0, 3),
+    'thigh': (15, 0)
+}
+
+
 class AvatarRenderer:
     """
     3D Avatar Rendering Module
@@ -24,20 +74,9 @@ class AvatarRenderer:
         self.sign_db = sign_db or isl_database
         self.anim_gen = anim_gen or animation_generator
         
-        # Class labels from app.py
-        self.class_labels = [
-            '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-            'A', 'Alright', 'Animal', 'B', 'Beautiful', 'Bed', 'Bedroom', 'Bird', 'Black', 'Blind',
-            'C', 'Cat', 'Chair', 'Colour', 'Cow', 'D', 'Daughter', 'Deaf', 'Dog', 'Door', 'Dream',
-            'E', 'F', 'Father', 'Fish', 'Friday', 'G', 'Good Morning', 'Good night', 'Grey',
-            'H', 'Happy', 'He', 'Hello', 'Horse', 'How are you', 'I', 'It',
-            'J', 'K', 'L', 'Loud', 'M', 'Monday', 'Mother', 'Mouse',
-            'N', 'O', 'Orange', 'P', 'Parent', 'Pink', 'Pleased',
-            'Q', 'Quiet', 'R', 'S', 'Sad', 'Saturday', 'She', 'Son', 'Sunday',
-            'T', 'Table', 'Thank you', 'Thursday', 'Today', 'Tuesday',
-            'U', 'Ugly', 'V', 'W', 'Wednesday', 'White', 'Window',
-            'X', 'Y', 'You', 'Z'
-        ]
+        # Class labels from app.py (shared, immutable)
+        self.class_labels = CLASS_LABELS
+        self._class_labels_set = CLASS_LABELS_SET
         
         # Avatar configuration
         self.config = {
@@ -61,20 +100,40 @@ class AvatarRenderer:
         ]
         
         # Finger connections for drawing
-        self.finger_connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm
-            (5, 9), (9, 13), (13, 17)
-        ]
+        self.finger_connections = FINGER_CONNECTIONS
+        
+        # Per-landmark phase offsets for the wiggling motion
+        self._wiggle_phases = np.arange(len(self.landmark_names)) * 0.5
+        
+        # Facial and pose data only change between quantized blink/breathing
+        # states, so frames in the same state share one dict
+        self._facial_quantized = lru_cache(maxsize=256)(self._build_facial_data)
+        self._body_pose_quantized = lru_cache(maxsize=256)(self._build_body_pose)
+        
+        # Motion offsets depend only on (motion_type, frame count)
+        self._compute_motion_offsets = lru_cache(maxsize=128)(self._build_motion_offsets)
+        
+        # Replayed sign sequences reuse their rendered animation
+        self._render_cached = lru_cache(maxsize=64)(self._render_full_uncached)
+        
+        self.fps = 30
+        
+        # Fallback hand used when a sign has no keyframes (constant, read-only)
+        self._default_keypoints = self.sign_db._base_hand_array(0.5, 0.5)
+        self._default_keypoints.flags.writeable = False
+        
+        # Motion modifiers: each shifts (..., 21, 3) keypoints in place; progress
+        # may be a scalar or a column of per-frame values
+        self.motion_modifiers = {
+            'wave': self._motion_wave,
+            'circular': self._motion_circular,
+            'wiggling': self._motion_wiggling,
+            'outward': self._motion_outward,
+            'downward': self._motion_downward,
+            'rising': self._motion_rising,
+            'tapping': self._motion_tapping,
+            'rocking': self._motion_rocking
+        }
     
     def render_animation_sequence(self, animations: List[Dict]) -> List[Dict]:
         """
@@ -86,7 +145,7 @@ class AvatarRenderer:
         Returns:
             List of rendered frames ready for frontend display
         """
-        all_frames = []
+        segments = []
         current_timestamp = 0
         
         for anim in animations:
@@ -96,63 +155,85 @@ class AvatarRenderer:
             # Get sign data from database
             sign_data = self.sign_db.get_sign(sign)
             
-            # Generate frames for this sign
-            sign_frames = self._render_sign_frames(sign, sign_data, duration, current_timestamp)
-            all_frames.extend(sign_frames)
-            
+            segments.append(self._plan_sign_segment(sign, sign_data, duration, current_timestamp))
             current_timestamp += duration
         
-        return all_frames
+        return self._render_segments(segments)
     
     def _render_sign_frames(self, sign: str, sign_data: Dict, 
                             duration: int, start_time: int) -> List[Dict]:
         """Render all frames for a single sign"""
+        return self._render_segments([self._plan_sign_segment(sign, sign_data, duration, start_time)])
+    
+    def _plan_sign_segment(self, sign: str, sign_data: Dict,
+                           duration: int, start_time: int) -> Dict:
+        """Collect keyframe endpoints, eased progress and metadata for one sign"""
+        total_frames = max(int(duration / 1000 * self.fps), 5)
+        start, end = self._sign_endpoints(sign, sign_data)
+        
+        return {
+            'sign': sign,
+            'start_time': start_time,
+            'start': start,
+            'end': end,
+            # Ease every frame's progress in one vectorized pass
+            'eased': self._ease_in_out_vec(np.arange(total_frames) / max(total_frames - 1, 1)),
+            'motion_type': sign_data.get('motion_type', 'static'),
+            'facial_expression': sign_data.get('facial_expression', 'neutral'),
+            'body_region': sign_data.get('body_region', 'neutral'),
+            'two_hands': sign_data.get('two_hands', False)
+        }
+    
+    def _render_segments(self, segments: List[Dict]) -> List[Dict]:
+        """Interpolate keypoints for every frame of every segment in one batch"""
+        if not segments:
+            return []
+        
+        counts = [len(seg['eased']) for seg in segments]
+        eased = np.concatenate([seg['eased'] for seg in segments])
+        starts = np.repeat(np.stack([seg['start'] for seg in segments]), counts, axis=0)
+        ends = np.repeat(np.stack([seg['end'] for seg in segments]), counts, axis=0)
+        
+        # (total_frames, 21, 3) keypoints for the whole sequence
+        keypoints = starts + (ends - starts) * eased[:, None, None]
+        
         frames = []
-        fps = 30
-        total_frames = max(int(duration / 1000 * fps), 5)
-        
-        # Get keyframes and motion info from sign data
-        keyframes = sign_data.get('keyframes', [])
-        motion_type = sign_data.get('motion_type', 'static')
-        facial_expr = sign_data.get('facial_expression', 'neutral')
-        body_region = sign_data.get('body_region', 'neutral')
-        two_hands = sign_data.get('two_hands', False)
-        
-        for frame_num in range(total_frames):
-            progress = frame_num / max(total_frames - 1, 1)
-            eased_progress = self._ease_in_out(progress)
-            
-            # Interpolate keyframes
-            right_hand_keypoints = self._get_interpolated_keypoints(
-                keyframes, eased_progress, motion_type, sign_data
-            )
-            
-            left_hand_keypoints = None
-            if two_hands:
-                left_hand_keypoints = self._mirror_hand(right_hand_keypoints)
-            
+        offset = 0
+        for seg, count in zip(segments, counts):
+            block = keypoints[offset:offset + count]
+            offset += count
+            if seg['motion_type'] in self.motion_modifiers:
+                block = block + self._compute_motion_offsets(seg['motion_type'], count)
+            frames.extend(self._build_sign_frames(seg, block))
+        
+        return frames
+    
+    def _build_sign_frames(self, seg: Dict, keypoints: np.ndarray) -> List[Dict]:
+        """Serialize a segment's keypoint block into frame dicts"""
+        frames = []
+        fps = self.fps
+        total_frames = len(keypoints)
+        two_hands = seg['two_hands']
+        right_hands = self._serialize_block(keypoints)
+        left_hands = self._serialize_block(self._mirror_hand(keypoints)) if two_hands else None
+        
+        for frame_num, eased_progress in enumerate(seg['eased'].tolist()):
             # Build frame data
             frame = {
                 'frame': frame_num,
                 'total_frames': total_frames,
-                'sign': sign,
-                'timestamp': start_time + (frame_num * 1000 / fps),
+                'sign': seg['sign'],
+                'timestamp': seg['start_time'] + (frame_num * 1000 / fps),
                 'progress': eased_progress,
                 
                 # Hand keypoints (21 landmarks each)
-                'right_hand': {
-                    'keypoints': right_hand_keypoints,
-                    'connections': self.finger_connections
-                },
-                'left_hand': {
-                    'keypoints': left_hand_keypoints,
-                    'connections': self.finger_connections
-                } if two_hands else None,
+                'right_hand': right_hands[frame_num],
+                'left_hand': left_hands[frame_num] if two_hands else None,
                 
                 # Rendering info
-                'facial_expression': self._get_facial_data(facial_expr, eased_progress),
-                'body_pose': self._get_body_pose(body_region, eased_progress),
-                'motion_type': motion_type,
+                'facial_expression': self._get_facial_data(seg['facial_expression'], eased_progress),
+                'body_pose': self._get_body_pose(seg['body_region'], eased_progress),
+                'motion_type': seg['motion_type'],
                 
                 # Visual settings
                 'hand_color': self.config['hand_color'],
@@ -167,192 +248,138 @@ class AvatarRenderer:
         
         return frames
     
-    def _get_interpolated_keypoints(self, keyframes: List[Dict], progress: float,
-                                    motion_type: str, sign_data: Dict) -> List[Dict]:
-        """Get interpolated keypoints for current progress"""
+    def _kp_to_array(self, keypoints) -> np.ndarray:
+        """Pack Landmark records or {'x','y','z'} keypoints into an (N, 3) array"""
+        if isinstance(keypoints, np.ndarray):
+            return keypoints
+        return self.sign_db._landmark_rows(keypoints, len(keypoints))
+    
+    def _serialize_keypoints(self, keypoints) -> Dict:
+        """Serialize one hand as per-axis coordinate lists {'xs', 'ys', 'zs'}"""
+        if keypoints is None:
+            return None
+        if isinstance(keypoints, np.ndarray):
+            xs, ys, zs = keypoints.T.tolist()  # one conversion for all three axes
+            return {'xs': xs, 'ys': ys, 'zs': zs}
+        return {
+            'xs': [kp['x'] for kp in keypoints],
+            'ys': [kp['y'] for kp in keypoints],
+            'zs': [kp['z'] for kp in keypoints]
+        }
+    
+    def _serialize_block(self, block: np.ndarray) -> List[Dict]:
+        """Serialize a (frames, N, 3) block into one {'xs', 'ys', 'zs'} hand per frame"""
+        xs, ys, zs = np.moveaxis(block, -1, 0).tolist()
+        return [{'xs': x, 'ys': y, 'zs': z} for x, y, z in zip(xs, ys, zs)]
+    
+    def _sign_endpoints(self, sign: str, sign_data: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """First and last right-hand keyframes, from the database's cached arrays when it has the sign"""
+        arrays = self.sign_db.get_keyframe_arrays(sign)
+        if arrays:
+            return arrays[0][0], arrays[-1][0]
+        # Unknown signs render the default record's keyframes
+        return self._keyframe_endpoints(sign_data.get('keyframes', []))
+    
+    def _keyframe_endpoints(self, keyframes: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get first and last right-hand keyframes as equally sized arrays"""
+        default = self._default_keypoints
         if not keyframes:
-            return self._get_default_keypoints()
-        
-        # Get base keypoints
-        if len(keyframes) >= 2:
-            # Interpolate between first and last keyframe
-            start = keyframes[0].get('right_hand', self._get_default_keypoints())
-            end = keyframes[-1].get('right_hand', start)
-            base_keypoints = self._interpolate_keypoints(start, end, progress)
-        else:
-            base_keypoints = keyframes[0].get('right_hand', self._get_default_keypoints())
-        
-        # Apply motion modifier
-        if motion_type != 'static':
-            base_keypoints = self._apply_motion(base_keypoints, motion_type, progress)
-        
-        return base_keypoints
-    
-    def _interpolate_keypoints(self, start: List[Dict], end: List[Dict], 
-                               progress: float) -> List[Dict]:
-        """Linear interpolation between two sets of keypoints"""
-        if not start or not end:
-            return start or end or self._get_default_keypoints()
-        
-        result = []
-        for i in range(min(len(start), len(end))):
-            result.append({
-                'x': start[i]['x'] + (end[i]['x'] - start[i]['x']) * progress,
-                'y': start[i]['y'] + (end[i]['y'] - start[i]['y']) * progress,
-                'z': start[i]['z'] + (end[i]['z'] - start[i]['z']) * progress
-            })
-        
-        return result
-    
-    def _apply_motion(self, keypoints: List[Dict], motion_type: str, 
-                      progress: float) -> List[Dict]:
-        """Apply motion modifications to keypoints"""
-        modified = [kp.copy() for kp in keypoints]
-        
-        if motion_type == 'wave':
-            wave = math.sin(progress * math.pi * 4) * 0.05
-            for kp in modified:
-                kp['x'] += wave
-                
-        elif motion_type == 'circular':
-            angle = progress * math.pi * 2
-            radius = 0.03
-            for kp in modified:
-                kp['x'] += math.cos(angle) * radius
-                kp['y'] += math.sin(angle) * radius
-                
-        elif motion_type == 'wiggling':
-            for i, kp in enumerate(modified):
-                wiggle = math.sin(progress * math.pi * 6 + i * 0.5) * 0.02
-                kp['x'] += wiggle
-                
-        elif motion_type == 'outward':
-            for kp in modified:
-                kp['y'] += progress * 0.1
-                
-        elif motion_type == 'downward':
-            for kp in modified:
-                kp['y'] += progress * 0.15
-                
-        elif motion_type == 'rising':
-            for kp in modified:
-                kp['y'] -= progress * 0.15
-                
-        elif motion_type == 'tapping':
-            tap = abs(math.sin(progress * math.pi * 4)) * 0.03
-            for kp in modified:
-                kp['y'] += tap
-                
-        elif motion_type == 'rocking':
-            rock = math.sin(progress * math.pi * 4) * 0.04
-            for kp in modified:
-                kp['y'] += rock
+            return default, default
+        
+        start = self._kp_to_array(keyframes[0].get('right_hand', default))
+        if len(keyframes) < 2:
+            return start, start
         
-        return modified
+        # Interpolate between first and last keyframe
+        end = self._kp_to_array(keyframes[-1].get('right_hand', start))
+        if not len(start) or not len(end):
+            start = end = start if len(start) else end if len(end) else default
+        
+        count = min(len(start), len(end))
+        return start[:count], end[:count]
+    
+    def _build_motion_offsets(self, motion_type: str, total_frames: int) -> np.ndarray:
+        """Build a read-only (total_frames, 21, 3) motion offset tensor for a sign"""
+        eased = self._ease_in_out_vec(np.arange(total_frames) / max(total_frames - 1, 1))
+        offsets = np.zeros((total_frames, len(self.landmark_names), 3))
+        self.motion_modifiers[motion_type](offsets, eased[:, None])
+        offsets.flags.writeable = False
+        return offsets
+    
+    def _motion_wave(self, arr: np.ndarray, progress):
+        """Side-to-side wave"""
+        arr[..., 0] += np.sin(progress * math.pi * 4) * 0.05
+    
+    def _motion_circular(self, arr: np.ndarray, progress):
+        """Small circle in the image plane"""
+        angle = progress * math.pi * 2
+        radius = 0.03
+        arr[..., 0] += np.cos(angle) * radius
+        arr[..., 1] += np.sin(angle) * radius
+    
+    def _motion_wiggling(self, arr: np.ndarray, progress):
+        """Per-landmark phase-shifted wiggle"""
+        phases = self._wiggle_phases[:arr.shape[-2]]
+        arr[..., 0] += np.sin(progress * math.pi * 6 + phases) * 0.02
+    
+    def _motion_outward(self, arr: np.ndarray, progress):
+        """Move away from the body"""
+        arr[..., 1] += progress * 0.1
+    
+    def _motion_downward(self, arr: np.ndarray, progress):
+        """Move downward"""
+        arr[..., 1] += progress * 0.15
+    
+    def _motion_rising(self, arr: np.ndarray, progress):
+        """Move upward"""
+        arr[..., 1] -= progress * 0.15
+    
+    def _motion_tapping(self, arr: np.ndarray, progress):
+        """Repeated short taps"""
+        arr[..., 1] += np.abs(np.sin(progress * math.pi * 4)) * 0.03
     
-    def _mirror_hand(self, keypoints: List[Dict]) -> List[Dict]:
+    def _motion_rocking(self, arr: np.ndarray, progress):
+        """Up-and-down rocking"""
+        arr[..., 1] += np.sin(progress * math.pi * 4) * 0.04
+    
+    def _mirror_hand(self, keypoints: np.ndarray) -> np.ndarray:
         """Mirror hand keypoints for left hand"""
-        if not keypoints:
+        if keypoints is None or not len(keypoints):
             return None
         
-        mirrored = []
-        for kp in keypoints:
-            mirrored.append({
-                'x': 1.0 - kp['x'],  # Mirror horizontally
-                'y': kp['y'],
-                'z': kp['z']
-            })
-        
-        return mirrored
+        return _mirror(np.asarray(keypoints, dtype=float))  # Mirror horizontally
     
-    def _get_default_keypoints(self) -> List[Dict]:
+    def _get_default_keypoints(self) -> np.ndarray:
         """Get default relaxed hand keypoints"""
-        return self.sign_db._create_base_hand(0.5, 0.5)
+        return self._default_keypoints
     
     def _get_facial_data(self, expression: str, progress: float) -> Dict:
-        """Get facial expression data for rendering"""
-        expressions = {
-            'neutral': {
-                'eyebrows': 0,
-                'eye_openness': 1.0,
-                'mouth_curve': 0,
-                'mouth_openness': 0
-            },
-            'smile': {
-                'eyebrows': 0.1,
-                'eye_openness': 0.9,
-                'mouth_curve': 0.5,
-                'mouth_openness': 0.1
-            },
-            'sad': {
-                'eyebrows': -0.3,
-                'eye_openness': 0.8,
-                'mouth_curve': -0.4,
-                'mouth_openness': 0
-            },
-            'question': {
-                'eyebrows': 0.4,
-                'eye_openness': 1.1,
-                'mouth_curve': 0,
-                'mouth_openness': 0.2
-            },
-            'calm': {
-                'eyebrows': 0,
-                'eye_openness': 0.7,
-                'mouth_curve': 0.1,
-                'mouth_openness': 0
-            },
-            'frown': {
-                'eyebrows': -0.4,
-                'eye_openness': 0.9,
-                'mouth_curve': -0.3,
-                'mouth_openness': 0
-            },
-            'intense': {
-                'eyebrows': 0.3,
-                'eye_openness': 1.2,
-                'mouth_curve': 0,
-                'mouth_openness': 0.3
-            }
-        }
-        
-        expr_data = expressions.get(expression, expressions['neutral'])
-        
-        # Add subtle animation
-        blink = 1.0 if progress % 0.3 > 0.05 else 0.2
-        expr_data = expr_data.copy()
-        expr_data['eye_openness'] *= blink
+        """Get facial expression data for rendering (shared, read-only)"""
+        # Add subtle animation: eyes are either open or mid-blink
+        return self._facial_quantized(expression, progress % 0.3 > 0.05)
+    
+    def _build_facial_data(self, expression: str, eyes_open: bool) -> Dict:
+        """Build facial expression data for one blink state"""
+        base = _EXPRESSIONS.get(expression, _EXPRESSIONS['neutral'])
+        blink = 1.0 if eyes_open else 0.2
         
-        return expr_data
+        return {
+            'eyebrows': base['eyebrows'],
+            'eye_openness': base['eye_openness'] * blink,
+            'mouth_curve': base['mouth_curve'],
+            'mouth_openness': base['mouth_openness']
+        }
     
     def _get_body_pose(self, body_region: str, progress: float) -> Dict:
-        """Get body pose data for rendering"""
-        poses = {
-            'neutral': {'head_tilt': 0, 'shoulder_offset': 0},
-            'head': {'head_tilt': 5, 'shoulder_offset': 0},
-            'face': {'head_tilt': 0, 'shoulder_offset': 0},
-            'forehead': {'head_tilt': -5, 'shoulder_offset': 0},
-            'chin': {'head_tilt': 10, 'shoulder_offset': 0},
-            'chest': {'head_tilt': 0, 'shoulder_offset': 0},
-            'ear': {'head_tilt': 0, 'shoulder_offset': 5},
-            'ears': {'head_tilt': 0, 'shoulder_offset': 5},
-            'temple': {'head_tilt': -3, 'shoulder_offset': 3},
-            'eyes': {'head_tilt': -5, 'shoulder_offset': 0},
-            'nose': {'head_tilt': 0, 'shoulder_offset': 0},
-            'mouth': {'head_tilt': 5, 'shoulder_offset': 0},
-            'lips': {'head_tilt': 5, 'shoulder_offset': 0},
-            'cheek': {'head_tilt': 0, 'shoulder_offset': 3},
-            'thigh': {'head_tilt': 15, 'shoulder_offset': 0}
-        }
-        
-        pose = poses.get(body_region, poses['neutral'])
-        
-        # Add subtle breathing animation
-        breathing = math.sin(progress * math.pi * 2) * 0.5
-        pose = pose.copy()
-        pose['shoulder_offset'] += breathing
-        
-        return pose
+        """Get body pose data for rendering (shared, read-only)"""
+        # Add subtle breathing animation, quantized below the visible threshold
+        breathing = round(math.sin(progress * math.pi * 2) * 0.5, 2)
+        return self._body_pose_quantized(body_region, breathing)
+    
+    def _build_body_pose(self, body_region: str, breathing: float) -> Dict:
+        """Build body pose data for one breathing offset"""
+        head_tilt, shoulder_offset = _POSES.get(body_region, _POSES['neutral'])
+        return {'head_tilt': head_tilt, 'shoulder_offset': shoulder_offset + breathing}
     
     def _ease_in_out(self, t: float) -> float:
         """Smooth easing function"""
@@ -361,11 +388,19 @@ class AvatarRenderer:
         else:
             return 1 - pow(-2 * t + 2, 2) / 2
     
+    def _ease_in_out_vec(self, t: np.ndarray) -> np.ndarray:
+        """Vectorized _ease_in_out over an array of progress values"""
+        return np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+    
     def get_sign_render_data(self, sign: str) -> Dict:
         """Get complete render data for a single sign"""
-        if sign not in self.class_labels:
+        if sign not in self._class_labels_set:
             return {'error': f'Sign "{sign}" not found'}
         
+        return self._build_sign_render_data(sign)
+    
+    def _build_sign_render_data(self, sign: str) -> Dict:
+        """Assemble render data for a known sign (fresh dicts on every call)"""
         sign_data = self.sign_db.get_sign(sign)
         keypoints = self.sign_db.get_keypoints(sign)
         
@@ -382,9 +417,16 @@ class AvatarRenderer:
         """
         Render complete animation data for a sequence of ISL signs
         Uses animation generator for full keyframe interpolation
+        
+        Results are memoized per sign sequence; the frames and schedule are
+        shared between calls and must be treated as read-only.
         """
+        return {**self._render_cached(tuple(isl_signs)), 'signs': isl_signs}
+    
+    def _render_full_uncached(self, isl_signs: Tuple[str, ...]) -> Dict:
+        """Run the full animation pipeline for a sign sequence"""
         # Generate animation sequence with full interpolation
-        animation_data = self.anim_gen.generate_animation_sequence(isl_signs)
+        animation_data = self.anim_gen.generate_animation_sequence(list(isl_signs))
         
         # Convert to render frames
         render_frames = []
@@ -397,6 +439,7 @@ class AvatarRenderer:
             'total_duration': animation_data.get('total_duration', 0),
             'frames': render_frames,
             'schedule': animation_data.get('schedule', []),
+            'connections': FINGER_CONNECTIONS,
             'config': self.config
         }
     
@@ -409,14 +452,8 @@ class AvatarRenderer:
             'timestamp': frame.get('timestamp', 0),
             'progress': frame.get('progress', 0),
             
-            'right_hand': {
-                'keypoints': frame.get('right_hand', []),
-                'connections': self.finger_connections
-            },
-            'left_hand': {
-                'keypoints': frame.get('left_hand'),
-                'connections': self.finger_connections
-            } if frame.get('left_hand') else None,
+            'right_hand': self._serialize_keypoints(frame.get('right_hand', [])),
+            'left_hand': self._serialize_keypoints(frame.get('left_hand')) if frame.get('left_hand') else None,
             
             'facial_expression': frame.get('facial_expression', {}),
             'body_pose': frame.get('body_posture', {}),
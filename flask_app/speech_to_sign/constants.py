@@ -0,0 +1,26 @@
+"""
+Shared constants for the Speech-to-Sign modules
+"""
+
+from types import MappingProxyType
+
+# Class labels from app.py - every sign the system can produce
+CLASS_LABELS = (
+    '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
+    'A', 'Alright', 'Animal', 'B', 'Beautiful', 'Bed', 'Bedroom', 'Bird', 'Black', 'Blind',
+    'C', 'Cat', 'Chair', 'Colour', 'Cow', 'D', 'Daughter', 'Deaf', 'Dog', 'Door', 'Dream',
+    'E', 'F', 'Father', 'Fish', 'Friday', 'G', 'Good Morning', 'Good night', 'Grey',
+    'H', 'Happy', 'He', 'Hello', 'Horse', 'How are you', 'I', 'It',
+    'J', 'K', 'L', 'Loud', 'M', 'Monday', 'Mother', 'Mouse',
+    'N', 'O', 'Orange', 'P', 'Parent', 'Pink', 'Pleased',
+    'Q', 'Quiet', 'R', 'S', 'Sad', 'Saturday', 'She', 'Son', 'Sunday',
+    'T', 'Table', 'Thank you', 'Thursday', 'Today', 'Tuesday',
+    'U', 'Ugly', 'V', 'W', 'Wednesday', 'White', 'Window',
+    'X', 'Y', 'You', 'Z'
+)
+
+# Lookup set for validation
+CLASS_LABELS_SET = frozenset(CLASS_LABELS)
+
+# Position of each label in CLASS_LABELS (model output index)
+CLASS_LABEL_INDEX = MappingProxyType({label: i for i, label in enumerate(CLASS_LABELS)})
@@ -4,10 +4,60 @@ Integrates with NLP Processor for proper text processing
 Following the architecture in Figure 3.4
 """
 
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
+from .constants import CLASS_LABELS, CLASS_LABELS_SET
 from .nlp_processor import NLPProcessor, nlp_processor
 from .sign_database import ISLDatabase, isl_database
 
+# Hand position per sign type (everything else is a gesture)
+_HAND_POSITIONS = MappingProxyType({'letter': 'fingerspelling', 'number': 'numbers'})
+
+# Durations (ms) fixed by sign type; words depend on their motion instead
+_FIXED_DURATIONS = MappingProxyType({'letter': 800, 'number': 1000, 'phrase': 2000})
+
+# Motion types that need a longer word duration
+_DYNAMIC = frozenset({'circular', 'wave', 'alternating'})
+
+# Non-neutral facial expressions
+_EXPRESSIVE_SIGNS = {
+    **dict.fromkeys(['Happy', 'Beautiful', 'Pleased', 'Hello', 'Good Morning',
+                     'Alright', 'Thank you'], 'smile'),
+    'Sad': 'sad',
+    'Ugly': 'frown',
+    'How are you': 'question',
+    'Loud': 'intense',
+    **dict.fromkeys(['Quiet', 'Good night', 'Dream'], 'calm')
+}
+
+# Facial expression for every class label
+_SIGN_TO_EXPRESSION = MappingProxyType(
+    {sign: _EXPRESSIVE_SIGNS.get(sign, 'neutral') for sign in CLASS_LABELS}
+)
+
+
+def _sign_type(sign: str) -> str:
+    """Classify a sign name as letter, number, phrase or word"""
+    if len(sign) == 1 and sign.isalpha():
+        return 'letter'
+    elif sign.isdigit() or (len(sign) == 1 and sign in '0123456789'):
+        return 'number'
+    elif ' ' in sign:  # Multi-word phrases
+        return 'phrase'
+    else:
+        return 'word'
+
+
+def _derive_sign_meta(sign: str) -> Tuple[str, str, Optional[int]]:
+    """Derive (type, hand_position, fixed_duration) for a sign name"""
+    sign_type = _sign_type(sign)
+    return (sign_type, _HAND_POSITIONS.get(sign_type, 'gesture'),
+            _FIXED_DURATIONS.get(sign_type))
+
+
+# (type, hand_position, fixed_duration) for every label, shared by all mappers
+_SIGN_META = MappingProxyType({sign: _derive_sign_meta(sign) for sign in CLASS_LABELS})
+
 
 class ISLMapper:
     """
@@ -19,27 +69,20 @@ class ISLMapper:
     3. ISL Grammar Reordering (Time + Subject + Object structure)
     """
     
+    __slots__ = ('nlp', 'sign_db', 'class_labels', 'class_labels_set', '_sign_meta')
+    
     def __init__(self, nlp: NLPProcessor = None, sign_db: ISLDatabase = None):
         self.nlp = nlp or nlp_processor
         self.sign_db = sign_db or isl_database
         
-        # Class labels from app.py
-        self.class_labels = [
-            '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-            'A', 'Alright', 'Animal', 'B', 'Beautiful', 'Bed', 'Bedroom', 'Bird', 'Black', 'Blind',
-            'C', 'Cat', 'Chair', 'Colour', 'Cow', 'D', 'Daughter', 'Deaf', 'Dog', 'Door', 'Dream',
-            'E', 'F', 'Father', 'Fish', 'Friday', 'G', 'Good Morning', 'Good night', 'Grey',
-            'H', 'Happy', 'He', 'Hello', 'Horse', 'How are you', 'I', 'It',
-            'J', 'K', 'L', 'Loud', 'M', 'Monday', 'Mother', 'Mouse',
-            'N', 'O', 'Orange', 'P', 'Parent', 'Pink', 'Pleased',
-            'Q', 'Quiet', 'R', 'S', 'Sad', 'Saturday', 'She', 'Son', 'Sunday',
-            'T', 'Table', 'Thank you', 'Thursday', 'Today', 'Tuesday',
-            'U', 'Ugly', 'V', 'W', 'Wednesday', 'White', 'Window',
-            'X', 'Y', 'You', 'Z'
-        ]
+        # Class labels from app.py (shared, immutable)
+        self.class_labels = CLASS_LABELS
         
         # Create lookup set for validation
-        self.class_labels_set = set(self.class_labels)
+        self.class_labels_set = CLASS_LABELS_SET
+        
+        # (type, hand_position, fixed_duration) for every label, computed once
+        self._sign_meta = _SIGN_META
     
     def map_to_isl(self, text: str) -> List[str]:
         """
@@ -49,14 +92,19 @@ class ISLMapper:
         if not text or not text.strip():
             return []
         
-        # Use NLP processor for full pipeline
-        result = self.nlp.process(text)
-        isl_signs = result.get('isl_signs', [])
+        # NLPProcessor only emits class labels, so no re-validation is needed
+        return self.nlp.process(text)['isl_signs']
+    
+    def map_to_isl_batch(self, texts: List[str]) -> List[List[str]]:
+        """Convert many English texts to ISL sign sequences in one NLP batch"""
+        signs = [[] for _ in texts]
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
         
-        # Validate all signs are in class_labels
-        valid_signs = [sign for sign in isl_signs if sign in self.class_labels_set]
+        results = self.nlp.process_batch([texts[i] for i in pending])
+        for i, result in zip(pending, results):
+            signs[i] = result['isl_signs']
         
-        return valid_signs
+        return signs
     
     def get_processing_details(self, text: str) -> Dict:
         """
@@ -65,9 +113,9 @@ class ISLMapper:
         """
         result = self.nlp.process(text)
         
-        # Add validation info
-        result['valid_signs'] = [s for s in result['isl_signs'] if s in self.class_labels_set]
-        result['invalid_signs'] = [s for s in result['isl_signs'] if s not in self.class_labels_set]
+        # Add validation info (every emitted sign is a class label)
+        result['valid_signs'] = list(result['isl_signs'])
+        result['invalid_signs'] = []
         
         return result
     
@@ -78,16 +126,21 @@ class ISLMapper:
         animations = []
         
         for sign in isl_signs:
-            if sign in self.class_labels_set:
+            meta = self._sign_meta.get(sign)
+            if meta is not None:
+                sign_type, hand_position, duration = meta
                 sign_data = self.sign_db.get_sign(sign)
+                motion = sign_data.get('motion_type', 'static')
+                if duration is None:
+                    duration = 1800 if motion in _DYNAMIC else 1500
                 
                 animations.append({
                     'sign': sign,
-                    'duration': self._get_sign_duration(sign, sign_data),
-                    'type': self._get_sign_type(sign),
-                    'hand_position': self._get_hand_position(sign),
+                    'duration': duration,
+                    'type': sign_type,
+                    'hand_position': hand_position,
                     'facial_expression': sign_data.get('facial_expression', 'neutral'),
-                    'motion_type': sign_data.get('motion_type', 'static'),
+                    'motion_type': motion,
                     'body_region': sign_data.get('body_region', 'neutral'),
                     'two_hands': sign_data.get('two_hands', False),
                     'keyframes': sign_data.get('keyframes', [])
@@ -95,73 +148,38 @@ class ISLMapper:
         
         return animations
     
+    def _get_meta(self, sign: str) -> Tuple[str, str, Optional[int]]:
+        """Look up precomputed sign metadata, deriving it for unknown names"""
+        meta = self._sign_meta.get(sign)
+        return meta if meta is not None else _derive_sign_meta(sign)
+    
     def _get_sign_duration(self, sign: str, sign_data: Dict) -> int:
         """Calculate appropriate duration for a sign"""
-        base_duration = 1500  # 1.5 seconds default
-        
-        sign_type = self._get_sign_type(sign)
-        if sign_type == 'letter':
-            return 800
-        elif sign_type == 'number':
-            return 1000
-        elif sign_type == 'phrase':
-            return 2000
+        duration = self._get_meta(sign)[2]
+        if duration is not None:
+            return duration
         
-        motion = sign_data.get('motion_type', 'static')
-        if motion in ['circular', 'wave', 'alternating']:
+        if sign_data.get('motion_type', 'static') in _DYNAMIC:
             return 1800
         
-        return base_duration
+        return 1500  # 1.5 seconds default
     
     def _get_sign_type(self, sign: str) -> str:
         """Determine the type of sign"""
-        if len(sign) == 1 and sign.isalpha():
-            return 'letter'
-        elif sign.isdigit() or (len(sign) == 1 and sign in '0123456789'):
-            return 'number'
-        elif ' ' in sign:  # Multi-word phrases
-            return 'phrase'
-        else:
-            return 'word'
+        return self._get_meta(sign)[0]
     
     def _get_hand_position(self, sign: str) -> str:
         """Get hand position type for a sign"""
-        sign_type = self._get_sign_type(sign)
-        
-        if sign_type == 'letter':
-            return 'fingerspelling'
-        elif sign_type == 'number':
-            return 'numbers'
-        else:
-            return 'gesture'
+        return self._get_meta(sign)[1]
     
     def _get_facial_expression(self, sign: str) -> str:
         """Get facial expression for a sign"""
-        # Map certain signs to expressions
-        expression_map = {
-            'Happy': 'smile',
-            'Beautiful': 'smile',
-            'Pleased': 'smile',
-            'Hello': 'smile',
-            'Good Morning': 'smile',
-            'Alright': 'smile',
-            'Thank you': 'smile',
-            'Sad': 'sad',
-            'Ugly': 'frown',
-            'Blind': 'neutral',
-            'Deaf': 'neutral',
-            'How are you': 'question',
-            'Loud': 'intense',
-            'Quiet': 'calm',
-            'Good night': 'calm',
-            'Dream': 'calm'
-        }
-        
-        return expression_map.get(sign, 'neutral')
+        # Every class label has an entry; only unknown names use the default
+        return _SIGN_TO_EXPRESSION.get(sign, 'neutral')
     
     def get_available_signs(self) -> List[str]:
         """Return list of all available signs (class_labels)"""
-        return self.class_labels.copy()
+        return list(CLASS_LABELS)
     
     def is_valid_sign(self, sign: str) -> bool:
         """Check if a sign exists in class_labels"""
@@ -6,40 +6,290 @@ Following the architecture in Figure 3.4
 
 import re
 import string
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Tuple
+import numpy as np
+from .constants import CLASS_LABELS, CLASS_LABELS_SET
 
 # Try to import NLTK, fallback to simple processing if not available
 try:
     import nltk
-    from nltk.tokenize import word_tokenize
     from nltk.stem import WordNetLemmatizer
     from nltk.corpus import stopwords
-    
-    # Download required NLTK data
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt', quiet=True)
-    
-    try:
-        nltk.data.find('corpora/wordnet')
-    except LookupError:
-        nltk.download('wordnet', quiet=True)
-        
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords', quiet=True)
-    
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-    
     NLTK_AVAILABLE = True
 except ImportError:
     NLTK_AVAILABLE = False
 
+# NLTK data packages, checked (and downloaded if missing) on first use
+_NLTK_DATA = (
+    ('corpora/wordnet', 'wordnet'),
+    ('corpora/stopwords', 'stopwords'),
+    ('taggers/averaged_perceptron_tagger', 'averaged_perceptron_tagger'),
+    ('taggers/averaged_perceptron_tagger_eng', 'averaged_perceptron_tagger_eng')
+)
+_nltk_lock = threading.Lock()
+_nltk_ready = False
+
+
+def _ensure_nltk():
+    """Make sure the NLTK data packages are present (downloads once per process, on first use)"""
+    global _nltk_ready
+    if _nltk_ready or not NLTK_AVAILABLE:
+        return
+    
+    with _nltk_lock:
+        if _nltk_ready:
+            return
+        for path, package in _NLTK_DATA:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                nltk.download(package, quiet=True)
+        _nltk_ready = True
+
+
+# Try to import spaCy (tokenization + lemmatization in one Cython pass);
+# NLTK / plain splitting is used when it or its English model is missing
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _spacy_pipeline():
+    """The spaCy English pipeline, loaded on first use (None without spaCy or its model)"""
+    if not SPACY_AVAILABLE:
+        return None
+    try:
+        # Only the tagger, attribute ruler and lemmatizer are needed for lemmas
+        return spacy.load('en_core_web_sm', disable=['ner', 'parser'])
+    except OSError:
+        return None
+
+
+# Try to import pyahocorasick for single-pass multi-phrase matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Try to import Numba for the compiled fingerspelling filter
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Tokens at least this long are fingerspelled by the Numba kernel, where the
+# dispatch overhead is amortized (shorter ones use str.translate)
+_NUMBA_SPELL_MIN_LEN = 8
+
+# Single-character signs (letters and digits) usable for fingerspelling
+_SPELLABLE = frozenset(label for label in CLASS_LABELS if len(label) == 1)
+
+# ASCII characters that cannot be fingerspelled, deleted via str.translate
+_SPELL_DELETE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if chr(code) not in _SPELLABLE
+))
+
+# ASCII code -> True for characters with a single-character sign
+_SPELL_MASK = np.zeros(128, dtype=np.bool_)
+_SPELL_MASK[[ord(label) for label in _SPELLABLE if label.isascii()]] = True
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fingerspell_ascii(buf, valid_mask):
+        """Keep the bytes of buf that valid_mask marks as spellable"""
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        count = 0
+        for i in range(buf.shape[0]):
+            if valid_mask[buf[i]]:
+                out[count] = buf[i]
+                count += 1
+        return out[:count]
+
+# Anything that is not a word character or whitespace is treated as a separator
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Word to sign tables, split by token shape so the common single-character
+# (fingerspelled) case probes a small dict
+_LETTERS = MappingProxyType({letter: letter.upper() for letter in string.ascii_lowercase})
+
+_DIGITS = MappingProxyType({
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
+    'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9',
+    **{digit: digit for digit in string.digits}
+})
+
+_WORDS = MappingProxyType({
+    # Greetings/Expressions
+    'hello': 'Hello', 'hi': 'Hello', 'hey': 'Hello',
+    'thank': 'Thank you', 'thanks': 'Thank you',
+    'happy': 'Happy', 'happiness': 'Happy', 'happily': 'Happy',
+    'sad': 'Sad', 'sadness': 'Sad', 'sadly': 'Sad',
+    'beautiful': 'Beautiful', 'beauty': 'Beautiful', 'pretty': 'Beautiful',
+    'ugly': 'Ugly', 'ugliness': 'Ugly',
+    'alright': 'Alright', 'okay': 'Alright', 'ok': 'Alright', 'fine': 'Alright',
+    'please': 'Pleased', 'pleased': 'Pleased', 'pleasure': 'Pleased',
+
+    # Animals - including singular/plural/lemmatized forms
+    'animal': 'Animal', 'animals': 'Animal',
+    'bird': 'Bird', 'birds': 'Bird',
+    'cat': 'Cat', 'cats': 'Cat', 'kitten': 'Cat', 'kitty': 'Cat',
+    'dog': 'Dog', 'dogs': 'Dog', 'puppy': 'Dog', 'puppies': 'Dog',
+    'cow': 'Cow', 'cows': 'Cow', 'cattle': 'Cow',
+    'horse': 'Horse', 'horses': 'Horse', 'pony': 'Horse',
+    'mouse': 'Mouse', 'mice': 'Mouse', 'rat': 'Mouse',
+    'fish': 'Fish', 'fishes': 'Fish', 'fishing': 'Fish',
+
+    # Family - including variations
+    'mother': 'Mother', 'mom': 'Mother', 'mum': 'Mother', 'mommy': 'Mother', 'mama': 'Mother',
+    'father': 'Father', 'dad': 'Father', 'daddy': 'Father', 'papa': 'Father',
+    'daughter': 'Daughter', 'daughters': 'Daughter',
+    'son': 'Son', 'sons': 'Son',
+    'parent': 'Parent', 'parents': 'Parent',
+
+    # Furniture/Objects
+    'chair': 'Chair', 'chairs': 'Chair', 'seat': 'Chair',
+    'table': 'Table', 'tables': 'Table', 'desk': 'Table',
+    'bed': 'Bed', 'beds': 'Bed', 'sleeping': 'Bed',
+    'bedroom': 'Bedroom', 'bedrooms': 'Bedroom', 'room': 'Bedroom',
+    'door': 'Door', 'doors': 'Door', 'doorway': 'Door',
+    'window': 'Window', 'windows': 'Window',
+
+    # Colors
+    'black': 'Black', 'dark': 'Black',
+    'white': 'White', 'light': 'White',
+    'orange': 'Orange',
+    'pink': 'Pink',
+    'grey': 'Grey', 'gray': 'Grey',
+    'colour': 'Colour', 'color': 'Colour', 'colors': 'Colour', 'colours': 'Colour',
+
+    # Days
+    'monday': 'Monday', 'mon': 'Monday',
+    'tuesday': 'Tuesday', 'tue': 'Tuesday', 'tues': 'Tuesday',
+    'wednesday': 'Wednesday', 'wed': 'Wednesday',
+    'thursday': 'Thursday', 'thu': 'Thursday', 'thurs': 'Thursday',
+    'friday': 'Friday', 'fri': 'Friday',
+    'saturday': 'Saturday', 'sat': 'Saturday',
+    'sunday': 'Sunday', 'sun': 'Sunday',
+    'today': 'Today',
+
+    # Pronouns
+    'i': 'I', 'me': 'I', 'my': 'I', 'myself': 'I',
+    'you': 'You', 'your': 'You', 'yours': 'You', 'yourself': 'You',
+    'he': 'He', 'him': 'He', 'his': 'He', 'himself': 'He',
+    'she': 'She', 'her': 'She', 'hers': 'She', 'herself': 'She',
+    'it': 'It', 'its': 'It', 'itself': 'It',
+
+    # Other words
+    'blind': 'Blind', 'blindness': 'Blind',
+    'deaf': 'Deaf', 'deafness': 'Deaf',
+    'dream': 'Dream', 'dreams': 'Dream', 'dreaming': 'Dream', 'dreamt': 'Dream',
+    'loud': 'Loud', 'loudly': 'Loud', 'loudness': 'Loud', 'noisy': 'Loud',
+    'quiet': 'Quiet', 'quietly': 'Quiet', 'silence': 'Quiet', 'silent': 'Quiet',
+
+    # Time greetings
+    'morning': 'Good Morning',
+    'night': 'Good night', 'goodnight': 'Good night'
+})
+
+# Multi-word phrases to detect (check these before tokenization)
+_PHRASES = MappingProxyType({
+    'how are you': 'How are you',
+    'good morning': 'Good Morning',
+    'good night': 'Good night',
+    'thank you': 'Thank you'
+})
+
+# Words to keep even if they are stopwords (because we have signs for them)
+_KEEP_WORDS = frozenset({
+    'i', 'you', 'he', 'she', 'it', 'how', 'are',
+    'good', 'morning', 'night', 'today'
+})
+
+# Time expressions are moved to the front of the ISL sequence
+_TIME_SIGNS = frozenset({
+    'Today', 'Monday', 'Tuesday', 'Wednesday',
+    'Thursday', 'Friday', 'Saturday', 'Sunday'
+})
+
+# Pronoun signs that may repeat within one sequence
+_REPEATABLE_SIGNS = frozenset({'I', 'You', 'He', 'She', 'It'})
+
+# Basic stopwords list if NLTK not available
+_BASIC_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
+    'from', 'as', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'what', 'which',
+    'who', 'whom', 'this', 'that', 'these', 'those', 'am', 'and', 'but',
+    'if', 'or', 'because', 'until', 'while', 'very', 'just', 'only',
+    'own', 'same', 'so', 'than', 'too', 'also', 'such', 'no', 'not',
+    'both', 'each', 'few', 'more', 'most', 'other', 'some', 'any', 'all'
+})
+
+# Shared tables every NLPProcessor references instead of rebuilding. All
+# word and phrase targets are class labels, so emitted signs never need
+# re-validating downstream
+_WORD_TO_SIGN = MappingProxyType({**_DIGITS, **_LETTERS, **_WORDS})
+assert set(_WORD_TO_SIGN.values()) <= CLASS_LABELS_SET
+assert set(_PHRASES.values()) <= CLASS_LABELS_SET
+
+_STOP_WORDS = _BASIC_STOPWORDS - _KEEP_WORDS
+# Stopwords we have no sign for: the only words remove_stopwords drops
+_EFFECTIVE_STOPWORDS = _STOP_WORDS - _WORD_TO_SIGN.keys()
+
+# Longest phrases first so the alternation prefers the longest match
+_PHRASE_ORDER = tuple(sorted(_PHRASES, key=len, reverse=True))
+_PHRASE_RE = re.compile('|'.join(re.escape(p) for p in _PHRASE_ORDER))
+
+# Aho-Corasick automaton over all phrases (regex alternation otherwise)
+_PHRASE_AC = None
+if AHOCORASICK_AVAILABLE:
+    _PHRASE_AC = ahocorasick.Automaton()
+    for _phrase in _PHRASES:
+        _PHRASE_AC.add_word(_phrase, (len(_phrase), _phrase))
+    _PHRASE_AC.make_automaton()
+
+# Penn Treebank tag prefix to WordNet part of speech (nouns otherwise)
+_WORDNET_POS = {'N': 'n', 'V': 'v', 'J': 'a', 'R': 'r'}
+
+# Immutable (hashable, cacheable) form of a process() result
+ProcessResult = namedtuple('ProcessResult', [
+    'original_text', 'preprocessed', 'phrases_detected', 'tokens',
+    'lemmatized', 'filtered', 'isl_signs'
+])
+
+
+@lru_cache(maxsize=4096)
+def _preprocess(text: str) -> str:
+    """Lowercase, turn punctuation into spaces and collapse whitespace"""
+    return _WS_RE.sub(' ', _PUNCT_RE.sub(' ', text.lower())).strip()
+
+
+@lru_cache(maxsize=1)
+def _nltk_stopword_sets() -> Tuple[frozenset, frozenset]:
+    """NLTK's English stopwords as (stop_words, effective_stopwords), loaded once"""
+    stop_words = frozenset(stopwords.words('english')) - _KEEP_WORDS
+    return stop_words, stop_words - _WORD_TO_SIGN.keys()
+
+
+def _wordnet_pos(tag: str) -> str:
+    """Map a Penn Treebank tag to the WordNet POS used for lemmatization"""
+    return _WORDNET_POS.get(tag[:1], 'n')
+
 
 class NLPProcessor:
     """
@@ -47,155 +297,50 @@ class NLPProcessor:
     Text Preprocessing → Word Tokenization → Lemmatization → Stop-word Removal
     """
     
+    __slots__ = (
+        'class_labels', '_class_labels_set', '_spellable', '_spell_delete',
+        'time_signs', 'lemmatizer', '_nltk_loaded', 'keep_words', 'stop_words',
+        'phrases', '_phrase_order', '_phrase_re', '_phrase_ac', '_process_cached',
+        'word_to_sign', '_effective_stopwords'
+    )
+    
     def __init__(self):
-        # Class labels from app.py - signs we can produce
-        self.class_labels = [
-            '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-            'A', 'Alright', 'Animal', 'B', 'Beautiful', 'Bed', 'Bedroom', 'Bird', 'Black', 'Blind',
-            'C', 'Cat', 'Chair', 'Colour', 'Cow', 'D', 'Daughter', 'Deaf', 'Dog', 'Door', 'Dream',
-            'E', 'F', 'Father', 'Fish', 'Friday', 'G', 'Good Morning', 'Good night', 'Grey',
-            'H', 'Happy', 'He', 'Hello', 'Horse', 'How are you', 'I', 'It',
-            'J', 'K', 'L', 'Loud', 'M', 'Monday', 'Mother', 'Mouse',
-            'N', 'O', 'Orange', 'P', 'Parent', 'Pink', 'Pleased',
-            'Q', 'Quiet', 'R', 'S', 'Sad', 'Saturday', 'Sunday', 'She', 'Son',
-            'T', 'Table', 'Thank you', 'Thursday', 'Today', 'Tuesday',
-            'U', 'Ugly', 'V', 'W', 'Wednesday', 'White', 'Window',
-            'X', 'Y', 'You', 'Z'
-        ]
+        # Everything but the result cache and NLTK state is a shared,
+        # immutable module-level table (see above)
+        self.class_labels = CLASS_LABELS
+        self._class_labels_set = CLASS_LABELS_SET
+        self._spellable = _SPELLABLE
+        self._spell_delete = _SPELL_DELETE
+        self.time_signs = _TIME_SIGNS
+        self.keep_words = _KEEP_WORDS
+        self.stop_words = _STOP_WORDS
+        self.phrases = _PHRASES
+        self._phrase_order = _PHRASE_ORDER
+        self._phrase_re = _PHRASE_RE
+        self._phrase_ac = _PHRASE_AC
+        self.word_to_sign = _WORD_TO_SIGN
+        self._effective_stopwords = _EFFECTIVE_STOPWORDS
         
-        # Initialize NLTK components if available
-        if NLTK_AVAILABLE:
-            self.lemmatizer = WordNetLemmatizer()
-            self.stop_words = set(stopwords.words('english'))
-        else:
-            self.lemmatizer = None
-            self.stop_words = self._get_basic_stopwords()
+        # NLTK components are loaded on first use (see _load_nltk)
+        self.lemmatizer = None
+        self._nltk_loaded = not NLTK_AVAILABLE
         
-        # Words to keep even if they are stopwords (because we have signs for them)
-        self.keep_words = {
-            'i', 'you', 'he', 'she', 'it', 'how', 'are',
-            'good', 'morning', 'night', 'today'
-        }
-        
-        # Remove these from stop_words since we have signs
-        self.stop_words = self.stop_words - self.keep_words
-        
-        # Multi-word phrases to detect (check these before tokenization)
-        self.phrases = {
-            'how are you': 'How are you',
-            'good morning': 'Good Morning', 
-            'good night': 'Good night',
-            'thank you': 'Thank you'
-        }
-        
-        # Word to sign mappings (including lemmatized forms)
-        self.word_to_sign = self._build_word_mappings()
+        # Repeated inputs (common greetings) skip the whole pipeline
+        self._process_cached = lru_cache(maxsize=2048)(self._process_uncached)
     
-    def _get_basic_stopwords(self) -> set:
-        """Basic stopwords list if NLTK not available"""
-        return {
-            'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-            'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
-            'from', 'as', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'between', 'under', 'again', 'further', 'then',
-            'once', 'here', 'there', 'when', 'where', 'why', 'what', 'which',
-            'who', 'whom', 'this', 'that', 'these', 'those', 'am', 'and', 'but',
-            'if', 'or', 'because', 'until', 'while', 'very', 'just', 'only',
-            'own', 'same', 'so', 'than', 'too', 'also', 'such', 'no', 'not',
-            'both', 'each', 'few', 'more', 'most', 'other', 'some', 'any', 'all'
-        }
-    
-    def _build_word_mappings(self) -> dict:
-        """Build comprehensive word to sign mappings including lemmatized forms"""
-        mappings = {
-            # Numbers
-            'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
-            'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9',
-            '0': '0', '1': '1', '2': '2', '3': '3', '4': '4',
-            '5': '5', '6': '6', '7': '7', '8': '8', '9': '9',
-            
-            # Letters (lowercase to class label)
-            'a': 'A', 'b': 'B', 'c': 'C', 'd': 'D', 'e': 'E', 'f': 'F',
-            'g': 'G', 'h': 'H', 'i': 'I', 'j': 'J', 'k': 'K', 'l': 'L',
-            'm': 'M', 'n': 'N', 'o': 'O', 'p': 'P', 'q': 'Q', 'r': 'R',
-            's': 'S', 't': 'T', 'u': 'U', 'v': 'V', 'w': 'W', 'x': 'X',
-            'y': 'Y', 'z': 'Z',
-            
-            # Greetings/Expressions
-            'hello': 'Hello', 'hi': 'Hello', 'hey': 'Hello',
-            'thank': 'Thank you', 'thanks': 'Thank you',
-            'happy': 'Happy', 'happiness': 'Happy', 'happily': 'Happy',
-            'sad': 'Sad', 'sadness': 'Sad', 'sadly': 'Sad',
-            'beautiful': 'Beautiful', 'beauty': 'Beautiful', 'pretty': 'Beautiful',
-            'ugly': 'Ugly', 'ugliness': 'Ugly',
-            'alright': 'Alright', 'okay': 'Alright', 'ok': 'Alright', 'fine': 'Alright',
-            'please': 'Pleased', 'pleased': 'Pleased', 'pleasure': 'Pleased',
-            
-            # Animals - including singular/plural/lemmatized forms
-            'animal': 'Animal', 'animals': 'Animal',
-            'bird': 'Bird', 'birds': 'Bird',
-            'cat': 'Cat', 'cats': 'Cat', 'kitten': 'Cat', 'kitty': 'Cat',
-            'dog': 'Dog', 'dogs': 'Dog', 'puppy': 'Dog', 'puppies': 'Dog',
-            'cow': 'Cow', 'cows': 'Cow', 'cattle': 'Cow',
-            'horse': 'Horse', 'horses': 'Horse', 'pony': 'Horse',
-            'mouse': 'Mouse', 'mice': 'Mouse', 'rat': 'Mouse',
-            'fish': 'Fish', 'fishes': 'Fish', 'fishing': 'Fish',
-            
-            # Family - including variations
-            'mother': 'Mother', 'mom': 'Mother', 'mum': 'Mother', 'mommy': 'Mother', 'mama': 'Mother',
-            'father': 'Father', 'dad': 'Father', 'daddy': 'Father', 'papa': 'Father',
-            'daughter': 'Daughter', 'daughters': 'Daughter',
-            'son': 'Son', 'sons': 'Son',
-            'parent': 'Parent', 'parents': 'Parent',
-            
-            # Furniture/Objects
-            'chair': 'Chair', 'chairs': 'Chair', 'seat': 'Chair',
-            'table': 'Table', 'tables': 'Table', 'desk': 'Table',
-            'bed': 'Bed', 'beds': 'Bed', 'sleeping': 'Bed',
-            'bedroom': 'Bedroom', 'bedrooms': 'Bedroom', 'room': 'Bedroom',
-            'door': 'Door', 'doors': 'Door', 'doorway': 'Door',
-            'window': 'Window', 'windows': 'Window',
-            
-            # Colors
-            'black': 'Black', 'dark': 'Black',
-            'white': 'White', 'light': 'White',
-            'orange': 'Orange',
-            'pink': 'Pink',
-            'grey': 'Grey', 'gray': 'Grey',
-            'colour': 'Colour', 'color': 'Colour', 'colors': 'Colour', 'colours': 'Colour',
-            
-            # Days
-            'monday': 'Monday', 'mon': 'Monday',
-            'tuesday': 'Tuesday', 'tue': 'Tuesday', 'tues': 'Tuesday',
-            'wednesday': 'Wednesday', 'wed': 'Wednesday',
-            'thursday': 'Thursday', 'thu': 'Thursday', 'thurs': 'Thursday',
-            'friday': 'Friday', 'fri': 'Friday',
-            'saturday': 'Saturday', 'sat': 'Saturday',
-            'sunday': 'Sunday', 'sun': 'Sunday',
-            'today': 'Today',
-            
-            # Pronouns
-            'i': 'I', 'me': 'I', 'my': 'I', 'myself': 'I',
-            'you': 'You', 'your': 'You', 'yours': 'You', 'yourself': 'You',
-            'he': 'He', 'him': 'He', 'his': 'He', 'himself': 'He',
-            'she': 'She', 'her': 'She', 'hers': 'She', 'herself': 'She',
-            'it': 'It', 'its': 'It', 'itself': 'It',
-            
-            # Other words
-            'blind': 'Blind', 'blindness': 'Blind',
-            'deaf': 'Deaf', 'deafness': 'Deaf',
-            'dream': 'Dream', 'dreams': 'Dream', 'dreaming': 'Dream', 'dreamt': 'Dream',
-            'loud': 'Loud', 'loudly': 'Loud', 'loudness': 'Loud', 'noisy': 'Loud',
-            'quiet': 'Quiet', 'quietly': 'Quiet', 'silence': 'Quiet', 'silent': 'Quiet',
-            
-            # Time greetings
-            'morning': 'Good Morning',
-            'night': 'Good night', 'goodnight': 'Good night',
-        }
+    def _load_nltk(self):
+        """Swap in NLTK's lemmatizer and stopwords once its data is available"""
+        if self._nltk_loaded:
+            return
         
-        return mappings
+        _ensure_nltk()
+        try:
+            self.stop_words, self._effective_stopwords = _nltk_stopword_sets()
+            self.lemmatizer = WordNetLemmatizer()
+        except LookupError:
+            # Data could not be downloaded; keep the basic fallbacks
+            pass
+        self._nltk_loaded = True
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -204,53 +349,75 @@ class NLPProcessor:
         - Remove extra whitespace
         - Handle punctuation
         """
-        # Convert to lowercase
-        text = text.lower().strip()
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Keep letters, numbers, and spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = ' '.join(text.split())
-        
-        return text
+        # Lowercase, turn punctuation into spaces (keeping letters, numbers
+        # and spaces), then collapse whitespace
+        return _preprocess(text)
     
     def detect_phrases(self, text: str) -> Tuple[List[str], str]:
         """
         Detect multi-word phrases before tokenization
         Returns: (detected_phrases, remaining_text)
         """
-        detected = []
-        remaining = text.lower()
+        text = text.lower()
         
-        # Sort phrases by length (longest first) to match longest phrases first
-        sorted_phrases = sorted(self.phrases.keys(), key=len, reverse=True)
-        
-        for phrase in sorted_phrases:
-            if phrase in remaining:
-                detected.append(self.phrases[phrase])
-                remaining = remaining.replace(phrase, ' ')
+        if self._phrase_ac is None:
+            found = set()
+            
+            def _blank(match):
+                found.add(match.group())
+                return ' '
+            
+            # Regex union: one sub both collects and blanks out every match
+            remaining = self._phrase_re.sub(_blank, text)
+            # Each phrase is reported once, longest first
+            detected = [self.phrases[phrase] for phrase in self._phrase_order if phrase in found]
+        else:
+            spans = self._find_phrase_spans(text)
+            found = {phrase for _, _, phrase in spans}
+            detected = [self.phrases[phrase] for phrase in self._phrase_order if phrase in found]
+            
+            # Blank out the matched spans in a single pass
+            pieces = []
+            position = 0
+            for start, end, _ in spans:
+                pieces.append(text[position:start])
+                position = end
+            pieces.append(text[position:])
+            remaining = ' '.join(pieces)
         
         # Clean up remaining text
-        remaining = ' '.join(remaining.split())
+        remaining = _WS_RE.sub(' ', remaining).strip()
         
         return detected, remaining
     
+    def _find_phrase_spans(self, text: str) -> List[Tuple[int, int, str]]:
+        """Find leftmost-longest, non-overlapping Aho-Corasick matches as (start, end, phrase)"""
+        # Among hits starting at the same place the longest comes first, so
+        # skipping overlaps keeps it and drops the shorter ones
+        hits = sorted(
+            ((end - length + 1, end + 1, phrase)
+             for end, (length, phrase) in self._phrase_ac.iter(text)),
+            key=lambda hit: (hit[0], -hit[1])
+        )
+        
+        spans = []
+        last_end = 0
+        for start, end, phrase in hits:
+            if start < last_end:
+                continue
+            spans.append((start, end, phrase))
+            last_end = end
+        
+        return spans
+    
     def tokenize(self, text: str) -> List[str]:
         """
         Step 2: Word Tokenization
         Split text into individual word tokens
         """
-        if NLTK_AVAILABLE:
-            try:
-                tokens = word_tokenize(text)
-            except:
-                tokens = text.split()
-        else:
-            tokens = text.split()
-        
-        return tokens
+        # Preprocessing already removed punctuation, so whitespace splitting
+        # gives the same tokens as NLTK's Punkt/Treebank tokenizer
+        return text.split()
     
     def lemmatize(self, tokens: List[str]) -> List[str]:
         """
@@ -258,9 +425,24 @@ class NLPProcessor:
         Reduce words to their base/root form
         E.g., 'running' -> 'run', 'cats' -> 'cat'
         """
-        if not NLTK_AVAILABLE or self.lemmatizer is None:
+        self._load_nltk()
+        if self.lemmatizer is None:
             return tokens
         
+        # Tag once and lemmatize each token with its own part of speech
+        try:
+            tagged = nltk.pos_tag(tokens)
+        except LookupError:
+            return self._lemmatize_untagged(tokens)
+        
+        try:
+            return [self.lemmatizer.lemmatize(token, pos=_wordnet_pos(tag)) for token, tag in tagged]
+        except LookupError:
+            # Tagger data is present but WordNet is not; keep the tokens as spoken
+            return tokens
+    
+    def _lemmatize_untagged(self, tokens: List[str]) -> List[str]:
+        """Lemmatization without tagger data: try noun, then verb, then adjective"""
         lemmatized = []
         for token in tokens:
             try:
@@ -273,24 +455,42 @@ class NLPProcessor:
                 if lemma == token:
                     lemma = self.lemmatizer.lemmatize(token, pos='a')
                 lemmatized.append(lemma)
-            except:
+            except LookupError:
                 lemmatized.append(token)
         
         return lemmatized
     
+    def _tokenize_and_lemmatize(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Steps 2 + 3 fused: spaCy tokenization and POS-aware lemmatization
+        Returns: (tokens, lemmas)
+        """
+        return self._doc_tokens_and_lemmas(_spacy_pipeline()(text))
+    
+    def _doc_tokens_and_lemmas(self, doc) -> Tuple[List[str], List[str]]:
+        """Collect (tokens, lemmas) from a processed spaCy Doc"""
+        tokens = []
+        lemmas = []
+        for token in doc:
+            if token.is_space:
+                continue
+            lemma = token.lemma_.lower()
+            # spaCy 2.x lemmatizes pronouns to a placeholder
+            if lemma == '-pron-':
+                lemma = token.lower_
+            tokens.append(token.text)
+            lemmas.append(lemma)
+        
+        return tokens, lemmas
+    
     def remove_stopwords(self, tokens: List[str]) -> List[str]:
         """
         Step 4: Stop-word Removal
         Remove common words that don't carry meaning
         But keep words we have signs for
         """
-        filtered = []
-        for token in tokens:
-            # Keep if not a stopword OR if we have a sign for it
-            if token not in self.stop_words or token in self.word_to_sign:
-                filtered.append(token)
-        
-        return filtered
+        # Stopwords that have a sign were excluded from the set at init
+        return [token for token in tokens if token not in self._effective_stopwords]
     
     def map_to_signs(self, tokens: List[str]) -> List[str]:
         """
@@ -300,23 +500,33 @@ class NLPProcessor:
         signs = []
         
         for token in tokens:
-            if token in self.word_to_sign:
-                sign = self.word_to_sign[token]
+            # Single characters only ever need the letter and digit tables
+            if len(token) == 1:
+                sign = _LETTERS.get(token) or _DIGITS.get(token)
+            else:
+                sign = _WORDS.get(token) or _DIGITS.get(token)
+            
+            if sign is not None:
                 if sign not in signs or self._should_repeat(sign):
                     signs.append(sign)
             else:
                 # Fingerspell unknown words (length > 2)
                 if len(token) > 2:
-                    for char in token.upper():
-                        if char in self.class_labels:
-                            signs.append(char)
+                    upper = token.upper()
+                    if NUMBA_AVAILABLE and len(upper) >= _NUMBA_SPELL_MIN_LEN and upper.isascii():
+                        buf = np.frombuffer(upper.encode('ascii'), dtype=np.uint8)
+                        signs.extend(_fingerspell_ascii(buf, _SPELL_MASK).tobytes().decode('ascii'))
+                    elif upper.isascii():
+                        signs.extend(upper.translate(self._spell_delete))
+                    else:
+                        signs.extend(char for char in upper if char in self._spellable)
         
         return signs
     
     def _should_repeat(self, sign: str) -> bool:
         """Determine if a sign should be repeated in sequence"""
         # Pronouns and short words can repeat
-        return sign in ['I', 'You', 'He', 'She', 'It']
+        return sign in _REPEATABLE_SIGNS
     
     def process(self, text: str) -> dict:
         """
@@ -324,35 +534,83 @@ class NLPProcessor:
         Text Preprocessing → Word Tokenization → Lemmatization → Stop-word Removal
         Returns detailed processing results
         """
-        result = {
+        # A lone letter or digit maps straight to its sign, skipping NLTK/spaCy
+        preprocessed = self.preprocess_text(text)
+        if len(preprocessed) == 1:
+            sign = _LETTERS.get(preprocessed) or _DIGITS.get(preprocessed)
+            if sign is not None:
+                return self._single_sign_result(text, preprocessed, sign)
+        
+        self._load_nltk()
+        return self._result_to_dict(self._process_cached(text))
+    
+    def _single_sign_result(self, text: str, token: str, sign: str) -> dict:
+        """Result dict for input that is a single fingerspellable character"""
+        return {
             'original_text': text,
-            'preprocessed': '',
+            'preprocessed': token,
             'phrases_detected': [],
-            'tokens': [],
-            'lemmatized': [],
-            'filtered': [],
-            'isl_signs': []
+            'tokens': [token],
+            'lemmatized': [token],
+            'filtered': [token],
+            'isl_signs': [sign]
         }
+    
+    def process_batch(self, texts: List[str]) -> List[dict]:
+        """
+        Run the pipeline over many utterances at once
+        With spaCy, all texts are tagged and lemmatized in one nlp.pipe() stream
+        """
+        nlp = _spacy_pipeline()
+        if nlp is None:
+            return [self.process(text) for text in texts]
         
+        self._load_nltk()
+        preprocessed = [self.preprocess_text(text) for text in texts]
+        detected = [self.detect_phrases(text) for text in preprocessed]
+        docs = nlp.pipe((remaining for _, remaining in detected), batch_size=64, n_process=1)
+        
+        results = []
+        for text, clean, (phrases, _), doc in zip(texts, preprocessed, detected, docs):
+            tokens, lemmatized = self._doc_tokens_and_lemmas(doc)
+            results.append(self._result_to_dict(
+                self._build_result(text, clean, phrases, tokens, lemmatized)
+            ))
+        
+        return results
+    
+    def _result_to_dict(self, result: ProcessResult) -> dict:
+        """Materialize a fresh, mutable dict at the boundary"""
+        return {
+            field: list(value) if isinstance(value, tuple) else value
+            for field, value in result._asdict().items()
+        }
+    
+    def _process_uncached(self, text: str) -> ProcessResult:
+        """Run the pipeline and return an immutable ProcessResult"""
         # Step 1: Preprocess
         preprocessed = self.preprocess_text(text)
-        result['preprocessed'] = preprocessed
         
         # Detect phrases first
         phrases, remaining_text = self.detect_phrases(preprocessed)
-        result['phrases_detected'] = phrases
         
-        # Step 2: Tokenize remaining text
-        tokens = self.tokenize(remaining_text)
-        result['tokens'] = tokens
-        
-        # Step 3: Lemmatize
-        lemmatized = self.lemmatize(tokens)
-        result['lemmatized'] = lemmatized
+        if _spacy_pipeline() is not None:
+            # Steps 2 + 3: Tokenize and lemmatize in a single spaCy pass
+            tokens, lemmatized = self._tokenize_and_lemmatize(remaining_text)
+        else:
+            # Step 2: Tokenize remaining text
+            tokens = self.tokenize(remaining_text)
+            
+            # Step 3: Lemmatize
+            lemmatized = self.lemmatize(tokens)
         
+        return self._build_result(text, preprocessed, phrases, tokens, lemmatized)
+    
+    def _build_result(self, text: str, preprocessed: str, phrases: List[str],
+                      tokens: List[str], lemmatized: List[str]) -> ProcessResult:
+        """Steps after lemmatization: stop-word removal, sign mapping and ordering"""
         # Step 4: Remove stopwords
         filtered = self.remove_stopwords(lemmatized)
-        result['filtered'] = filtered
         
         # Map to ISL signs
         word_signs = self.map_to_signs(filtered)
@@ -361,17 +619,22 @@ class NLPProcessor:
         # ISL typically places time expressions first
         time_signs = []
         other_signs = []
+        add_time, add_other = time_signs.append, other_signs.append
         
-        for sign in phrases + word_signs:
-            if sign in ['Today', 'Monday', 'Tuesday', 'Wednesday', 
-                       'Thursday', 'Friday', 'Saturday', 'Sunday']:
-                time_signs.append(sign)
-            else:
-                other_signs.append(sign)
-        
-        result['isl_signs'] = time_signs + other_signs
+        # One pass over both lists without concatenating them first
+        for signs in (phrases, word_signs):
+            for sign in signs:
+                (add_time if sign in _TIME_SIGNS else add_other)(sign)
         
-        return result
+        return ProcessResult(
+            original_text=text,
+            preprocessed=preprocessed,
+            phrases_detected=tuple(phrases),
+            tokens=tuple(tokens),
+            lemmatized=tuple(lemmatized),
+            filtered=tuple(filtered),
+            isl_signs=(*time_signs, *other_signs)
+        )
     
     def get_processed_signs(self, text: str) -> List[str]:
         """Convenience method to get just the ISL signs"""
@@ -13,8 +13,458 @@ Contains 21 hand landmark keypoints (x, y, z) for each sign, matching MediaPipe
 Coordinates are normalized (0.0 to 1.0) relative to image dimensions
 """
 
-from typing import Dict, List, Tuple
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import hashlib
+import json
 import math
+import os
+import numpy as np
+from .constants import CLASS_LABELS, CLASS_LABELS_SET, CLASS_LABEL_INDEX
+
+# Try to import Numba for the compiled interpolation and finger kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _interp_kernel(start, end, progress, out):
+        """Linear interpolation of (N, 3) landmark arrays into out"""
+        for i in range(start.shape[0]):
+            for j in range(3):
+                out[i, j] = start[i, j] + (end[i, j] - start[i, j]) * progress
+        return out
+    
+    @njit(cache=True, fastmath=True)
+    def _interp_frames_kernel(start, end, progresses, out):
+        """Interpolate (N, 3) landmark arrays at every progress value into (F, N, 3) out"""
+        for f in range(progresses.shape[0]):
+            t = progresses[f]
+            for i in range(start.shape[0]):
+                for j in range(3):
+                    out[f, i, j] = start[i, j] + (end[i, j] - start[i, j]) * t
+        return out
+    
+    @njit(cache=True)
+    def _extend_finger_kernel(landmarks, indices, x_offset, y_offset):
+        """Straighten the finger joints at indices, in place"""
+        for step in range(indices.shape[0]):
+            i = indices[step]
+            landmarks[i, 0] += x_offset
+            landmarks[i, 1] -= 0.04 * (step + 1) + y_offset
+            landmarks[i, 2] = 0.0
+        return landmarks
+    
+    @njit(cache=True)
+    def _curl_finger_kernel(landmarks, indices, curl_amount):
+        """Curl the finger joints at indices, in place; later joints follow the base height"""
+        count = indices.shape[0]
+        base_y = landmarks[indices[0], 1]
+        for step in range(count):
+            i = indices[step]
+            curl = curl_amount * (step / count)
+            landmarks[i, 2] = curl * 0.08
+            if step > 0:
+                landmarks[i, 1] = base_y - 0.02 * step + curl * 0.04
+        return landmarks
+else:
+    def _interp_kernel(start, end, progress, out):
+        """Linear interpolation of (N, 3) landmark arrays into out"""
+        np.subtract(end, start, out=out)
+        out *= progress
+        out += start
+        return out
+    
+    def _interp_frames_kernel(start, end, progresses, out):
+        """Interpolate (N, 3) landmark arrays at every progress value into (F, N, 3) out"""
+        np.multiply(progresses[:, None, None], end - start, out=out)
+        out += start
+        return out
+    
+    def _extend_finger_kernel(landmarks, indices, x_offset, y_offset):
+        """Straighten the finger joints at indices, in place"""
+        steps = np.arange(len(indices))
+        landmarks[indices, 0] += x_offset
+        landmarks[indices, 1] -= 0.04 * (steps + 1) + y_offset
+        landmarks[indices, 2] = 0.0
+        return landmarks
+    
+    def _curl_finger_kernel(landmarks, indices, curl_amount):
+        """Curl the finger joints at indices, in place; later joints follow the base height"""
+        steps = np.arange(len(indices))
+        curl = curl_amount * (steps / len(indices))
+        landmarks[indices, 2] = curl * 0.08
+        landmarks[indices[1:], 1] = landmarks[indices[0], 1] - 0.02 * steps[1:] + curl[1:] * 0.04
+        return landmarks
+
+
+# Storage dtype for the cached keyframe arrays. float64 like the builders, so
+# interpolated and serialized coordinates keep their exact values (0.42, not
+# the float32 0.41999998807907104)
+_COORD_DTYPE = np.float64
+
+
+# Base hand (relaxed/neutral) as (x, y, z) offsets from the wrist
+_BASE_HAND = np.array([
+    (0.0, 0.0, 0.0),  # WRIST (center point)
+    # THUMB (extending to the side): CMC, MCP, IP, TIP
+    (-0.08, -0.02, 0.0), (-0.12, -0.05, 0.0), (-0.14, -0.08, 0.0), (-0.16, -0.10, 0.0),
+    # INDEX FINGER (pointing up)
+    (-0.04, -0.08, 0.0), (-0.04, -0.14, 0.0), (-0.04, -0.18, 0.0), (-0.04, -0.22, 0.0),
+    # MIDDLE FINGER
+    (0.0, -0.08, 0.0), (0.0, -0.15, 0.0), (0.0, -0.20, 0.0), (0.0, -0.24, 0.0),
+    # RING FINGER
+    (0.04, -0.08, 0.0), (0.04, -0.14, 0.0), (0.04, -0.18, 0.0), (0.04, -0.21, 0.0),
+    # PINKY FINGER
+    (0.08, -0.08, 0.0), (0.08, -0.12, 0.0), (0.08, -0.15, 0.0), (0.08, -0.18, 0.0)
+], dtype=np.float64)
+_BASE_HAND.flags.writeable = False
+
+# Closed fist as (x, y, z) offsets from the wrist
+_FIST = np.array([
+    (0.0, 0.0, 0.0),  # WRIST
+    # THUMB (tucked in)
+    (-0.06, -0.02, 0.02), (-0.08, -0.04, 0.03), (-0.06, -0.06, 0.04), (-0.04, -0.06, 0.05),
+    # INDEX (curled)
+    (-0.04, -0.08, 0.0), (-0.04, -0.10, 0.04), (-0.02, -0.08, 0.06), (-0.02, -0.04, 0.05),
+    # MIDDLE (curled)
+    (0.0, -0.08, 0.0), (0.0, -0.10, 0.04), (0.02, -0.08, 0.06), (0.02, -0.04, 0.05),
+    # RING (curled)
+    (0.04, -0.08, 0.0), (0.04, -0.10, 0.04), (0.05, -0.08, 0.06), (0.05, -0.04, 0.05),
+    # PINKY (curled)
+    (0.08, -0.08, 0.0), (0.08, -0.09, 0.03), (0.08, -0.07, 0.05), (0.08, -0.04, 0.04)
+], dtype=np.float64)
+_FIST.flags.writeable = False
+
+# Numbers 6-9 as (x, y, z) offsets from the wrist
+_NUMBER_TEMPLATES = MappingProxyType({
+    # Fist with thumb extended upward (thumbs up style)
+    '6': np.array([
+        (0.0, 0.0, 0.0),  # WRIST
+        # THUMB (pointing straight up)
+        (-0.06, -0.04, 0.0), (-0.08, -0.10, 0.0), (-0.09, -0.16, 0.0), (-0.09, -0.22, 0.0),
+        # INDEX, MIDDLE, RING, PINKY (tightly curled)
+        (-0.03, -0.06, 0.0), (-0.03, -0.04, 0.06), (-0.01, -0.02, 0.08), (0.0, 0.02, 0.06),
+        (0.01, -0.06, 0.0), (0.01, -0.04, 0.06), (0.03, -0.02, 0.08), (0.04, 0.02, 0.06),
+        (0.05, -0.06, 0.0), (0.05, -0.04, 0.06), (0.07, -0.02, 0.08), (0.08, 0.02, 0.06),
+        (0.09, -0.06, 0.0), (0.09, -0.04, 0.06), (0.11, -0.02, 0.08), (0.12, 0.02, 0.06)
+    ], dtype=np.float64),
+    # Index and middle pointing sideways (gun shape)
+    '7': np.array([
+        (0.0, 0.0, 0.0),  # WRIST
+        # THUMB (pointing up)
+        (-0.05, -0.03, 0.0), (-0.07, -0.08, 0.0), (-0.08, -0.13, 0.0), (-0.08, -0.18, 0.0),
+        # INDEX (pointing left)
+        (-0.02, -0.06, 0.0), (-0.10, -0.06, 0.0), (-0.18, -0.06, 0.0), (-0.26, -0.06, 0.0),
+        # MIDDLE (parallel to index)
+        (0.01, -0.04, 0.0), (-0.07, -0.02, 0.0), (-0.15, -0.01, 0.0), (-0.23, 0.0, 0.0),
+        # RING, PINKY (curled)
+        (0.05, -0.05, 0.0), (0.05, -0.03, 0.05), (0.06, 0.0, 0.07), (0.07, 0.03, 0.05),
+        (0.09, -0.05, 0.0), (0.09, -0.03, 0.05), (0.10, 0.0, 0.07), (0.11, 0.03, 0.05)
+    ], dtype=np.float64),
+    # Index, middle and ring extended, thumb and pinky touching
+    '8': np.array([
+        (0.0, 0.0, 0.0),  # WRIST
+        # THUMB (curving to touch pinky)
+        (-0.04, -0.02, 0.02), (-0.02, -0.04, 0.04), (0.02, -0.05, 0.05), (0.06, -0.06, 0.04),
+        # INDEX, MIDDLE, RING (extended up)
+        (-0.04, -0.08, 0.0), (-0.05, -0.14, 0.0), (-0.06, -0.20, 0.0), (-0.06, -0.26, 0.0),
+        (0.0, -0.08, 0.0), (0.0, -0.15, 0.0), (0.0, -0.22, 0.0), (0.0, -0.28, 0.0),
+        (0.04, -0.08, 0.0), (0.05, -0.14, 0.0), (0.06, -0.20, 0.0), (0.06, -0.25, 0.0),
+        # PINKY (bent to touch thumb)
+        (0.08, -0.06, 0.0), (0.09, -0.04, 0.03), (0.08, -0.05, 0.05), (0.06, -0.06, 0.04)
+    ], dtype=np.float64),
+    # Closed fist with pinky extended
+    '9': np.array([
+        (0.0, 0.0, 0.0),  # WRIST
+        # THUMB (curled into fist)
+        (-0.05, -0.02, 0.03), (-0.06, -0.04, 0.05), (-0.04, -0.05, 0.06), (-0.02, -0.04, 0.06),
+        # INDEX, MIDDLE, RING (tightly curled)
+        (-0.03, -0.06, 0.0), (-0.03, -0.04, 0.06), (-0.01, -0.02, 0.08), (0.0, 0.02, 0.06),
+        (0.01, -0.06, 0.0), (0.01, -0.04, 0.06), (0.03, -0.02, 0.08), (0.04, 0.02, 0.06),
+        (0.05, -0.06, 0.0), (0.05, -0.04, 0.06), (0.07, -0.02, 0.08), (0.08, 0.02, 0.06),
+        # PINKY (extended straight up)
+        (0.09, -0.06, 0.0), (0.10, -0.12, 0.0), (0.11, -0.17, 0.0), (0.12, -0.22, 0.0)
+    ], dtype=np.float64)
+})
+for _template in _NUMBER_TEMPLATES.values():
+    _template.flags.writeable = False
+
+# Tuple position of each landmark axis
+_AXES = MappingProxyType({'x': 0, 'y': 1, 'z': 2})
+
+# (x, y, z) of a {'x','y','z'} landmark dict
+_XYZ = itemgetter('x', 'y', 'z')
+
+
+class Landmark(NamedTuple):
+    """Immutable hand landmark, still readable as lm['x'] like the old dict records"""
+    x: float
+    y: float
+    z: float
+    
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            key = _AXES[key]
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key, default=None):
+        index = _AXES.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+    
+    def keys(self):
+        return _AXES.keys()
+    
+    def copy(self) -> Dict:
+        """Mutable {'x','y','z'} dict, as dict.copy() gave for the old records"""
+        return {'x': self.x, 'y': self.y, 'z': self.z}
+
+
+# Shared thumb shapes (CMC, MCP, IP, TIP) as offsets from the wrist
+_THUMB_TUCKED = np.array([  # Folded over the curled fingers (pointing signs)
+    (-0.04, -0.02, 0.03), (-0.05, -0.04, 0.05), (-0.04, -0.06, 0.05), (-0.02, -0.07, 0.04)
+])
+_THUMB_EXTENDED = np.array([  # Stretched out to the side of an open hand
+    (-0.08, -0.02, 0.0), (-0.12, -0.04, 0.0), (-0.15, -0.06, 0.0), (-0.17, -0.08, 0.0)
+])
+_THUMB_ALONG_SIDE = np.array([  # Resting along the index finger
+    (-0.05, -0.02, 0.01), (-0.07, -0.04, 0.02), (-0.08, -0.06, 0.02), (-0.08, -0.08, 0.02)
+])
+_THUMB_TUCKED.flags.writeable = False
+_THUMB_EXTENDED.flags.writeable = False
+_THUMB_ALONG_SIDE.flags.writeable = False
+
+# Index finger (MCP, PIP, DIP, TIP) raised straight up, as offsets from the wrist
+_INDEX_UP = np.array([(-0.02, -0.08, 0.0), (-0.02, -0.13, 0.0), (-0.02, -0.17, 0.0), (-0.02, -0.20, 0.0)])
+_INDEX_UP.flags.writeable = False
+
+# Weekday signs share one handshape varied by (thumb_angle, finger_spread, curl)
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_CONFIGS = np.array([
+    (0.0, 0.03, 0.0),     # Monday
+    (0.02, 0.035, 0.01),  # Tuesday
+    (0.04, 0.04, 0.02),   # Wednesday
+    (0.06, 0.032, 0.03),  # Thursday
+    (0.08, 0.038, 0.0),   # Friday
+    (0.10, 0.042, 0.01),  # Saturday
+    (0.12, 0.045, 0.02)   # Sunday
+])
+_DAY_CONFIGS.flags.writeable = False
+
+# Finger base x offsets from the wrist that many word signs share
+_FINGERS_AT_M04 = np.array([-0.04, 0.0, 0.04, 0.08])   # index..pinky
+_FINGERS_AT_M03 = np.array([-0.03, 0.01, 0.05, 0.09])
+_FINGERS_AT_M02 = np.array([-0.02, 0.02, 0.06, 0.10])
+_TUCKED_AT_02 = np.array([0.02, 0.06, 0.10])           # middle..pinky beside the index
+for _offsets in (_FINGERS_AT_M04, _FINGERS_AT_M03, _FINGERS_AT_M02, _TUCKED_AT_02):
+    _offsets.flags.writeable = False
+
+# Shared curled-finger shapes: per-joint (dx, dy, z) from the finger base at (x + offset, y)
+_CURL_TUCKED = np.array([  # Fingers folded under a pointing index / thumb
+    (0.0, -0.06, 0.0), (0.0, -0.08, 0.04), (0.01, -0.06, 0.06), (0.01, -0.03, 0.05)
+])
+_CURL_TUCKED_HIGH = np.array([  # Same fold with the knuckles a little higher
+    (0.0, -0.05, 0.0), (0.0, -0.07, 0.04), (0.01, -0.05, 0.06), (0.01, -0.02, 0.05)
+])
+_CURL_TUCKED.flags.writeable = False
+_CURL_TUCKED_HIGH.flags.writeable = False
+
+# Per-joint (MCP, PIP, DIP, TIP) y lift when a finger extends from a fist
+_FINGER_RAISE = 0.04 * np.arange(1, 5)
+_FINGER_RAISE.flags.writeable = False
+
+# Joint index (MCP, PIP, DIP, TIP) along a finger, for broadcasting finger grids
+_JOINT_STEPS = np.arange(4, dtype=np.float64)
+_JOINT_STEPS.flags.writeable = False
+
+# Sign flip for x when reflecting a hand into its mirror image
+_MIRROR_SCALE = np.array([-1.0, 1.0, 1.0])
+_MIRROR_SCALE.flags.writeable = False
+
+
+def _landmarks_array(wrist: Sequence[float], thumb: Sequence[Sequence[float]],
+                     *fingers: Sequence[Sequence[float]]) -> np.ndarray:
+    """Fill one (21, 3) array with the wrist, 4 thumb rows and the finger blocks in order"""
+    landmarks = np.empty((21, 3))
+    landmarks[0] = wrist
+    landmarks[1:5] = thumb
+    row = 5
+    for block in fingers:
+        landmarks[row:row + len(block)] = block
+        row += len(block)
+    if row != len(landmarks):
+        raise ValueError(f"Expected 16 finger landmarks, got {row - 5}")
+    return landmarks
+
+
+def _curled_fingers(x: float, y: float, offsets: Sequence[float],
+                    template: Sequence[Sequence[float]]) -> np.ndarray:
+    """(4 * len(offsets), 3) bent fingers: template (dx, dy, z) joints placed at each (x + offset, y)"""
+    template = np.asarray(template, dtype=np.float64)
+    block = np.empty((len(offsets), 4, 3))
+    block[..., 0] = (x + np.asarray(offsets, dtype=np.float64))[:, None] + template[:, 0]
+    block[..., 1] = y + template[:, 1]
+    block[..., 2] = template[:, 2]
+    return block.reshape(-1, 3)
+
+
+def _pointing_hand(x: float, y: float, index: Sequence[Sequence[float]]) -> np.ndarray:
+    """(21, 3) pointing hand at wrist (x, y): tucked thumb, curled fingers, index (MCP..TIP) offsets"""
+    return _landmarks_array((x, y, 0.0), _THUMB_TUCKED + (x, y, 0.0),
+                            np.add(index, (x, y, 0.0)),
+                            _curled_fingers(x, y, _TUCKED_AT_02, _CURL_TUCKED))
+
+
+def _finger_grid(x: float, y: float, offsets: Sequence[float], dy0: float = 0.08,
+                 dy_step: float = 0.04, z: float = 0.0, dx_step: float = 0.0) -> np.ndarray:
+    """(4 * len(offsets), 3) straight fingers; joint j sits at (x + offset + j * dx_step, y - dy0 - j * dy_step)
+    
+    z and dx_step may also be arrays broadcasting against (fingers, joints)
+    """
+    ox = (x + np.asarray(offsets, dtype=np.float64))[:, None] + _JOINT_STEPS * dx_step
+    oy = y - dy0 - _JOINT_STEPS * dy_step
+    return np.stack(np.broadcast_arrays(ox, oy, z), axis=-1).reshape(-1, 3)
+
+
+def _translate(arr: np.ndarray, dx: float, dy: float, dz: float) -> np.ndarray:
+    """Shift every landmark row of an (N, 3) array by (dx, dy, dz)"""
+    return arr + np.array((dx, dy, dz))
+
+
+def _mirror(arr: np.ndarray, axis_x: float = 0.5) -> np.ndarray:
+    """Reflect (..., 3) landmark rows across the vertical line x = axis_x"""
+    out = arr * _MIRROR_SCALE
+    out[..., 0] += 2 * axis_x
+    return out
+
+
+@lru_cache(maxsize=None)
+def _day_hands() -> np.ndarray:
+    """Read-only (7, 21, 3) hands for every weekday sign, built in one broadcast"""
+    x, y = 0.5, 0.45
+    thumb_angle, spread, curl = _DAY_CONFIGS.T
+    hands = np.empty((len(_DAY_NAMES), 21, 3))
+    hands[:, 0] = (x, y, 0.0)
+    
+    # Thumb with varying angle
+    hands[:, 1:5, 0] = x + np.array([-0.06, -0.10, -0.13, -0.15]) - thumb_angle[:, None]
+    hands[:, 1:5, 1] = y + np.array([-0.02, -0.05, -0.08, -0.10])
+    hands[:, 1:5, 2] = 0.0
+    
+    # Fingers with varying spread, curling by joint
+    base_x = x + np.stack((-spread, np.zeros_like(spread), spread, spread * 2), axis=1)
+    fingers = hands[:, 5:].reshape(len(_DAY_NAMES), 4, 4, 3)
+    fingers[..., 0] = base_x[:, :, None] + _JOINT_STEPS * 0.005
+    fingers[..., 1] = y - 0.08 - _JOINT_STEPS * 0.045
+    fingers[..., 2] = (curl[:, None] * (_JOINT_STEPS / 3))[:, None, :]
+    
+    hands.flags.writeable = False
+    return hands
+
+
+@lru_cache(maxsize=None)
+def _raw_sign_0() -> np.ndarray:
+    """Handshape for number 0, built once (read-only; copy before editing)"""
+    landmarks = _FIST + (0.5, 0.5, 0.0)
+    # Touch thumb to index forming a circle
+    landmarks[4, 0] = landmarks[8, 0] + 0.02
+    landmarks[4, 1] = landmarks[8, 1]
+    landmarks.flags.writeable = False
+    return landmarks
+
+
+@lru_cache(maxsize=None)
+def _raw_sign_1() -> np.ndarray:
+    """Handshape for number 1, built once (read-only; copy before editing)"""
+    landmarks = _FIST + (0.5, 0.5, 0.0)
+    # Extend index finger
+    landmarks[5:9, 1] -= (0.02, 0.06, 0.10, 0.14)
+    landmarks[5:9, 2] = 0.0
+    landmarks.flags.writeable = False
+    return landmarks
+
+
+@lru_cache(maxsize=None)
+def _raw_sign_2() -> np.ndarray:
+    """Handshape for number 2, built once (read-only; copy before editing)"""
+    landmarks = _FIST + (0.5, 0.5, 0.0)
+    # Extend index and middle straight up, spread apart
+    landmarks[5:13, 1] -= np.resize(_FINGER_RAISE, 8)
+    landmarks[5:13, 2] = 0.0
+    landmarks[5:9, 0] -= 0.02
+    landmarks[9:13, 0] += 0.02
+    landmarks.flags.writeable = False
+    return landmarks
+
+
+@lru_cache(maxsize=64)
+def _placed_landmarks(template: str, x_offset: float, y_offset: float) -> Tuple[Landmark, ...]:
+    """Shared read-only landmarks for a hand template at a wrist position"""
+    base = _BASE_HAND if template == 'base' else _FIST
+    return tuple(map(Landmark._make, (base + (x_offset, y_offset, 0.0)).tolist()))
+
+
+# Optional prebuilt sign cache written by ISLDatabase.save_sign_cache(); ignored
+# when missing or written by a different version of this module, so edited
+# builders always win. It lives in the user cache dir (the package dir is often
+# read-only) unless ISL_SIGN_CACHE points elsewhere
+_SIGN_CACHE_PATH = os.environ.get('ISL_SIGN_CACHE') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'isl', 'signs.npz')
+
+
+def _sign_cache_version() -> str:
+    """Hash of this module's source: any edit to the builders or the cache layout invalidates old caches"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class _SignSpec(NamedTuple):
+    """Fixed-layout builder output, frozen into a read-only record mapping on first lookup"""
+    name: str
+    type: str
+    facial_expression: str
+    motion_type: str
+    body_region: str
+    two_hands: bool
+    keyframes: Tuple[Dict, ...]
+
+
+class _LazySigns(Mapping):
+    """Read-only name -> frozen sign mapping that builds each sign on first access"""
+    
+    __slots__ = ('_builders', '_finish', '_entries')
+    
+    def __init__(self, builders: Dict[str, Callable[[], _SignSpec]], finish: Callable[[_SignSpec], Tuple]):
+        self._builders = builders  # name -> zero-argument sign builder
+        self._finish = finish      # built sign -> (record, keyframe_arrays)
+        self._entries = {}
+    
+    def entry(self, name: str) -> Tuple:
+        """(record, keyframe_arrays) for a sign, built once"""
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._entries[name] = self._finish(self._builders[name]())
+        return entry
+    
+    def __getitem__(self, name: str) -> MappingProxyType:
+        return self.entry(name)[0]
+    
+    def __contains__(self, name) -> bool:
+        return name in self._builders
+    
+    def __iter__(self):
+        return iter(self._builders)
+    
+    def __len__(self) -> int:
+        return len(self._builders)
 
 
 class ISLDatabase:
@@ -22,1881 +472,1580 @@ class ISLDatabase:
     ISL Sign Repository containing keypoint coordinates for all signs
     """
     
-    def __init__(self):
-        # Class labels from app.py
-        self.class_labels = [
-            '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-            'A', 'Alright', 'Animal', 'B', 'Beautiful', 'Bed', 'Bedroom', 'Bird', 'Black', 'Blind',
-            'C', 'Cat', 'Chair', 'Colour', 'Cow', 'D', 'Daughter', 'Deaf', 'Dog', 'Door', 'Dream',
-            'E', 'F', 'Father', 'Fish', 'Friday', 'G', 'Good Morning', 'Good night', 'Grey',
-            'H', 'Happy', 'He', 'Hello', 'Horse', 'How are you', 'I', 'It',
-            'J', 'K', 'L', 'Loud', 'M', 'Monday', 'Mother', 'Mouse',
-            'N', 'O', 'Orange', 'P', 'Parent', 'Pink', 'Pleased',
-            'Q', 'Quiet', 'R', 'S', 'Sad', 'Saturday', 'She', 'Son', 'Sunday',
-            'T', 'Table', 'Thank you', 'Thursday', 'Today', 'Tuesday',
-            'U', 'Ugly', 'V', 'W', 'Wednesday', 'White', 'Window',
-            'X', 'Y', 'You', 'Z'
-        ]
-        
-        # Landmark indices
-        self.WRIST = 0
-        self.THUMB = (1, 2, 3, 4)  # CMC, MCP, IP, TIP
-        self.INDEX = (5, 6, 7, 8)  # MCP, PIP, DIP, TIP
-        self.MIDDLE = (9, 10, 11, 12)
-        self.RING = (13, 14, 15, 16)
-        self.PINKY = (17, 18, 19, 20)
-        
-        # Initialize sign database
-        self.signs = self._build_sign_database()
+    __slots__ = ('class_labels', '_label_set', '_label_index',
+                 'signs', '_default_sign', 'sign_names')
     
-    def _create_base_hand(self, x_offset: float = 0.5, y_offset: float = 0.5) -> List[Dict]:
-        """Create base hand position (relaxed/neutral)"""
-        landmarks = []
-        
-        # WRIST (center point)
-        landmarks.append({'x': x_offset, 'y': y_offset, 'z': 0.0})
-        
-        # THUMB (extending to the side)
-        landmarks.append({'x': x_offset - 0.08, 'y': y_offset - 0.02, 'z': 0.0})  # CMC
-        landmarks.append({'x': x_offset - 0.12, 'y': y_offset - 0.05, 'z': 0.0})  # MCP
-        landmarks.append({'x': x_offset - 0.14, 'y': y_offset - 0.08, 'z': 0.0})  # IP
-        landmarks.append({'x': x_offset - 0.16, 'y': y_offset - 0.10, 'z': 0.0})  # TIP
+    # (signs, default_sign) shared by all instances
+    _CACHED_TABLES = None
+    
+    # Landmark indices
+    WRIST = 0
+    THUMB = (1, 2, 3, 4)  # CMC, MCP, IP, TIP
+    INDEX = (5, 6, 7, 8)  # MCP, PIP, DIP, TIP
+    MIDDLE = (9, 10, 11, 12)
+    RING = (13, 14, 15, 16)
+    PINKY = (17, 18, 19, 20)
+    
+    def __init__(self):
+        # Class labels from app.py (shared, immutable)
+        self.class_labels = CLASS_LABELS
         
-        # INDEX FINGER (pointing up)
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.08, 'z': 0.0})  # MCP
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.14, 'z': 0.0})  # PIP
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.18, 'z': 0.0})  # DIP
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.22, 'z': 0.0})  # TIP
+        # O(1) membership and label -> index lookups (shared, immutable)
+        self._label_set = CLASS_LABELS_SET
+        self._label_index = CLASS_LABEL_INDEX
         
-        # MIDDLE FINGER
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.08, 'z': 0.0})  # MCP
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.15, 'z': 0.0})  # PIP
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.20, 'z': 0.0})  # DIP
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.24, 'z': 0.0})  # TIP
+        # The sign data is deterministic, so the tables are created once per
+        # process and shared (read-only) by every instance; each sign is only
+        # built the first time it is looked up
+        if ISLDatabase._CACHED_TABLES is None:
+            ISLDatabase._CACHED_TABLES = self._build_tables()
+        self.signs, self._default_sign = ISLDatabase._CACHED_TABLES
+        self.sign_names = tuple(self.signs)
+    
+    def _build_tables(self) -> Tuple:
+        """Create the lazy sign table and the frozen default sign"""
+        builders = self._sign_builders()
+        cached = self._cached_sign_builders(_SIGN_CACHE_PATH, builders)
+        signs = _LazySigns(cached or builders, self._finish_sign)
+        default_sign = self._freeze_sign(self._get_default_sign())
+        return signs, default_sign
+    
+    def _cached_sign_builders(self, path: str,
+                              builders: Dict[str, Callable[[], _SignSpec]]) -> Optional[Dict[str, Callable[[], _SignSpec]]]:
+        """Builders that read signs from a saved .npz cache, or None if it is missing or stale"""
+        try:
+            # Read everything up front so the file is closed again right away
+            with np.load(path) as npz:
+                data = {key: npz[key] for key in npz.files}
+            if str(data['version']) != _sign_cache_version():
+                return None
+            meta = json.loads(str(data['meta']))
+        except (OSError, ValueError, KeyError):
+            return None
         
-        # RING FINGER
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.08, 'z': 0.0})  # MCP
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.14, 'z': 0.0})  # PIP
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.18, 'z': 0.0})  # DIP
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.21, 'z': 0.0})  # TIP
+        if list(meta) != list(builders):
+            return None
+        return {name: partial(self._load_cached_sign, data, i, meta[name])
+                for i, name in enumerate(meta)}
+    
+    def _load_cached_sign(self, data, index: int, meta: Dict) -> _SignSpec:
+        """Rebuild one sign record from its cached arrays and metadata"""
+        keyframes = tuple(
+            {
+                'frame': frame,
+                'right_hand': self._read_only(data[f's{index}_{k}_r']),
+                'left_hand': self._read_only(data[f's{index}_{k}_l']) if has_left else None
+            }
+            for k, (frame, has_left) in enumerate(meta['keyframes'])
+        )
+        return _SignSpec(**meta['fields'], keyframes=keyframes)
+    
+    def save_sign_cache(self, path: str = _SIGN_CACHE_PATH) -> None:
+        """Write every sign to an .npz cache that later processes load instead of rebuilding"""
+        arrays, meta = {}, {}
+        for i, name in enumerate(self.sign_names):
+            sign = self.signs[name]
+            frames = []
+            for k, keyframe in enumerate(sign['keyframes']):
+                arrays[f's{i}_{k}_r'] = np.array(keyframe['right_hand'], dtype=np.float64)
+                if keyframe['left_hand'] is not None:
+                    arrays[f's{i}_{k}_l'] = np.array(keyframe['left_hand'], dtype=np.float64)
+                frames.append((keyframe['frame'], keyframe['left_hand'] is not None))
+            fields = {key: value for key, value in sign.items() if key != 'keyframes'}
+            meta[name] = {'fields': fields, 'keyframes': frames}
         
-        # PINKY FINGER
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.08, 'z': 0.0})  # MCP
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.12, 'z': 0.0})  # PIP
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.15, 'z': 0.0})  # DIP
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.18, 'z': 0.0})  # TIP
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(path, version=np.array(_sign_cache_version()),
+                            meta=np.array(json.dumps(meta)), **arrays)
+    
+    def _finish_sign(self, sign: _SignSpec) -> Tuple:
+        """Freeze a built sign and derive its cached per-sign arrays"""
+        # Per-keyframe (right, left) landmark arrays, taken straight from the
+        # builders so ndarray-built signs skip the dict round trip
+        keyframe_arrays = tuple(
+            (self._keyframe_array(kf['right_hand']), self._keyframe_array(kf.get('left_hand')))
+            for kf in sign.keyframes
+        )
         
-        return landmarks
+        # Frozen so records can be shared safely
+        return self._freeze_sign(sign), keyframe_arrays
+    
+    def _keyframe_array(self, landmarks: Union[np.ndarray, List[Dict], None]) -> Optional[np.ndarray]:
+        """Read-only float64 (21, 3) array for a builder's landmarks (None if absent)"""
+        if isinstance(landmarks, np.ndarray):
+            arr = landmarks.astype(_COORD_DTYPE)
+            arr.flags.writeable = False
+            return arr
+        return self._landmarks_to_array(landmarks) if landmarks else None
+    
+    def _create_base_hand(self, x_offset: float = 0.5, y_offset: float = 0.5) -> List[Dict]:
+        """Create base hand position (relaxed/neutral)"""
+        return self._thaw_landmarks(_placed_landmarks('base', x_offset, y_offset))
     
     def _create_fist(self, x_offset: float = 0.5, y_offset: float = 0.5) -> List[Dict]:
         """Create closed fist position"""
-        landmarks = []
-        
-        # WRIST
-        landmarks.append({'x': x_offset, 'y': y_offset, 'z': 0.0})
-        
-        # THUMB (tucked in)
-        landmarks.append({'x': x_offset - 0.06, 'y': y_offset - 0.02, 'z': 0.02})
-        landmarks.append({'x': x_offset - 0.08, 'y': y_offset - 0.04, 'z': 0.03})
-        landmarks.append({'x': x_offset - 0.06, 'y': y_offset - 0.06, 'z': 0.04})
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.06, 'z': 0.05})
-        
-        # INDEX (curled)
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.08, 'z': 0.0})
-        landmarks.append({'x': x_offset - 0.04, 'y': y_offset - 0.10, 'z': 0.04})
-        landmarks.append({'x': x_offset - 0.02, 'y': y_offset - 0.08, 'z': 0.06})
-        landmarks.append({'x': x_offset - 0.02, 'y': y_offset - 0.04, 'z': 0.05})
-        
-        # MIDDLE (curled)
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.08, 'z': 0.0})
-        landmarks.append({'x': x_offset, 'y': y_offset - 0.10, 'z': 0.04})
-        landmarks.append({'x': x_offset + 0.02, 'y': y_offset - 0.08, 'z': 0.06})
-        landmarks.append({'x': x_offset + 0.02, 'y': y_offset - 0.04, 'z': 0.05})
-        
-        # RING (curled)
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.08, 'z': 0.0})
-        landmarks.append({'x': x_offset + 0.04, 'y': y_offset - 0.10, 'z': 0.04})
-        landmarks.append({'x': x_offset + 0.05, 'y': y_offset - 0.08, 'z': 0.06})
-        landmarks.append({'x': x_offset + 0.05, 'y': y_offset - 0.04, 'z': 0.05})
-        
-        # PINKY (curled)
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.08, 'z': 0.0})
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.09, 'z': 0.03})
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.07, 'z': 0.05})
-        landmarks.append({'x': x_offset + 0.08, 'y': y_offset - 0.04, 'z': 0.04})
-        
-        return landmarks
+        return self._thaw_landmarks(_placed_landmarks('fist', x_offset, y_offset))
     
-    def _modify_finger(self, landmarks: List[Dict], finger_indices: Tuple, 
+    def _base_hand_array(self, x_offset: float = 0.5, y_offset: float = 0.5) -> np.ndarray:
+        """Base hand as a fresh (21, 3) array placed at the given wrist position"""
+        return _BASE_HAND + (x_offset, y_offset, 0.0)
+    
+    def _fist_array(self, x_offset: float = 0.5, y_offset: float = 0.5) -> np.ndarray:
+        """Closed fist as a fresh (21, 3) array placed at the given wrist position"""
+        return _FIST + (x_offset, y_offset, 0.0)
+    
+    def _modify_finger(self, landmarks: np.ndarray, finger_indices: Tuple, 
                        extended: bool = True, x_offset: float = 0.0, 
-                       y_offset: float = 0.0, curl_amount: float = 0.0) -> List[Dict]:
+                       y_offset: float = 0.0, curl_amount: float = 0.0) -> np.ndarray:
         """Modify a specific finger's position"""
-        modified = [lm.copy() for lm in landmarks]
-        base_idx = finger_indices[0]
+        modified = np.array(landmarks, dtype=np.float64)
+        indices = np.asarray(finger_indices, dtype=np.intp)
         
         if extended:
             # Extend finger straight
-            for i, idx in enumerate(finger_indices):
-                modified[idx]['x'] += x_offset
-                modified[idx]['y'] -= 0.04 * (i + 1) + y_offset
-                modified[idx]['z'] = 0.0
-        else:
-            # Curl finger
-            for i, idx in enumerate(finger_indices):
-                curl = curl_amount * (i / len(finger_indices))
-                modified[idx]['z'] = curl * 0.08
-                if i > 0:
-                    modified[idx]['y'] = modified[finger_indices[0]]['y'] - 0.02 * i + curl * 0.04
-        
-        return modified
+            return _extend_finger_kernel(modified, indices, float(x_offset), float(y_offset))
+        # Curl finger; joints after the base follow the base joint's height
+        return _curl_finger_kernel(modified, indices, float(curl_amount))
     
-    def _build_sign_database(self) -> Dict:
-        """Build the complete sign database with keypoints"""
-        signs = {}
+    def _sign_builders(self) -> Dict[str, Callable[[], _SignSpec]]:
+        """Zero-argument builder for every sign, in database order"""
+        builders = {}
         
         # ============ NUMBERS 0-9 ============
-        signs['0'] = self._create_sign_0()
-        signs['1'] = self._create_sign_1()
-        signs['2'] = self._create_sign_2()
-        signs['3'] = self._create_sign_3()
-        signs['4'] = self._create_sign_4()
-        signs['5'] = self._create_sign_5()
-        signs['6'] = self._create_sign_6()
-        signs['7'] = self._create_sign_7()
-        signs['8'] = self._create_sign_8()
-        signs['9'] = self._create_sign_9()
+        builders['0'] = self._create_sign_0
+        builders['1'] = self._create_sign_1
+        builders['2'] = self._create_sign_2
+        builders['3'] = self._create_sign_3
+        builders['4'] = self._create_sign_4
+        builders['5'] = self._create_sign_5
+        builders['6'] = self._create_sign_6
+        builders['7'] = self._create_sign_7
+        builders['8'] = self._create_sign_8
+        builders['9'] = self._create_sign_9
         
         # ============ LETTERS A-Z ============
         for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            signs[letter] = self._create_letter_sign(letter)
+            builders[letter] = partial(self._create_letter_sign, letter)
         
         # ============ WORDS ============
         # Greetings
-        signs['Hello'] = self._create_sign_hello()
-        signs['Thank you'] = self._create_sign_thank_you()
-        signs['Good Morning'] = self._create_sign_good_morning()
-        signs['Good night'] = self._create_sign_good_night()
-        signs['How are you'] = self._create_sign_how_are_you()
+        builders['Hello'] = self._create_sign_hello
+        builders['Thank you'] = self._create_sign_thank_you
+        builders['Good Morning'] = self._create_sign_good_morning
+        builders['Good night'] = self._create_sign_good_night
+        builders['How are you'] = self._create_sign_how_are_you
         
         # Emotions
-        signs['Happy'] = self._create_sign_happy()
-        signs['Sad'] = self._create_sign_sad()
-        signs['Beautiful'] = self._create_sign_beautiful()
-        signs['Ugly'] = self._create_sign_ugly()
-        signs['Alright'] = self._create_sign_alright()
-        signs['Pleased'] = self._create_sign_pleased()
+        builders['Happy'] = self._create_sign_happy
+        builders['Sad'] = self._create_sign_sad
+        builders['Beautiful'] = self._create_sign_beautiful
+        builders['Ugly'] = self._create_sign_ugly
+        builders['Alright'] = self._create_sign_alright
+        builders['Pleased'] = self._create_sign_pleased
         
         # Animals
-        signs['Animal'] = self._create_sign_animal()
-        signs['Bird'] = self._create_sign_bird()
-        signs['Cat'] = self._create_sign_cat()
-        signs['Dog'] = self._create_sign_dog()
-        signs['Cow'] = self._create_sign_cow()
-        signs['Horse'] = self._create_sign_horse()
-        signs['Mouse'] = self._create_sign_mouse()
-        signs['Fish'] = self._create_sign_fish()
+        builders['Animal'] = self._create_sign_animal
+        builders['Bird'] = self._create_sign_bird
+        builders['Cat'] = self._create_sign_cat
+        builders['Dog'] = self._create_sign_dog
+        builders['Cow'] = self._create_sign_cow
+        builders['Horse'] = self._create_sign_horse
+        builders['Mouse'] = self._create_sign_mouse
+        builders['Fish'] = self._create_sign_fish
         
         # Family
-        signs['Mother'] = self._create_sign_mother()
-        signs['Father'] = self._create_sign_father()
-        signs['Daughter'] = self._create_sign_daughter()
-        signs['Son'] = self._create_sign_son()
-        signs['Parent'] = self._create_sign_parent()
+        builders['Mother'] = self._create_sign_mother
+        builders['Father'] = self._create_sign_father
+        builders['Daughter'] = self._create_sign_daughter
+        builders['Son'] = self._create_sign_son
+        builders['Parent'] = self._create_sign_parent
         
         # Objects
-        signs['Chair'] = self._create_sign_chair()
-        signs['Table'] = self._create_sign_table()
-        signs['Bed'] = self._create_sign_bed()
-        signs['Bedroom'] = self._create_sign_bedroom()
-        signs['Door'] = self._create_sign_door()
-        signs['Window'] = self._create_sign_window()
+        builders['Chair'] = self._create_sign_chair
+        builders['Table'] = self._create_sign_table
+        builders['Bed'] = self._create_sign_bed
+        builders['Bedroom'] = self._create_sign_bedroom
+        builders['Door'] = self._create_sign_door
+        builders['Window'] = self._create_sign_window
         
         # Colors
-        signs['Black'] = self._create_sign_black()
-        signs['White'] = self._create_sign_white()
-        signs['Orange'] = self._create_sign_orange()
-        signs['Pink'] = self._create_sign_pink()
-        signs['Grey'] = self._create_sign_grey()
-        signs['Colour'] = self._create_sign_colour()
+        builders['Black'] = self._create_sign_black
+        builders['White'] = self._create_sign_white
+        builders['Orange'] = self._create_sign_orange
+        builders['Pink'] = self._create_sign_pink
+        builders['Grey'] = self._create_sign_grey
+        builders['Colour'] = self._create_sign_colour
         
         # Days
-        for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
-            signs[day] = self._create_sign_day(day)
-        signs['Today'] = self._create_sign_today()
+        for day in _DAY_NAMES:
+            builders[day] = partial(self._create_sign_day, day)
+        builders['Today'] = self._create_sign_today
         
         # Pronouns
-        signs['I'] = self._create_sign_i()
-        signs['You'] = self._create_sign_you()
-        signs['He'] = self._create_sign_he()
-        signs['She'] = self._create_sign_she()
-        signs['It'] = self._create_sign_it()
+        builders['I'] = self._create_sign_i
+        builders['You'] = self._create_sign_you
+        builders['He'] = self._create_sign_he
+        builders['She'] = self._create_sign_she
+        builders['It'] = self._create_sign_it
         
         # Other
-        signs['Blind'] = self._create_sign_blind()
-        signs['Deaf'] = self._create_sign_deaf()
-        signs['Dream'] = self._create_sign_dream()
-        signs['Loud'] = self._create_sign_loud()
-        signs['Quiet'] = self._create_sign_quiet()
+        builders['Blind'] = self._create_sign_blind
+        builders['Deaf'] = self._create_sign_deaf
+        builders['Dream'] = self._create_sign_dream
+        builders['Loud'] = self._create_sign_loud
+        builders['Quiet'] = self._create_sign_quiet
         
-        return signs
+        return builders
     
     # ============ NUMBER SIGNS ============
     
-    def _create_sign_0(self) -> Dict:
+    def _create_sign_0(self) -> _SignSpec:
         """Number 0 - Circle with fingers"""
-        landmarks = self._create_fist()
-        # Touch thumb to index forming a circle
-        landmarks[4]['x'] = landmarks[8]['x'] + 0.02
-        landmarks[4]['y'] = landmarks[8]['y']
-        return self._create_sign_data('0', landmarks, 'number')
+        return self._create_sign_data('0', _raw_sign_0(), 'number')
     
-    def _create_sign_1(self) -> Dict:
+    def _create_sign_1(self) -> _SignSpec:
         """Number 1 - Index finger extended"""
-        landmarks = self._create_fist()
-        # Extend index finger
-        landmarks[5]['y'] -= 0.02
-        landmarks[6]['y'] -= 0.06
-        landmarks[7]['y'] -= 0.10
-        landmarks[8]['y'] -= 0.14
-        for i in range(5, 9):
-            landmarks[i]['z'] = 0.0
-        return self._create_sign_data('1', landmarks, 'number')
-    
-    def _create_sign_2(self) -> Dict:
+        return self._create_sign_data('1', _raw_sign_1(), 'number')
+    
+    def _create_sign_2(self) -> _SignSpec:
         """Number 2 - Index and middle extended (V shape)"""
-        landmarks = self._create_fist()
-        # Extend index
-        for i in range(5, 9):
-            landmarks[i]['y'] -= 0.04 * (i - 4)
-            landmarks[i]['z'] = 0.0
-            landmarks[i]['x'] -= 0.02
-        # Extend middle
-        for i in range(9, 13):
-            landmarks[i]['y'] -= 0.04 * (i - 8)
-            landmarks[i]['z'] = 0.0
-            landmarks[i]['x'] += 0.02
-        return self._create_sign_data('2', landmarks, 'number')
-    
-    def _create_sign_3(self) -> Dict:
+        return self._create_sign_data('2', _raw_sign_2(), 'number')
+    
+    def _create_sign_3(self) -> _SignSpec:
         """Number 3 - Thumb, index, middle extended"""
-        landmarks = self._create_fist()
+        landmarks = self._fist_array()
         # Extend thumb outward
-        landmarks[4]['x'] -= 0.06
-        landmarks[4]['y'] -= 0.08
+        landmarks[4, 0] -= 0.06
+        landmarks[4, 1] -= 0.08
         # Extend index and middle
-        for i in range(5, 9):
-            landmarks[i]['y'] -= 0.04 * (i - 4)
-            landmarks[i]['z'] = 0.0
-        for i in range(9, 13):
-            landmarks[i]['y'] -= 0.04 * (i - 8)
-            landmarks[i]['z'] = 0.0
+        self._raise_fingers(landmarks, 5, 13)
         return self._create_sign_data('3', landmarks, 'number')
     
-    def _create_sign_4(self) -> Dict:
+    def _create_sign_4(self) -> _SignSpec:
         """Number 4 - Four fingers extended, thumb tucked"""
-        landmarks = self._create_base_hand()
+        landmarks = self._base_hand_array()
         # Tuck thumb
-        landmarks[4]['x'] = landmarks[5]['x'] + 0.02
-        landmarks[4]['y'] = landmarks[5]['y'] + 0.02
-        landmarks[4]['z'] = 0.04
+        landmarks[4, 0] = landmarks[5, 0] + 0.02
+        landmarks[4, 1] = landmarks[5, 1] + 0.02
+        landmarks[4, 2] = 0.04
         return self._create_sign_data('4', landmarks, 'number')
     
-    def _create_sign_5(self) -> Dict:
+    def _create_sign_5(self) -> _SignSpec:
         """Number 5 - All fingers extended (open hand)"""
-        return self._create_sign_data('5', self._create_base_hand(), 'number')
+        return self._create_sign_data('5', self._base_hand_array(), 'number')
     
-    def _create_sign_6(self) -> Dict:
+    def _create_sign_6(self) -> _SignSpec:
         """Number 6 - Fist with thumb extended upward (thumbs up style)"""
-        landmarks = []
-        x, y = 0.5, 0.5
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb pointing straight UP
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.10, 'z': 0.0})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.16, 'z': 0.0})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.22, 'z': 0.0})  # Thumb tip UP
-        # All other fingers tightly curled into fist
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.04, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.02, 'z': 0.08})
-            landmarks.append({'x': base_x + 0.03, 'y': y + 0.02, 'z': 0.06})
-        return self._create_sign_data('6', landmarks, 'number')
-    
-    def _create_sign_7(self) -> Dict:
+        return self._create_sign_data('6', self._number_array('6'), 'number')
+    
+    def _create_sign_7(self) -> _SignSpec:
         """Number 7 - Index and middle pointing sideways (gun shape)"""
-        landmarks = []
-        x, y = 0.5, 0.5
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb pointing up
-        landmarks.append({'x': x - 0.05, 'y': y - 0.03, 'z': 0.0})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.13, 'z': 0.0})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.18, 'z': 0.0})
-        # Index pointing LEFT (horizontal)
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.18, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.26, 'y': y - 0.06, 'z': 0.0})  # Index tip
-        # Middle also pointing LEFT (parallel to index)
-        landmarks.append({'x': x + 0.01, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.01, 'z': 0.0})
-        landmarks.append({'x': x - 0.23, 'y': y, 'z': 0.0})  # Middle tip
-        # Ring and pinky curled
-        for i, offset in enumerate([0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.05, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.03, 'z': 0.05})
-            landmarks.append({'x': base_x + 0.01, 'y': y, 'z': 0.07})
-            landmarks.append({'x': base_x + 0.02, 'y': y + 0.03, 'z': 0.05})
-        return self._create_sign_data('7', landmarks, 'number')
-    
-    def _create_sign_8(self) -> Dict:
+        return self._create_sign_data('7', self._number_array('7'), 'number')
+    
+    def _create_sign_8(self) -> _SignSpec:
         """Number 8 - Three fingers (index, middle, ring) extended, thumb and pinky touching"""
-        landmarks = []
-        x, y = 0.5, 0.5
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb curving to touch pinky
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.04, 'z': 0.04})
-        landmarks.append({'x': x + 0.02, 'y': y - 0.05, 'z': 0.05})
-        landmarks.append({'x': x + 0.06, 'y': y - 0.06, 'z': 0.04})  # Thumb tip touching pinky
-        # Index extended UP
-        landmarks.append({'x': x - 0.04, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.14, 'z': 0.0})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.20, 'z': 0.0})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.26, 'z': 0.0})
-        # Middle extended UP
-        landmarks.append({'x': x, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x, 'y': y - 0.15, 'z': 0.0})
-        landmarks.append({'x': x, 'y': y - 0.22, 'z': 0.0})
-        landmarks.append({'x': x, 'y': y - 0.28, 'z': 0.0})
-        # Ring extended UP
-        landmarks.append({'x': x + 0.04, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.05, 'y': y - 0.14, 'z': 0.0})
-        landmarks.append({'x': x + 0.06, 'y': y - 0.20, 'z': 0.0})
-        landmarks.append({'x': x + 0.06, 'y': y - 0.25, 'z': 0.0})
-        # Pinky bent to touch thumb
-        landmarks.append({'x': x + 0.08, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x + 0.09, 'y': y - 0.04, 'z': 0.03})
-        landmarks.append({'x': x + 0.08, 'y': y - 0.05, 'z': 0.05})
-        landmarks.append({'x': x + 0.06, 'y': y - 0.06, 'z': 0.04})  # Touching thumb
-        return self._create_sign_data('8', landmarks, 'number')
-    
-    def _create_sign_9(self) -> Dict:
+        return self._create_sign_data('8', self._number_array('8'), 'number')
+    
+    def _create_sign_9(self) -> _SignSpec:
         """Number 9 - Closed fist with pinky extended (like 'I love you' without thumb)"""
-        landmarks = []
-        x, y = 0.5, 0.5
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb curled into fist
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.05, 'z': 0.06})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.04, 'z': 0.06})
-        # Index, middle, ring all curled into tight fist
-        for i, offset in enumerate([-0.03, 0.01, 0.05]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.04, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.02, 'z': 0.08})
-            landmarks.append({'x': base_x + 0.03, 'y': y + 0.02, 'z': 0.06})
-        # Pinky extended straight UP
-        landmarks.append({'x': x + 0.09, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x + 0.10, 'y': y - 0.12, 'z': 0.0})
-        landmarks.append({'x': x + 0.11, 'y': y - 0.17, 'z': 0.0})
-        landmarks.append({'x': x + 0.12, 'y': y - 0.22, 'z': 0.0})  # Pinky tip UP
-        return self._create_sign_data('9', landmarks, 'number')
+        return self._create_sign_data('9', self._number_array('9'), 'number')
+    
+    def _number_array(self, name: str, x_offset: float = 0.5, y_offset: float = 0.5) -> np.ndarray:
+        """(21, 3) landmarks for a tabled number sign, wrist at (x_offset, y_offset)"""
+        return _NUMBER_TEMPLATES[name] + (x_offset, y_offset, 0.0)
     
     # ============ LETTER SIGNS ============
     
-    def _create_letter_sign(self, letter: str) -> Dict:
+    def _create_letter_sign(self, letter: str) -> _SignSpec:
         """Create fingerspelling sign for a letter"""
-        # Base hand configurations for ASL/ISL fingerspelling
-        letter_configs = {
-            'A': self._letter_a(),
-            'B': self._letter_b(),
-            'C': self._letter_c(),
-            'D': self._letter_d(),
-            'E': self._letter_e(),
-            'F': self._letter_f(),
-            'G': self._letter_g(),
-            'H': self._letter_h(),
-            'I': self._letter_i(),
-            'J': self._letter_j(),
-            'K': self._letter_k(),
-            'L': self._letter_l(),
-            'M': self._letter_m(),
-            'N': self._letter_n(),
-            'O': self._letter_o(),
-            'P': self._letter_p(),
-            'Q': self._letter_q(),
-            'R': self._letter_r(),
-            'S': self._letter_s(),
-            'T': self._letter_t(),
-            'U': self._letter_u(),
-            'V': self._letter_v(),
-            'W': self._letter_w(),
-            'X': self._letter_x(),
-            'Y': self._letter_y(),
-            'Z': self._letter_z()
-        }
-        
-        landmarks = letter_configs.get(letter, self._create_fist())
+        # Only the requested letter's handshape is built; unknown letters get a fist
+        builder = self._LETTER_BUILDERS.get(letter)
+        landmarks = builder(self) if builder is not None else self._fist_array()
         return self._create_sign_data(letter, landmarks, 'letter')
     
-    def _letter_a(self) -> List[Dict]:
+    def _raise_fingers(self, landmarks: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """Extend the adjacent fingers in landmarks[start:stop] straight up, in place"""
+        landmarks[start:stop, 1] -= np.resize(_FINGER_RAISE, stop - start)
+        landmarks[start:stop, 2] = 0.0
+        return landmarks
+    
+    def _letter_a(self) -> np.ndarray:
         """A - Fist with thumb to the side"""
-        landmarks = self._create_fist()
-        landmarks[4]['x'] -= 0.04
-        landmarks[4]['y'] = landmarks[5]['y']
+        landmarks = self._fist_array()
+        landmarks[4, 0] -= 0.04
+        landmarks[4, 1] = landmarks[5, 1]
         return landmarks
     
-    def _letter_b(self) -> List[Dict]:
+    def _letter_b(self) -> np.ndarray:
         """B - Flat hand, fingers together, thumb across palm"""
-        landmarks = self._create_base_hand()
-        landmarks[4] = {'x': 0.52, 'y': 0.45, 'z': 0.04}
+        landmarks = self._base_hand_array()
+        landmarks[4] = (0.52, 0.45, 0.04)
         return landmarks
     
-    def _letter_c(self) -> List[Dict]:
+    def _letter_c(self) -> np.ndarray:
         """C - Curved hand like holding a cup"""
-        landmarks = self._create_base_hand()
+        landmarks = self._base_hand_array()
         # Curve all fingers
-        for i in range(5, 21):
-            landmarks[i]['z'] = 0.03
-            landmarks[i]['x'] -= 0.02
-        landmarks[4]['x'] = 0.42
-        landmarks[4]['y'] = 0.42
+        landmarks[5:21, 2] = 0.03
+        landmarks[5:21, 0] -= 0.02
+        landmarks[4, 0] = 0.42
+        landmarks[4, 1] = 0.42
         return landmarks
     
-    def _letter_d(self) -> List[Dict]:
+    def _letter_d(self) -> np.ndarray:
         """D - Index up, others touch thumb"""
-        landmarks = self._create_sign_1()['keyframes'][0]['right_hand']
+        landmarks = _raw_sign_1().copy()
         # Curl middle, ring, pinky to touch thumb
-        landmarks[4]['y'] = landmarks[12]['y'] = landmarks[16]['y'] = landmarks[20]['y'] = 0.42
-        landmarks[4]['z'] = landmarks[12]['z'] = landmarks[16]['z'] = landmarks[20]['z'] = 0.03
+        landmarks[[4, 12, 16, 20], 1] = 0.42
+        landmarks[[4, 12, 16, 20], 2] = 0.03
         return landmarks
     
-    def _letter_e(self) -> List[Dict]:
+    def _letter_e(self) -> np.ndarray:
         """E - All fingers curled, thumb across"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.46, 'y': 0.42, 'z': 0.04}
+        landmarks = self._fist_array()
+        landmarks[4] = (0.46, 0.42, 0.04)
         return landmarks
     
-    def _letter_f(self) -> List[Dict]:
+    def _letter_f(self) -> np.ndarray:
         """F - Index and thumb touching in circle, others extended"""
-        landmarks = self._create_base_hand()
-        landmarks[4] = {'x': landmarks[8]['x'], 'y': landmarks[8]['y'], 'z': 0.02}
+        landmarks = self._base_hand_array()
+        landmarks[4] = (landmarks[8, 0], landmarks[8, 1], 0.02)
         return landmarks
     
-    def _letter_g(self) -> List[Dict]:
+    def _letter_g(self) -> np.ndarray:
         """G - Index pointing to side, thumb parallel"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.38, 'y': 0.42, 'z': 0.0}
-        landmarks[5]['y'] = landmarks[6]['y'] = 0.42
-        landmarks[7] = {'x': 0.38, 'y': 0.42, 'z': 0.0}
-        landmarks[8] = {'x': 0.35, 'y': 0.42, 'z': 0.0}
+        landmarks = self._fist_array()
+        landmarks[4] = (0.38, 0.42, 0.0)
+        landmarks[5:7, 1] = 0.42
+        landmarks[7] = (0.38, 0.42, 0.0)
+        landmarks[8] = (0.35, 0.42, 0.0)
         return landmarks
     
-    def _letter_h(self) -> List[Dict]:
+    def _letter_h(self) -> np.ndarray:
         """H - Index and middle pointing to side"""
         landmarks = self._letter_g()
-        landmarks[9]['y'] = landmarks[10]['y'] = 0.42
-        landmarks[11] = {'x': 0.38, 'y': 0.44, 'z': 0.0}
-        landmarks[12] = {'x': 0.35, 'y': 0.44, 'z': 0.0}
+        landmarks[9:11, 1] = 0.42
+        landmarks[11] = (0.38, 0.44, 0.0)
+        landmarks[12] = (0.35, 0.44, 0.0)
         return landmarks
     
-    def _letter_i(self) -> List[Dict]:
+    def _letter_i(self) -> np.ndarray:
         """I - Pinky extended, others closed"""
-        landmarks = self._create_fist()
-        for i in range(17, 21):
-            landmarks[i]['y'] -= 0.04 * (i - 16)
-            landmarks[i]['z'] = 0.0
+        landmarks = self._fist_array()
+        self._raise_fingers(landmarks, 17, 21)
         return landmarks
     
-    def _letter_j(self) -> List[Dict]:
-        """J - Like I but with motion (represented statically here)"""
-        return self._letter_i()
+    # J - Like I but with motion (represented statically here)
+    _letter_j = _letter_i
     
-    def _letter_k(self) -> List[Dict]:
+    def _letter_k(self) -> np.ndarray:
         """K - Index and middle up in V, thumb between them"""
-        landmarks = self._create_sign_2()['keyframes'][0]['right_hand']
-        landmarks[4] = {'x': 0.48, 'y': 0.38, 'z': 0.02}
+        landmarks = _raw_sign_2().copy()
+        landmarks[4] = (0.48, 0.38, 0.02)
         return landmarks
     
-    def _letter_l(self) -> List[Dict]:
+    def _letter_l(self) -> np.ndarray:
         """L - Index up, thumb out (L shape)"""
-        landmarks = self._create_fist()
+        landmarks = self._fist_array()
         # Index up
-        for i in range(5, 9):
-            landmarks[i]['y'] -= 0.04 * (i - 4)
-            landmarks[i]['z'] = 0.0
+        self._raise_fingers(landmarks, 5, 9)
         # Thumb out
-        landmarks[4] = {'x': 0.36, 'y': 0.50, 'z': 0.0}
+        landmarks[4] = (0.36, 0.50, 0.0)
         return landmarks
     
-    def _letter_m(self) -> List[Dict]:
+    def _letter_m(self) -> np.ndarray:
         """M - Three fingers over thumb"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.54, 'y': 0.44, 'z': 0.06}
-        for i in [8, 12, 16]:
-            landmarks[i]['z'] = 0.05
-            landmarks[i]['y'] = 0.44
+        landmarks = self._fist_array()
+        landmarks[4] = (0.54, 0.44, 0.06)
+        landmarks[[8, 12, 16], 2] = 0.05
+        landmarks[[8, 12, 16], 1] = 0.44
         return landmarks
     
-    def _letter_n(self) -> List[Dict]:
+    def _letter_n(self) -> np.ndarray:
         """N - Two fingers over thumb"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.52, 'y': 0.44, 'z': 0.06}
-        for i in [8, 12]:
-            landmarks[i]['z'] = 0.05
-            landmarks[i]['y'] = 0.44
+        landmarks = self._fist_array()
+        landmarks[4] = (0.52, 0.44, 0.06)
+        landmarks[[8, 12], 2] = 0.05
+        landmarks[[8, 12], 1] = 0.44
         return landmarks
     
-    def _letter_o(self) -> List[Dict]:
+    def _letter_o(self) -> np.ndarray:
         """O - All fingers touch thumb in circle"""
-        return self._create_sign_0()['keyframes'][0]['right_hand']
+        return _raw_sign_0().copy()
     
-    def _letter_p(self) -> List[Dict]:
-        """P - Like K but pointing down"""
-        landmarks = self._letter_k()
-        # Rotate hand downward
-        for lm in landmarks:
-            lm['y'] += 0.15
+    def _point_down(self, landmarks: np.ndarray) -> np.ndarray:
+        """Rotate a handshape downward (shared by P and Q)"""
+        landmarks[:, 1] += 0.15
         return landmarks
     
-    def _letter_q(self) -> List[Dict]:
+    def _letter_p(self) -> np.ndarray:
+        """P - Like K but pointing down"""
+        return self._point_down(self._letter_k())
+    
+    def _letter_q(self) -> np.ndarray:
         """Q - Like G but pointing down"""
-        landmarks = self._letter_g()
-        for lm in landmarks:
-            lm['y'] += 0.15
-        return landmarks
+        return self._point_down(self._letter_g())
     
-    def _letter_r(self) -> List[Dict]:
+    def _letter_r(self) -> np.ndarray:
         """R - Index and middle crossed"""
-        landmarks = self._create_sign_2()['keyframes'][0]['right_hand']
+        landmarks = _raw_sign_2().copy()
         # Cross index over middle
-        landmarks[8]['x'] = landmarks[12]['x']
+        landmarks[8, 0] = landmarks[12, 0]
         return landmarks
     
-    def _letter_s(self) -> List[Dict]:
+    def _letter_s(self) -> np.ndarray:
         """S - Fist with thumb across fingers"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.46, 'y': 0.44, 'z': 0.04}
+        landmarks = self._fist_array()
+        landmarks[4] = (0.46, 0.44, 0.04)
         return landmarks
     
-    def _letter_t(self) -> List[Dict]:
+    def _letter_t(self) -> np.ndarray:
         """T - Thumb between index and middle"""
-        landmarks = self._create_fist()
-        landmarks[4] = {'x': 0.48, 'y': 0.42, 'z': 0.05}
+        landmarks = self._fist_array()
+        landmarks[4] = (0.48, 0.42, 0.05)
         return landmarks
     
-    def _letter_u(self) -> List[Dict]:
+    def _letter_u(self) -> np.ndarray:
         """U - Index and middle together, pointing up"""
-        landmarks = self._create_fist()
-        for i in range(5, 13):
-            landmarks[i]['y'] -= 0.04 * ((i - 5) % 4 + 1)
-            landmarks[i]['z'] = 0.0
+        landmarks = self._fist_array()
+        self._raise_fingers(landmarks, 5, 13)
         # Keep them together
-        for i in range(9, 13):
-            landmarks[i]['x'] = landmarks[i-4]['x'] + 0.02
+        landmarks[9:13, 0] = landmarks[5:9, 0] + 0.02
         return landmarks
     
-    def _letter_v(self) -> List[Dict]:
+    def _letter_v(self) -> np.ndarray:
         """V - Index and middle spread (V shape)"""
-        return self._create_sign_2()['keyframes'][0]['right_hand']
+        return _raw_sign_2().copy()
     
-    def _letter_w(self) -> List[Dict]:
+    def _letter_w(self) -> np.ndarray:
         """W - Three fingers spread"""
-        landmarks = self._create_fist()
+        landmarks = self._fist_array()
         # Extend index, middle, ring spread apart
-        for i in range(5, 9):
-            landmarks[i]['y'] -= 0.04 * (i - 4)
-            landmarks[i]['x'] -= 0.03
-            landmarks[i]['z'] = 0.0
-        for i in range(9, 13):
-            landmarks[i]['y'] -= 0.04 * (i - 8)
-            landmarks[i]['z'] = 0.0
-        for i in range(13, 17):
-            landmarks[i]['y'] -= 0.04 * (i - 12)
-            landmarks[i]['x'] += 0.03
-            landmarks[i]['z'] = 0.0
+        self._raise_fingers(landmarks, 5, 17)
+        landmarks[5:9, 0] -= 0.03
+        landmarks[13:17, 0] += 0.03
         return landmarks
     
-    def _letter_x(self) -> List[Dict]:
+    def _letter_x(self) -> np.ndarray:
         """X - Index finger hooked"""
-        landmarks = self._create_fist()
-        landmarks[5]['y'] -= 0.02
-        landmarks[6]['y'] -= 0.04
-        landmarks[7] = {'x': 0.48, 'y': 0.40, 'z': 0.03}
-        landmarks[8] = {'x': 0.50, 'y': 0.42, 'z': 0.04}
+        landmarks = self._fist_array()
+        landmarks[5:7, 1] -= (0.02, 0.04)
+        landmarks[7] = (0.48, 0.40, 0.03)
+        landmarks[8] = (0.50, 0.42, 0.04)
         return landmarks
     
-    def _letter_y(self) -> List[Dict]:
+    def _letter_y(self) -> np.ndarray:
         """Y - Thumb and pinky extended"""
-        landmarks = self._create_fist()
+        landmarks = self._fist_array()
         # Extend thumb
-        landmarks[4] = {'x': 0.36, 'y': 0.46, 'z': 0.0}
+        landmarks[4] = (0.36, 0.46, 0.0)
         # Extend pinky
-        for i in range(17, 21):
-            landmarks[i]['y'] -= 0.04 * (i - 16)
-            landmarks[i]['z'] = 0.0
+        self._raise_fingers(landmarks, 17, 21)
         return landmarks
     
-    def _letter_z(self) -> List[Dict]:
+    def _letter_z(self) -> np.ndarray:
         """Z - Index finger traces Z (static representation)"""
-        return self._create_sign_1()['keyframes'][0]['right_hand']
+        return _raw_sign_1().copy()
+    
+    # Letter -> handshape builder, resolved once at class creation
+    _LETTER_BUILDERS = MappingProxyType({
+        'A': _letter_a, 'B': _letter_b, 'C': _letter_c, 'D': _letter_d, 'E': _letter_e, 'F': _letter_f,
+        'G': _letter_g, 'H': _letter_h, 'I': _letter_i, 'J': _letter_j, 'K': _letter_k, 'L': _letter_l,
+        'M': _letter_m, 'N': _letter_n, 'O': _letter_o, 'P': _letter_p, 'Q': _letter_q, 'R': _letter_r,
+        'S': _letter_s, 'T': _letter_t, 'U': _letter_u, 'V': _letter_v, 'W': _letter_w, 'X': _letter_x,
+        'Y': _letter_y, 'Z': _letter_z
+    })
     
     # ============ WORD SIGNS ============
     
-    def _create_sign_hello(self) -> Dict:
+    def _create_sign_hello(self) -> _SignSpec:
         """Hello - Open hand wave near forehead with spread fingers"""
-        landmarks = []
         x, y = 0.6, 0.28
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb pointing outward
-        landmarks.append({'x': x - 0.10, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.17, 'y': y - 0.10, 'z': 0.0})
-        landmarks.append({'x': x - 0.19, 'y': y - 0.14, 'z': 0.0})
+        thumb = [
+            (x - 0.10, y - 0.02, 0.0),
+            (x - 0.14, y - 0.06, 0.0),
+            (x - 0.17, y - 0.10, 0.0),
+            (x - 0.19, y - 0.14, 0.0)
+        ]
         # Fingers spread wide (wave position)
-        for i, offset in enumerate([-0.05, 0.0, 0.05, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x + (j * 0.01), 'y': y - 0.08 - (j * 0.05), 'z': 0.0})
-        start_hand = landmarks
-        end_hand = [{'x': lm['x'] + 0.08, 'y': lm['y'], 'z': lm['z']} for lm in landmarks]
-        return self._create_animated_sign('Hello', start_hand, end_hand, 
+        fingers = _finger_grid(x, y, [-0.05, 0.0, 0.05, 0.10], 0.08, 0.05, dx_step=0.01)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
+        return self._create_animated_sign('Hello', landmarks, shift=(0.08, 0.0, 0.0),
                                           motion='wave', facial='smile', 
                                           body_region='head')
     
-    def _create_sign_thank_you(self) -> Dict:
+    def _create_sign_thank_you(self) -> _SignSpec:
         """Thank you - Flat hand touching chin then moving outward"""
-        landmarks = []
         x, y = 0.5, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb tucked slightly
-        landmarks.append({'x': x - 0.06, 'y': y - 0.01, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.03, 'z': 0.03})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.05, 'z': 0.03})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.07, 'z': 0.03})
+        thumb = [
+            (x - 0.06, y - 0.01, 0.02),
+            (x - 0.08, y - 0.03, 0.03),
+            (x - 0.09, y - 0.05, 0.03),
+            (x - 0.10, y - 0.07, 0.03)
+        ]
         # Fingers together flat
-        for i, offset in enumerate([-0.03, 0.0, 0.03, 0.06]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.04), 'z': 0.01})
-        start_hand = landmarks
-        end_hand = [{'x': lm['x'], 'y': lm['y'] + 0.18, 'z': lm['z'] - 0.02} for lm in landmarks]
-        return self._create_animated_sign('Thank you', start_hand, end_hand,
+        fingers = _finger_grid(x, y, [-0.03, 0.0, 0.03, 0.06], 0.08, 0.04, 0.01)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
+        return self._create_animated_sign('Thank you', landmarks, shift=(0.0, 0.18, -0.02),
                                           motion='outward', facial='smile',
                                           body_region='chin')
     
-    def _create_sign_good_morning(self) -> Dict:
+    def _create_sign_good_morning(self) -> _SignSpec:
         """Good Morning - Sun rising motion with open hand"""
-        landmarks = []
         x, y = 0.35, 0.55
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb up and out
-        landmarks.append({'x': x - 0.08, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.12, 'y': y - 0.10, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.15, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.20, 'z': 0.0})
+        thumb = [
+            (x - 0.08, y - 0.04, 0.0),
+            (x - 0.12, y - 0.10, 0.0),
+            (x - 0.14, y - 0.15, 0.0),
+            (x - 0.15, y - 0.20, 0.0)
+        ]
         # Fingers spread upward like sun rays
-        for i, offset in enumerate([-0.04, 0.0, 0.04, 0.08]):
-            base_x = x + offset
-            for j in range(4):
-                angle = (i - 1.5) * 0.08
-                landmarks.append({'x': base_x + (j * angle * 0.3), 'y': y - 0.10 - (j * 0.05), 'z': 0.0})
-        start_hand = landmarks
-        end_hand = [{'x': lm['x'] + 0.15, 'y': lm['y'] - 0.25, 'z': lm['z']} for lm in landmarks]
-        return self._create_animated_sign('Good Morning', start_hand, end_hand,
+        angle = (np.arange(4) - 1.5) * 0.08
+        fingers = _finger_grid(x, y, _FINGERS_AT_M04, 0.10, 0.05)
+        fingers[:, 0] += (_JOINT_STEPS * angle[:, None] * 0.3).ravel()
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
+        return self._create_animated_sign('Good Morning', landmarks, shift=(0.15, -0.25, 0.0),
                                           motion='rising', facial='smile',
                                           body_region='chest')
     
-    def _create_sign_good_night(self) -> Dict:
+    def _create_sign_good_night(self) -> _SignSpec:
         """Good night - Palms together near tilted head"""
-        landmarks = []
         x, y = 0.55, 0.30
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb folded in (prayer position)
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.04})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.08, 'z': 0.04})
+        thumb = [
+            (x - 0.04, y - 0.02, 0.04),
+            (x - 0.05, y - 0.04, 0.05),
+            (x - 0.05, y - 0.06, 0.05),
+            (x - 0.04, y - 0.08, 0.04)
+        ]
         # Fingers together vertically
-        for i, offset in enumerate([-0.02, 0.0, 0.02, 0.04]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.045), 'z': 0.02})
+        fingers = _finger_grid(x, y, [-0.02, 0.0, 0.02, 0.04], 0.08, 0.045, 0.02)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Good night', landmarks, 'phrase',
                                       facial='calm', motion='closing',
                                       two_hands=True)
     
-    def _create_sign_how_are_you(self) -> Dict:
+    def _create_sign_how_are_you(self) -> _SignSpec:
         """How are you - Curved questioning hands"""
-        landmarks = []
         x, y = 0.45, 0.42
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb curved inward
-        landmarks.append({'x': x - 0.06, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.05, 'z': 0.03})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.08, 'z': 0.04})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.10, 'z': 0.05})
+        thumb = [
+            (x - 0.06, y - 0.02, 0.02),
+            (x - 0.09, y - 0.05, 0.03),
+            (x - 0.10, y - 0.08, 0.04),
+            (x - 0.09, y - 0.10, 0.05)
+        ]
         # Fingers curved like asking question
-        for i, offset in enumerate([-0.03, 0.0, 0.03, 0.06]):
-            base_x = x + offset
-            for j in range(4):
-                curve = 0.02 * j if j > 1 else 0
-                landmarks.append({'x': base_x + curve, 'y': y - 0.08 - (j * 0.04), 'z': 0.02 + curve})
-        start_hand = landmarks
-        end_hand = [{'x': lm['x'] + 0.12, 'y': lm['y'], 'z': lm['z']} for lm in landmarks]
-        return self._create_animated_sign('How are you', start_hand, end_hand,
+        curve = np.where(_JOINT_STEPS > 1, 0.02 * _JOINT_STEPS, 0.0)
+        fingers = _finger_grid(x, y, [-0.03, 0.0, 0.03, 0.06], 0.08, 0.04, 0.02 + curve)
+        fingers[:, 0] += np.tile(curve, 4)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
+        return self._create_animated_sign('How are you', landmarks, shift=(0.12, 0.0, 0.0),
                                           motion='questioning', facial='question',
                                           body_region='chest')
     
-    def _create_sign_happy(self) -> Dict:
+    def _create_sign_happy(self) -> _SignSpec:
         """Happy - Open palm patting chest upward"""
-        landmarks = []
         x, y = 0.48, 0.48
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended sideways
-        landmarks.append({'x': x - 0.09, 'y': y - 0.01, 'z': 0.0})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.03, 'z': 0.0})
-        landmarks.append({'x': x - 0.16, 'y': y - 0.05, 'z': 0.0})
-        landmarks.append({'x': x - 0.18, 'y': y - 0.06, 'z': 0.0})
+        thumb = [
+            (x - 0.09, y - 0.01, 0.0),
+            (x - 0.13, y - 0.03, 0.0),
+            (x - 0.16, y - 0.05, 0.0),
+            (x - 0.18, y - 0.06, 0.0)
+        ]
         # All fingers extended and slightly spread (brushing upward)
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.09 - (j * 0.045), 'z': 0.01})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, 0.09, 0.045, 0.01)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Happy', landmarks, 'emotion',
                                       facial='smile', motion='circular',
                                       body_region='chest')
     
-    def _create_sign_sad(self) -> Dict:
+    def _create_sign_sad(self) -> _SignSpec:
         """Sad - Both hands with fingers down, drooping from face"""
-        landmarks = []
         x, y = 0.5, 0.35
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb relaxed
-        landmarks.append({'x': x - 0.07, 'y': y + 0.01, 'z': 0.01})
-        landmarks.append({'x': x - 0.10, 'y': y + 0.03, 'z': 0.02})
-        landmarks.append({'x': x - 0.12, 'y': y + 0.06, 'z': 0.02})
-        landmarks.append({'x': x - 0.13, 'y': y + 0.09, 'z': 0.02})
+        thumb = [
+            (x - 0.07, y + 0.01, 0.01),
+            (x - 0.10, y + 0.03, 0.02),
+            (x - 0.12, y + 0.06, 0.02),
+            (x - 0.13, y + 0.09, 0.02)
+        ]
         # Fingers drooping downward (sad expression)
-        for i, offset in enumerate([-0.04, 0.0, 0.04, 0.08]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y + 0.02 + (j * 0.05), 'z': 0.02})
-        start_hand = landmarks
-        end_hand = [{'x': lm['x'], 'y': lm['y'] + 0.15, 'z': lm['z']} for lm in landmarks]
-        return self._create_animated_sign('Sad', start_hand, end_hand,
+        fingers = _finger_grid(x, y, _FINGERS_AT_M04, -0.02, -0.05, 0.02)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
+        return self._create_animated_sign('Sad', landmarks, shift=(0.0, 0.15, 0.0),
                                           motion='downward', facial='sad',
                                           body_region='face')
     
-    def _create_sign_beautiful(self) -> Dict:
+    def _create_sign_beautiful(self) -> _SignSpec:
         """Beautiful - Open hand circling the face"""
-        landmarks = []
         x, y = 0.55, 0.28
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended
-        landmarks.append({'x': x - 0.08, 'y': y - 0.03, 'z': 0.0})
-        landmarks.append({'x': x - 0.11, 'y': y - 0.07, 'z': 0.0})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.11, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.14, 'z': 0.0})
+        thumb = [
+            (x - 0.08, y - 0.03, 0.0),
+            (x - 0.11, y - 0.07, 0.0),
+            (x - 0.13, y - 0.11, 0.0),
+            (x - 0.14, y - 0.14, 0.0)
+        ]
         # Fingers together elegantly
-        for i, offset in enumerate([-0.02, 0.01, 0.04, 0.07]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.048), 'z': 0.0})
+        fingers = _finger_grid(x, y, [-0.02, 0.01, 0.04, 0.07], 0.08, 0.048)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Beautiful', landmarks, 'adjective',
                                       facial='smile', motion='circular',
                                       body_region='face')
     
-    def _create_sign_ugly(self) -> Dict:
+    def _create_sign_ugly(self) -> _SignSpec:
         """Ugly - Bent claw-like fingers crossing face"""
-        landmarks = []
         x, y = 0.48, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb bent
-        landmarks.append({'x': x - 0.06, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.05, 'z': 0.05})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.07, 'z': 0.06})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.08, 'z': 0.06})
+        thumb = [
+            (x - 0.06, y - 0.02, 0.03),
+            (x - 0.08, y - 0.05, 0.05),
+            (x - 0.07, y - 0.07, 0.06),
+            (x - 0.05, y - 0.08, 0.06)
+        ]
         # Fingers bent like claws
-        for i, offset in enumerate([-0.04, 0.0, 0.04, 0.08]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.12, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.10, 'z': 0.07})
-            landmarks.append({'x': base_x + 0.03, 'y': y - 0.06, 'z': 0.06})
+        curl = ((0.0, -0.08, 0.0), (0.0, -0.12, 0.04), (0.02, -0.10, 0.07), (0.03, -0.06, 0.06))
+        fingers = _curled_fingers(x, y, _FINGERS_AT_M04, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Ugly', landmarks, 'adjective',
                                       facial='frown', motion='across',
                                       body_region='face')
     
-    def _create_sign_alright(self) -> Dict:
+    def _create_sign_alright(self) -> _SignSpec:
         """Alright - OK gesture with thumb and index circle, other fingers up"""
-        landmarks = []
         x, y = 0.5, 0.45
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb touching index tip to form OK circle
-        landmarks.append({'x': x - 0.05, 'y': y - 0.03, 'z': 0.02})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.06, 'z': 0.03})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.09, 'z': 0.03})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.11, 'z': 0.02})  # Thumb tip
-        # Index finger curling to meet thumb
-        landmarks.append({'x': x - 0.03, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.11, 'z': 0.02})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.12, 'z': 0.03})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.11, 'z': 0.02})  # Meeting thumb
+        thumb = [
+            (x - 0.05, y - 0.03, 0.02),
+            (x - 0.07, y - 0.06, 0.03),
+            (x - 0.06, y - 0.09, 0.03),
+            (x - 0.04, y - 0.11, 0.02)  # Thumb tip
+        ]
+        fingers = [
+            # Index finger curling to meet thumb
+            (x - 0.03, y - 0.08, 0.0),
+            (x - 0.04, y - 0.11, 0.02),
+            (x - 0.05, y - 0.12, 0.03),
+            (x - 0.04, y - 0.11, 0.02)  # Meeting thumb
+        ]
         # Middle, ring, pinky extended upward
-        for i, offset in enumerate([0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.05), 'z': 0.0})
+        others = _finger_grid(x, y, [0.01, 0.05, 0.09], 0.08, 0.05)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Alright', landmarks, 'expression',
                                       facial='neutral', motion='static')
     
-    def _create_sign_pleased(self) -> Dict:
+    def _create_sign_pleased(self) -> _SignSpec:
         """Pleased - Both hands flat on chest moving outward"""
-        landmarks = []
         x, y = 0.52, 0.50
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb tucked under
-        landmarks.append({'x': x - 0.05, 'y': y + 0.01, 'z': 0.03})
-        landmarks.append({'x': x - 0.06, 'y': y + 0.02, 'z': 0.04})
-        landmarks.append({'x': x - 0.05, 'y': y + 0.03, 'z': 0.04})
-        landmarks.append({'x': x - 0.03, 'y': y + 0.03, 'z': 0.03})
+        thumb = [
+            (x - 0.05, y + 0.01, 0.03),
+            (x - 0.06, y + 0.02, 0.04),
+            (x - 0.05, y + 0.03, 0.04),
+            (x - 0.03, y + 0.03, 0.03)
+        ]
         # Fingers flat together pointing forward
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.06 - (j * 0.04), 'z': 0.04})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M02, 0.06, 0.04, 0.04)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Pleased', landmarks, 'emotion',
                                       facial='smile', motion='outward',
                                       body_region='chest')
     
     # ============ ANIMAL SIGNS ============
     
-    def _create_sign_animal(self) -> Dict:
+    def _create_sign_animal(self) -> _SignSpec:
         """Animal - Fingertips on chest with rocking claw motion"""
-        landmarks = []
         x, y = 0.5, 0.52
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb curled
-        landmarks.append({'x': x - 0.05, 'y': y - 0.03, 'z': 0.03})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.08, 'z': 0.06})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.09, 'z': 0.05})
+        thumb = [
+            (x - 0.05, y - 0.03, 0.03),
+            (x - 0.06, y - 0.06, 0.05),
+            (x - 0.05, y - 0.08, 0.06),
+            (x - 0.03, y - 0.09, 0.05)
+        ]
         # All fingers curved like claws touching chest
-        for i, offset in enumerate([-0.04, 0.0, 0.04, 0.08]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.10, 'z': 0.06})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.10})
-            landmarks.append({'x': base_x, 'y': y - 0.05, 'z': 0.08})
+        curl = ((0.0, -0.07, 0.0), (0.0, -0.10, 0.06), (0.0, -0.08, 0.10), (0.0, -0.05, 0.08))
+        fingers = _curled_fingers(x, y, _FINGERS_AT_M04, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Animal', landmarks, 'noun',
                                       motion='rocking', body_region='chest')
     
-    def _create_sign_bird(self) -> Dict:
+    def _create_sign_bird(self) -> _SignSpec:
         """Bird - Index and thumb forming beak opening/closing near mouth"""
-        landmarks = []
         x, y = 0.48, 0.33
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb forming beak - upper part
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.11, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.13, 'z': 0.0})  # Beak tip
-        # Index forming beak - lower part
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.10, 'z': 0.0})
-        landmarks.append({'x': x - 0.12, 'y': y - 0.13, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.14, 'z': 0.01})  # Meeting thumb
+        thumb = [
+            (x - 0.06, y - 0.04, 0.0),
+            (x - 0.10, y - 0.08, 0.0),
+            (x - 0.13, y - 0.11, 0.0),
+            (x - 0.15, y - 0.13, 0.0)  # Beak tip
+        ]
+        fingers = [
+            # Index forming beak - lower part
+            (x - 0.04, y - 0.06, 0.0),
+            (x - 0.08, y - 0.10, 0.0),
+            (x - 0.12, y - 0.13, 0.0),
+            (x - 0.15, y - 0.14, 0.01)  # Meeting thumb
+        ]
         # Other fingers curled in
-        for i, offset in enumerate([0.0, 0.04, 0.08]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        others = _curled_fingers(x, y, [0.0, 0.04, 0.08], _CURL_TUCKED)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Bird', landmarks, 'noun',
                                       motion='opening_closing', body_region='mouth')
     
-    def _create_sign_cat(self) -> Dict:
+    def _create_sign_cat(self) -> _SignSpec:
         """Cat - Pinching whiskers at cheeks, pulling outward"""
-        landmarks = []
         x, y = 0.52, 0.34
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb and index pinched for whisker
-        landmarks.append({'x': x - 0.05, 'y': y - 0.03, 'z': 0.01})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.06, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.10, 'z': 0.01})  # Whisker pinch
-        # Index near thumb
-        landmarks.append({'x': x - 0.03, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.09, 'z': 0.01})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.11, 'z': 0.01})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.11, 'z': 0.01})
+        thumb = [
+            (x - 0.05, y - 0.03, 0.01),
+            (x - 0.07, y - 0.06, 0.02),
+            (x - 0.08, y - 0.08, 0.02),
+            (x - 0.08, y - 0.10, 0.01)  # Whisker pinch
+        ]
+        fingers = [
+            # Index near thumb
+            (x - 0.03, y - 0.06, 0.0),
+            (x - 0.05, y - 0.09, 0.01),
+            (x - 0.07, y - 0.11, 0.01),
+            (x - 0.08, y - 0.11, 0.01)
+        ]
         # Middle, ring, pinky loosely curled
-        for i, offset in enumerate([0.0, 0.04, 0.08]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.09, 'z': 0.03})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.08, 'z': 0.05})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.05, 'z': 0.04})
+        curl = ((0.0, -0.06, 0.0), (0.0, -0.09, 0.03), (0.01, -0.08, 0.05), (0.02, -0.05, 0.04))
+        others = _curled_fingers(x, y, [0.0, 0.04, 0.08], curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Cat', landmarks, 'noun',
                                       motion='outward', body_region='cheek',
                                       two_hands=True)
     
-    def _create_sign_dog(self) -> Dict:
+    def _create_sign_dog(self) -> _SignSpec:
         """Dog - Snapping fingers with patting thigh motion"""
-        landmarks = []
         x, y = 0.5, 0.58
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb ready to snap
-        landmarks.append({'x': x - 0.06, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.05, 'z': 0.03})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.08, 'z': 0.04})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.09, 'z': 0.04})
-        # Index and middle extended for snapping
-        landmarks.append({'x': x - 0.03, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.12, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.16, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.19, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.12, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.16, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.19, 'z': 0.0})
+        thumb = [
+            (x - 0.06, y - 0.02, 0.02),
+            (x - 0.08, y - 0.05, 0.03),
+            (x - 0.07, y - 0.08, 0.04),
+            (x - 0.05, y - 0.09, 0.04)
+        ]
+        fingers = [
+            # Index and middle extended for snapping
+            (x - 0.03, y - 0.08, 0.0),
+            (x - 0.03, y - 0.12, 0.0),
+            (x - 0.03, y - 0.16, 0.0),
+            (x - 0.03, y - 0.19, 0.0),
+            (x + 0.01, y - 0.08, 0.0),
+            (x + 0.01, y - 0.12, 0.0),
+            (x + 0.01, y - 0.16, 0.0),
+            (x + 0.01, y - 0.19, 0.0)
+        ]
         # Ring and pinky curled
-        for i, offset in enumerate([0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.09, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.07, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.04, 'z': 0.05})
+        curl = ((0.0, -0.07, 0.0), (0.0, -0.09, 0.04), (0.01, -0.07, 0.06), (0.01, -0.04, 0.05))
+        others = _curled_fingers(x, y, [0.05, 0.09], curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Dog', landmarks, 'noun',
                                       motion='patting', body_region='thigh')
     
-    def _create_sign_cow(self) -> Dict:
+    def _create_sign_cow(self) -> _SignSpec:
         """Cow - Y handshape at temples representing horns"""
-        landmarks = []
         x, y = 0.55, 0.25
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended out for horn
-        landmarks.append({'x': x - 0.08, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.05, 'z': 0.0})
-        landmarks.append({'x': x - 0.17, 'y': y - 0.09, 'z': 0.0})
-        landmarks.append({'x': x - 0.20, 'y': y - 0.12, 'z': 0.0})
+        thumb = [
+            (x - 0.08, y - 0.02, 0.0),
+            (x - 0.13, y - 0.05, 0.0),
+            (x - 0.17, y - 0.09, 0.0),
+            (x - 0.20, y - 0.12, 0.0)
+        ]
         # Index, middle, ring curled in fist
-        for i, offset in enumerate([-0.04, 0.0, 0.04]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        fingers = _curled_fingers(x, y, [-0.04, 0.0, 0.04], _CURL_TUCKED)
         # Pinky extended for other horn
-        landmarks.append({'x': x + 0.08, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x + 0.10, 'y': y - 0.10, 'z': 0.0})
-        landmarks.append({'x': x + 0.12, 'y': y - 0.14, 'z': 0.0})
-        landmarks.append({'x': x + 0.14, 'y': y - 0.17, 'z': 0.0})
+        pinky = [
+            (x + 0.08, y - 0.06, 0.0),
+            (x + 0.10, y - 0.10, 0.0),
+            (x + 0.12, y - 0.14, 0.0),
+            (x + 0.14, y - 0.17, 0.0)
+        ]
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, pinky)
         return self._create_sign_data('Cow', landmarks, 'noun',
                                       motion='twisting', body_region='temple')
     
-    def _create_sign_horse(self) -> Dict:
+    def _create_sign_horse(self) -> _SignSpec:
         """Horse - Thumb at temple with fingers flapping like ears"""
-        landmarks = []
         x, y = 0.58, 0.26
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb touching temple
-        landmarks.append({'x': x - 0.06, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.06, 'z': 0.06})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.08, 'z': 0.06})
-        # Index and middle extended upward as ears
-        landmarks.append({'x': x - 0.03, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.14, 'z': 0.0})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.19, 'z': 0.0})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.23, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.14, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.19, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.23, 'z': 0.0})
+        thumb = [
+            (x - 0.06, y - 0.02, 0.03),
+            (x - 0.08, y - 0.04, 0.05),
+            (x - 0.09, y - 0.06, 0.06),
+            (x - 0.09, y - 0.08, 0.06)
+        ]
+        fingers = [
+            # Index and middle extended upward as ears
+            (x - 0.03, y - 0.08, 0.0),
+            (x - 0.04, y - 0.14, 0.0),
+            (x - 0.05, y - 0.19, 0.0),
+            (x - 0.06, y - 0.23, 0.0),
+            (x + 0.01, y - 0.08, 0.0),
+            (x + 0.01, y - 0.14, 0.0),
+            (x + 0.01, y - 0.19, 0.0),
+            (x + 0.01, y - 0.23, 0.0)
+        ]
         # Ring and pinky curled
-        for i, offset in enumerate([0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        others = _curled_fingers(x, y, [0.05, 0.09], _CURL_TUCKED)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Horse', landmarks, 'noun',
                                       motion='flapping', body_region='temple')
     
-    def _create_sign_mouse(self) -> Dict:
+    def _create_sign_mouse(self) -> _SignSpec:
         """Mouse - Index finger brushing nose repeatedly"""
-        landmarks = []
         x, y = 0.5, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb relaxed
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.04, 'z': 0.03})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.06, 'z': 0.03})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.03})
-        # Index extended pointing at nose
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.12, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.17, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.21, 'z': 0.0})
+        thumb = [
+            (x - 0.05, y - 0.02, 0.02),
+            (x - 0.07, y - 0.04, 0.03),
+            (x - 0.08, y - 0.06, 0.03),
+            (x - 0.08, y - 0.08, 0.03)
+        ]
+        fingers = [
+            # Index extended pointing at nose
+            (x - 0.02, y - 0.06, 0.0),
+            (x - 0.02, y - 0.12, 0.0),
+            (x - 0.02, y - 0.17, 0.0),
+            (x - 0.02, y - 0.21, 0.0)
+        ]
         # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        others = _curled_fingers(x, y, _TUCKED_AT_02, _CURL_TUCKED)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Mouse', landmarks, 'noun',
                                       motion='brushing', body_region='nose')
     
-    def _create_sign_fish(self) -> Dict:
+    def _create_sign_fish(self) -> _SignSpec:
         """Fish - Flat hand making swimming wave motion"""
-        landmarks = []
         x, y = 0.5, 0.52
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb alongside hand
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.05, 'z': 0.02})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.08, 'z': 0.02})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.10, 'z': 0.02})
+        thumb = [
+            (x - 0.05, y - 0.02, 0.02),
+            (x - 0.06, y - 0.05, 0.02),
+            (x - 0.06, y - 0.08, 0.02),
+            (x - 0.05, y - 0.10, 0.02)
+        ]
         # Fingers together flat like fish body, slight wave
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            wave = 0.01 if i % 2 == 0 else -0.01
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.04), 'z': wave})
+        wave = np.array([0.01, -0.01, 0.01, -0.01])
+        fingers = _finger_grid(x, y, _FINGERS_AT_M02, 0.08, 0.04, wave[:, None])
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Fish', landmarks, 'noun',
                                       motion='swimming', body_region='neutral')
     
     # ============ FAMILY SIGNS ============
     
-    def _create_sign_mother(self) -> Dict:
+    def _create_sign_mother(self) -> _SignSpec:
         """Mother - Open hand with thumb touching chin"""
-        landmarks = []
         x, y = 0.5, 0.36
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb touching chin
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.04})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.06})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.11, 'z': 0.07})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.13, 'z': 0.07})  # On chin
+        thumb = [
+            (x - 0.06, y - 0.04, 0.04),
+            (x - 0.08, y - 0.08, 0.06),
+            (x - 0.09, y - 0.11, 0.07),
+            (x - 0.09, y - 0.13, 0.07)  # On chin
+        ]
         # Fingers spread open
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.045), 'z': 0.0})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, 0.08, 0.045)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Mother', landmarks, 'noun',
                                       facial='smile', body_region='chin')
     
-    def _create_sign_father(self) -> Dict:
+    def _create_sign_father(self) -> _SignSpec:
         """Father - Open hand with thumb touching forehead"""
-        landmarks = []
         x, y = 0.5, 0.26
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb touching forehead
-        landmarks.append({'x': x - 0.06, 'y': y - 0.03, 'z': 0.04})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.06, 'z': 0.06})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.09, 'z': 0.07})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.11, 'z': 0.07})  # On forehead
+        thumb = [
+            (x - 0.06, y - 0.03, 0.04),
+            (x - 0.08, y - 0.06, 0.06),
+            (x - 0.09, y - 0.09, 0.07),
+            (x - 0.09, y - 0.11, 0.07)  # On forehead
+        ]
         # Fingers spread open
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.045), 'z': 0.0})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, 0.08, 0.045)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Father', landmarks, 'noun',
                                       facial='neutral', body_region='forehead')
     
-    def _create_sign_daughter(self) -> Dict:
+    def _create_sign_daughter(self) -> _SignSpec:
         """Daughter - Girl sign (chin) + cradling baby motion"""
-        landmarks = []
         x, y = 0.52, 0.42
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb along side
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.01})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.04, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.06, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.02})
+        thumb = _THUMB_ALONG_SIDE + (x, y, 0.0)
         # Fingers curved as if cradling
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x - 0.01, 'y': y - 0.10, 'z': 0.03})
-            landmarks.append({'x': base_x - 0.02, 'y': y - 0.12, 'z': 0.05})
-            landmarks.append({'x': base_x - 0.02, 'y': y - 0.13, 'z': 0.06})
+        curl = ((0.0, -0.06, 0.0), (-0.01, -0.10, 0.03), (-0.02, -0.12, 0.05), (-0.02, -0.13, 0.06))
+        fingers = _curled_fingers(x, y, _FINGERS_AT_M03, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Daughter', landmarks, 'noun',
                                       motion='cradling', body_region='chin')
     
-    def _create_sign_son(self) -> Dict:
+    def _create_sign_son(self) -> _SignSpec:
         """Son - Boy sign (forehead) + cradling motion"""
-        landmarks = []
         x, y = 0.52, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb along side
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.01})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.04, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.06, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.02})
+        thumb = _THUMB_ALONG_SIDE + (x, y, 0.0)
         # Fingers in salute position at forehead
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.12, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.16, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.19, 'z': 0.0})
+        curl = ((0.0, -0.07, 0.0), (0.0, -0.12, 0.0), (0.0, -0.16, 0.0), (0.0, -0.19, 0.0))
+        fingers = _curled_fingers(x, y, _FINGERS_AT_M02, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Son', landmarks, 'noun',
                                       motion='cradling', body_region='forehead')
     
-    def _create_sign_parent(self) -> Dict:
+    def _create_sign_parent(self) -> _SignSpec:
         """Parent - Alternating between forehead and chin touch"""
-        landmarks = []
         x, y = 0.5, 0.34
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended
-        landmarks.append({'x': x - 0.07, 'y': y - 0.03, 'z': 0.03})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.07, 'z': 0.04})
-        landmarks.append({'x': x - 0.12, 'y': y - 0.10, 'z': 0.05})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.12, 'z': 0.05})
+        thumb = [
+            (x - 0.07, y - 0.03, 0.03),
+            (x - 0.10, y - 0.07, 0.04),
+            (x - 0.12, y - 0.10, 0.05),
+            (x - 0.13, y - 0.12, 0.05)
+        ]
         # Fingers together
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.042), 'z': 0.02})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M02, 0.08, 0.042, 0.02)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Parent', landmarks, 'noun',
                                       motion='alternating', body_region='face',
                                       two_hands=True)
     
     # ============ OBJECT SIGNS ============
     
-    def _create_sign_chair(self) -> Dict:
+    def _create_sign_chair(self) -> _SignSpec:
         """Chair - Two bent fingers (legs) sitting on horizontal thumb"""
-        landmarks = []
         x, y = 0.5, 0.52
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb horizontal as seat
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.17, 'y': y - 0.04, 'z': 0.0})
-        # Index and middle bent down (legs)
-        landmarks.append({'x': x - 0.03, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.12, 'z': 0.03})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.10, 'z': 0.06})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.06, 'z': 0.06})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.12, 'z': 0.03})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.10, 'z': 0.06})
-        landmarks.append({'x': x + 0.01, 'y': y - 0.06, 'z': 0.06})
+        thumb = [
+            (x - 0.06, y - 0.04, 0.0),
+            (x - 0.10, y - 0.04, 0.0),
+            (x - 0.14, y - 0.04, 0.0),
+            (x - 0.17, y - 0.04, 0.0)
+        ]
+        fingers = [
+            # Index and middle bent down (legs)
+            (x - 0.03, y - 0.08, 0.0),
+            (x - 0.03, y - 0.12, 0.03),
+            (x - 0.03, y - 0.10, 0.06),
+            (x - 0.03, y - 0.06, 0.06),
+            (x + 0.01, y - 0.08, 0.0),
+            (x + 0.01, y - 0.12, 0.03),
+            (x + 0.01, y - 0.10, 0.06),
+            (x + 0.01, y - 0.06, 0.06)
+        ]
         # Ring and pinky curled
-        for i, offset in enumerate([0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        others = _curled_fingers(x, y, [0.05, 0.09], _CURL_TUCKED)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Chair', landmarks, 'noun',
                                       motion='tapping', two_hands=True)
     
-    def _create_sign_table(self) -> Dict:
+    def _create_sign_table(self) -> _SignSpec:
         """Table - Both flat hands forming horizontal surface"""
-        landmarks = []
         x, y = 0.5, 0.55
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb tucked under
-        landmarks.append({'x': x - 0.04, 'y': y + 0.01, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y + 0.02, 'z': 0.04})
-        landmarks.append({'x': x - 0.04, 'y': y + 0.03, 'z': 0.04})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.03, 'z': 0.03})
+        thumb = [
+            (x - 0.04, y + 0.01, 0.03),
+            (x - 0.05, y + 0.02, 0.04),
+            (x - 0.04, y + 0.03, 0.04),
+            (x - 0.02, y + 0.03, 0.03)
+        ]
         # All fingers flat, horizontal (palm down)
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.04 - (j * 0.03), 'z': 0.08})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M02, 0.04, 0.03, 0.08)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Table', landmarks, 'noun',
                                       motion='patting', two_hands=True)
     
-    def _create_sign_bed(self) -> Dict:
+    def _create_sign_bed(self) -> _SignSpec:
         """Bed - Tilted head on hands (sleeping gesture)"""
-        landmarks = []
         x, y = 0.58, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb along palm
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.06, 'z': 0.03})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.07, 'z': 0.03})
+        thumb = [
+            (x - 0.04, y - 0.02, 0.02),
+            (x - 0.05, y - 0.04, 0.03),
+            (x - 0.05, y - 0.06, 0.03),
+            (x - 0.04, y - 0.07, 0.03)
+        ]
         # Fingers together, tilted as pillow
-        for i, offset in enumerate([-0.02, 0.01, 0.04, 0.07]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x + (j * 0.02), 'y': y - 0.06 - (j * 0.03), 'z': 0.02})
+        fingers = _finger_grid(x, y, [-0.02, 0.01, 0.04, 0.07], 0.06, 0.03, 0.02, dx_step=0.02)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Bed', landmarks, 'noun',
                                       facial='calm', motion='resting',
                                       body_region='head')
     
-    def _create_sign_bedroom(self) -> Dict:
+    def _create_sign_bedroom(self) -> _SignSpec:
         """Bedroom - Bed sign + box/room outline"""
-        landmarks = []
         x, y = 0.5, 0.48
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended
-        landmarks.append({'x': x - 0.07, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.11, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.16, 'y': y - 0.08, 'z': 0.0})
-        # Fingers making L shape for room corner
-        landmarks.append({'x': x - 0.03, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.13, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.17, 'z': 0.0})
-        landmarks.append({'x': x - 0.03, 'y': y - 0.20, 'z': 0.0})
+        thumb = [
+            (x - 0.07, y - 0.02, 0.0),
+            (x - 0.11, y - 0.04, 0.0),
+            (x - 0.14, y - 0.06, 0.0),
+            (x - 0.16, y - 0.08, 0.0)
+        ]
+        fingers = [
+            # Fingers making L shape for room corner
+            (x - 0.03, y - 0.08, 0.0),
+            (x - 0.03, y - 0.13, 0.0),
+            (x - 0.03, y - 0.17, 0.0),
+            (x - 0.03, y - 0.20, 0.0)
+        ]
         # Other fingers curved inward
-        for i, offset in enumerate([0.01, 0.05, 0.09]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.10, 'z': 0.03})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.08, 'z': 0.05})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.05, 'z': 0.04})
+        curl = ((0.0, -0.07, 0.0), (0.0, -0.10, 0.03), (0.01, -0.08, 0.05), (0.02, -0.05, 0.04))
+        others = _curled_fingers(x, y, [0.01, 0.05, 0.09], curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Bedroom', landmarks, 'noun',
                                       motion='box_shape', two_hands=True)
     
-    def _create_sign_door(self) -> Dict:
+    def _create_sign_door(self) -> _SignSpec:
         """Door - Flat hand swinging open like door"""
-        landmarks_start = []
-        landmarks_end = []
         x, y = 0.42, 0.48
         # Start position - closed door
-        landmarks_start.append({'x': x, 'y': y, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.02})
-        landmarks_start.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.03})
-        landmarks_start.append({'x': x - 0.06, 'y': y - 0.06, 'z': 0.03})
-        landmarks_start.append({'x': x - 0.05, 'y': y - 0.07, 'z': 0.02})
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks_start.append({'x': base_x, 'y': y - 0.08 - (j * 0.04), 'z': 0.0})
+        thumb = [
+            (x - 0.05, y - 0.02, 0.02),
+            (x - 0.06, y - 0.04, 0.03),
+            (x - 0.06, y - 0.06, 0.03),
+            (x - 0.05, y - 0.07, 0.02)
+        ]
+        fingers = _finger_grid(x, y, _FINGERS_AT_M02, 0.08, 0.04)
+        landmarks_start = _landmarks_array((x, y, 0.0), thumb, fingers)
         # End position - open door (rotated)
-        landmarks_end.append({'x': x + 0.18, 'y': y, 'z': 0.0})
-        landmarks_end.append({'x': x + 0.13, 'y': y - 0.02, 'z': 0.02})
-        landmarks_end.append({'x': x + 0.12, 'y': y - 0.04, 'z': 0.03})
-        landmarks_end.append({'x': x + 0.12, 'y': y - 0.06, 'z': 0.03})
-        landmarks_end.append({'x': x + 0.13, 'y': y - 0.07, 'z': 0.02})
-        for i, offset in enumerate([0.16, 0.20, 0.24, 0.28]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks_end.append({'x': base_x, 'y': y - 0.08 - (j * 0.04), 'z': 0.04})
+        thumb = [
+            (x + 0.13, y - 0.02, 0.02),
+            (x + 0.12, y - 0.04, 0.03),
+            (x + 0.12, y - 0.06, 0.03),
+            (x + 0.13, y - 0.07, 0.02)
+        ]
+        fingers = _finger_grid(x, y, [0.16, 0.20, 0.24, 0.28], 0.08, 0.04, 0.04)
+        landmarks_end = _landmarks_array((x + 0.18, y, 0.0), thumb, fingers)
         return self._create_animated_sign('Door', landmarks_start, landmarks_end,
                                           motion='opening')
     
-    def _create_sign_window(self) -> Dict:
+    def _create_sign_window(self) -> _SignSpec:
         """Window - Flat hands sliding up and down"""
-        landmarks = []
         x, y = 0.5, 0.42
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb at side
-        landmarks.append({'x': x - 0.06, 'y': y - 0.02, 'z': 0.01})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.04, 'z': 0.01})
-        landmarks.append({'x': x - 0.09, 'y': y - 0.06, 'z': 0.01})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.07, 'z': 0.01})
+        thumb = [
+            (x - 0.06, y - 0.02, 0.01),
+            (x - 0.08, y - 0.04, 0.01),
+            (x - 0.09, y - 0.06, 0.01),
+            (x - 0.10, y - 0.07, 0.01)
+        ]
         # Fingers spread forming window frame
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.07 - (j * 0.05), 'z': 0.0})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, 0.07, 0.05)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Window', landmarks, 'noun',
                                       motion='sliding', two_hands=True)
     
     # ============ COLOR SIGNS ============
     
-    def _create_sign_black(self) -> Dict:
+    def _create_sign_black(self) -> _SignSpec:
         """Black - Index finger drawing line across forehead"""
-        landmarks = []
         x, y = 0.45, 0.24
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.04})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.05, 'z': 0.04})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.05, 'z': 0.03})
-        # Index extended horizontally across forehead
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.06, 'z': 0.0})
+        thumb = [
+            (x - 0.04, y - 0.02, 0.03),
+            (x - 0.05, y - 0.04, 0.04),
+            (x - 0.04, y - 0.05, 0.04),
+            (x - 0.02, y - 0.05, 0.03)
+        ]
+        fingers = [
+            # Index extended horizontally across forehead
+            (x - 0.02, y - 0.06, 0.0),
+            (x - 0.06, y - 0.06, 0.0),
+            (x - 0.10, y - 0.06, 0.0),
+            (x - 0.14, y - 0.06, 0.0)
+        ]
         # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.05, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.05, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.02, 'z': 0.05})
+        others = _curled_fingers(x, y, _TUCKED_AT_02, _CURL_TUCKED_HIGH)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Black', landmarks, 'adjective',
                                       motion='across', body_region='forehead')
     
-    def _create_sign_white(self) -> Dict:
+    def _create_sign_white(self) -> _SignSpec:
         """White - Open hand pulling away from chest"""
-        landmarks_start = []
-        landmarks_end = []
         x, y = 0.5, 0.48
         # Start - hand on chest
-        landmarks_start.append({'x': x, 'y': y, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.07, 'y': y - 0.02, 'z': 0.05})
-        landmarks_start.append({'x': x - 0.10, 'y': y - 0.04, 'z': 0.08})
-        landmarks_start.append({'x': x - 0.12, 'y': y - 0.06, 'z': 0.10})
-        landmarks_start.append({'x': x - 0.13, 'y': y - 0.08, 'z': 0.10})
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks_start.append({'x': base_x, 'y': y - 0.07 - (j * 0.04), 'z': 0.08})
+        thumb = [
+            (x - 0.07, y - 0.02, 0.05),
+            (x - 0.10, y - 0.04, 0.08),
+            (x - 0.12, y - 0.06, 0.10),
+            (x - 0.13, y - 0.08, 0.10)
+        ]
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, 0.07, 0.04, 0.08)
+        landmarks_start = _landmarks_array((x, y, 0.0), thumb, fingers)
         # End - hand pulled away
-        landmarks_end.append({'x': x, 'y': y + 0.05, 'z': 0.0})
-        landmarks_end.append({'x': x - 0.07, 'y': y + 0.03, 'z': 0.0})
-        landmarks_end.append({'x': x - 0.10, 'y': y + 0.01, 'z': 0.0})
-        landmarks_end.append({'x': x - 0.12, 'y': y - 0.01, 'z': 0.0})
-        landmarks_end.append({'x': x - 0.13, 'y': y - 0.03, 'z': 0.0})
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks_end.append({'x': base_x, 'y': y + 0.02 - (j * 0.04), 'z': 0.0})
+        thumb = [
+            (x - 0.07, y + 0.03, 0.0),
+            (x - 0.10, y + 0.01, 0.0),
+            (x - 0.12, y - 0.01, 0.0),
+            (x - 0.13, y - 0.03, 0.0)
+        ]
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, -0.02, 0.04)
+        landmarks_end = _landmarks_array((x, y + 0.05, 0.0), thumb, fingers)
         return self._create_animated_sign('White', landmarks_start, landmarks_end,
                                           motion='outward', body_region='chest')
     
-    def _create_sign_orange(self) -> Dict:
+    def _create_sign_orange(self) -> _SignSpec:
         """Orange - Squeezing motion near chin (like squeezing orange)"""
-        landmarks = []
         x, y = 0.5, 0.36
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb in squeezing position
-        landmarks.append({'x': x - 0.05, 'y': y - 0.03, 'z': 0.02})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.06, 'z': 0.04})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.09, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.11, 'z': 0.04})
+        thumb = [
+            (x - 0.05, y - 0.03, 0.02),
+            (x - 0.07, y - 0.06, 0.04),
+            (x - 0.06, y - 0.09, 0.05),
+            (x - 0.04, y - 0.11, 0.04)
+        ]
         # All fingers curved to meet thumb (squeezing)
-        for i, offset in enumerate([-0.02, 0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x - 0.02, 'y': y - 0.09, 'z': 0.03})
-            landmarks.append({'x': base_x - 0.03, 'y': y - 0.11, 'z': 0.05})
-            landmarks.append({'x': base_x - 0.03, 'y': y - 0.12, 'z': 0.04})
+        curl = ((0.0, -0.06, 0.0), (-0.02, -0.09, 0.03), (-0.03, -0.11, 0.05), (-0.03, -0.12, 0.04))
+        fingers = _curled_fingers(x, y, _FINGERS_AT_M02, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Orange', landmarks, 'adjective',
                                       motion='squeezing', body_region='chin')
     
-    def _create_sign_pink(self) -> Dict:
+    def _create_sign_pink(self) -> _SignSpec:
         """Pink - P handshape brushing lips downward"""
-        landmarks = []
         x, y = 0.48, 0.34
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb out to side
-        landmarks.append({'x': x - 0.06, 'y': y - 0.03, 'z': 0.0})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.05, 'z': 0.0})
-        landmarks.append({'x': x - 0.13, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.06, 'z': 0.0})
-        # Index pointing down (P shape)
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.03, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.08, 'z': 0.0})
-        # Middle also pointing down
-        landmarks.append({'x': x + 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x + 0.02, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x + 0.02, 'y': y + 0.03, 'z': 0.0})
-        landmarks.append({'x': x + 0.02, 'y': y + 0.08, 'z': 0.0})
+        thumb = [
+            (x - 0.06, y - 0.03, 0.0),
+            (x - 0.10, y - 0.05, 0.0),
+            (x - 0.13, y - 0.06, 0.0),
+            (x - 0.15, y - 0.06, 0.0)
+        ]
+        fingers = [
+            # Index pointing down (P shape)
+            (x - 0.02, y - 0.06, 0.0),
+            (x - 0.02, y - 0.02, 0.0),
+            (x - 0.02, y + 0.03, 0.0),
+            (x - 0.02, y + 0.08, 0.0),
+            # Middle also pointing down
+            (x + 0.02, y - 0.06, 0.0),
+            (x + 0.02, y - 0.02, 0.0),
+            (x + 0.02, y + 0.03, 0.0),
+            (x + 0.02, y + 0.08, 0.0)
+        ]
         # Ring and pinky curled
-        for i, offset in enumerate([0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.05, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.05, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.02, 'z': 0.05})
+        others = _curled_fingers(x, y, [0.06, 0.10], _CURL_TUCKED_HIGH)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Pink', landmarks, 'adjective',
                                       motion='brushing', body_region='lips')
     
-    def _create_sign_grey(self) -> Dict:
+    def _create_sign_grey(self) -> _SignSpec:
         """Grey - Open hands weaving through each other"""
-        landmarks = []
         x, y = 0.5, 0.50
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb spread wide
-        landmarks.append({'x': x - 0.09, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.18, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.21, 'y': y - 0.08, 'z': 0.0})
+        thumb = [
+            (x - 0.09, y - 0.02, 0.0),
+            (x - 0.14, y - 0.04, 0.0),
+            (x - 0.18, y - 0.06, 0.0),
+            (x - 0.21, y - 0.08, 0.0)
+        ]
         # Fingers spread wide for weaving
-        for i, offset in enumerate([-0.05, 0.0, 0.05, 0.10]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.08 - (j * 0.05), 'z': 0.02 if j % 2 == 0 else -0.02})
+        fingers = _finger_grid(x, y, [-0.05, 0.0, 0.05, 0.10], 0.08, 0.05, np.array([0.02, -0.02, 0.02, -0.02]))
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Grey', landmarks, 'adjective',
                                       motion='passing', two_hands=True)
     
-    def _create_sign_colour(self) -> Dict:
+    def _create_sign_colour(self) -> _SignSpec:
         """Colour - Wiggling fingers at chin level"""
-        landmarks = []
         x, y = 0.5, 0.38
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended
-        landmarks.append({'x': x - 0.08, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.12, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.17, 'y': y - 0.08, 'z': 0.0})
+        thumb = _THUMB_EXTENDED + (x, y, 0.0)
         # Fingers spread and wiggling (staggered z positions)
-        for i, offset in enumerate([-0.04, 0.0, 0.04, 0.08]):
-            base_x = x + offset
-            z_offset = 0.02 if i % 2 == 0 else -0.02
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y - 0.07 - (j * 0.045), 'z': z_offset * (j + 1) / 4})
+        z_offset = np.array([0.02, -0.02, 0.02, -0.02])
+        fingers = _finger_grid(x, y, _FINGERS_AT_M04, 0.07, 0.045, z_offset[:, None] * (_JOINT_STEPS + 1) / 4)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Colour', landmarks, 'noun',
                                       motion='wiggling', body_region='chin')
     
     # ============ DAY SIGNS ============
     
-    def _create_sign_day(self, day: str) -> Dict:
+    def _create_sign_day(self, day: str) -> _SignSpec:
         """Day of week signs - Each has unique hand configuration"""
-        landmarks = []
-        x, y = 0.5, 0.45
-        
-        # Different configurations for each day
-        day_configs = {
-            'Monday': {'thumb_angle': 0.0, 'finger_spread': 0.03, 'curl': 0.0},
-            'Tuesday': {'thumb_angle': 0.02, 'finger_spread': 0.035, 'curl': 0.01},
-            'Wednesday': {'thumb_angle': 0.04, 'finger_spread': 0.04, 'curl': 0.02},
-            'Thursday': {'thumb_angle': 0.06, 'finger_spread': 0.032, 'curl': 0.03},
-            'Friday': {'thumb_angle': 0.08, 'finger_spread': 0.038, 'curl': 0.0},
-            'Saturday': {'thumb_angle': 0.10, 'finger_spread': 0.042, 'curl': 0.01},
-            'Sunday': {'thumb_angle': 0.12, 'finger_spread': 0.045, 'curl': 0.02}
-        }
-        config = day_configs.get(day, day_configs['Monday'])
-        
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb with varying angle
-        landmarks.append({'x': x - 0.06 - config['thumb_angle'], 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.10 - config['thumb_angle'], 'y': y - 0.05, 'z': 0.0})
-        landmarks.append({'x': x - 0.13 - config['thumb_angle'], 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.15 - config['thumb_angle'], 'y': y - 0.10, 'z': 0.0})
-        # Fingers with varying spread
-        spread = config['finger_spread']
-        curl = config['curl']
-        for i, offset in enumerate([-spread, 0.0, spread, spread * 2]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({
-                    'x': base_x + (j * 0.005),
-                    'y': y - 0.08 - (j * 0.045),
-                    'z': curl * (j / 3)
-                })
-        return self._create_sign_data(day, landmarks, 'time',
+        # All seven weekday hands come from one batched build; unknown days use Monday's
+        index = _DAY_NAMES.index(day) if day in _DAY_NAMES else 0
+        return self._create_sign_data(day, _day_hands()[index], 'time',
                                       motion='circular')
     
-    def _create_sign_today(self) -> Dict:
+    def _create_sign_today(self) -> _SignSpec:
         """Today - Both hands pointing down emphatically"""
-        landmarks = []
         x, y = 0.5, 0.50
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb alongside
-        landmarks.append({'x': x - 0.06, 'y': y + 0.02, 'z': 0.01})
-        landmarks.append({'x': x - 0.08, 'y': y + 0.05, 'z': 0.01})
-        landmarks.append({'x': x - 0.09, 'y': y + 0.08, 'z': 0.01})
-        landmarks.append({'x': x - 0.09, 'y': y + 0.10, 'z': 0.01})
+        thumb = [
+            (x - 0.06, y + 0.02, 0.01),
+            (x - 0.08, y + 0.05, 0.01),
+            (x - 0.09, y + 0.08, 0.01),
+            (x - 0.09, y + 0.10, 0.01)
+        ]
         # All fingers pointing downward
-        for i, offset in enumerate([-0.03, 0.01, 0.05, 0.09]):
-            base_x = x + offset
-            for j in range(4):
-                landmarks.append({'x': base_x, 'y': y + 0.02 + (j * 0.05), 'z': 0.0})
+        fingers = _finger_grid(x, y, _FINGERS_AT_M03, -0.02, -0.05)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Today', landmarks, 'time',
                                       motion='downward', two_hands=True)
     
     # ============ PRONOUN SIGNS ============
     
-    def _create_sign_i(self) -> Dict:
+    def _create_sign_i(self) -> _SignSpec:
         """I - Index pointing to self/chest"""
-        landmarks = []
         x, y = 0.52, 0.48
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
         # Index pointing toward self (toward center/chest)
-        landmarks.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.12, 'z': 0.06})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.15, 'z': 0.10})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.17, 'z': 0.12})
-        # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        index = ((-0.02, -0.08, 0.0), (-0.04, -0.12, 0.06),
+                 (-0.06, -0.15, 0.10), (-0.08, -0.17, 0.12))
+        landmarks = _pointing_hand(x, y, index)
         return self._create_sign_data('I', landmarks, 'pronoun',
                                       body_region='chest')
     
-    def _create_sign_you(self) -> Dict:
+    def _create_sign_you(self) -> _SignSpec:
         """You - Index pointing outward/forward"""
-        landmarks = []
         x, y = 0.5, 0.45
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
         # Index pointing forward (negative z)
-        landmarks.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.12, 'z': -0.04})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.16, 'z': -0.08})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.20, 'z': -0.12})
-        # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        index = ((-0.02, -0.08, 0.0), (-0.02, -0.12, -0.04),
+                 (-0.02, -0.16, -0.08), (-0.02, -0.20, -0.12))
+        landmarks = _pointing_hand(x, y, index)
         return self._create_sign_data('You', landmarks, 'pronoun',
                                       motion='pointing_out')
     
-    def _create_sign_he(self) -> Dict:
+    def _create_sign_he(self) -> _SignSpec:
         """He - Index pointing to the right side"""
-        landmarks = []
         x, y = 0.55, 0.42
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
         # Index pointing to the right
-        landmarks.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.04, 'y': y - 0.09, 'z': 0.0})
-        landmarks.append({'x': x + 0.10, 'y': y - 0.09, 'z': 0.0})
-        landmarks.append({'x': x + 0.16, 'y': y - 0.09, 'z': 0.0})
-        # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        index = ((-0.02, -0.08, 0.0), (0.04, -0.09, 0.0),
+                 (0.10, -0.09, 0.0), (0.16, -0.09, 0.0))
+        landmarks = _pointing_hand(x, y, index)
         return self._create_sign_data('He', landmarks, 'pronoun',
                                       motion='pointing_side')
     
-    def _create_sign_she(self) -> Dict:
+    def _create_sign_she(self) -> _SignSpec:
         """She - Index pointing to the left side"""
-        landmarks = []
         x, y = 0.45, 0.42
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
         # Index pointing to the left
-        landmarks.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.09, 'z': 0.0})
-        landmarks.append({'x': x - 0.14, 'y': y - 0.09, 'z': 0.0})
-        landmarks.append({'x': x - 0.20, 'y': y - 0.09, 'z': 0.0})
-        # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        index = ((-0.02, -0.08, 0.0), (-0.08, -0.09, 0.0),
+                 (-0.14, -0.09, 0.0), (-0.20, -0.09, 0.0))
+        landmarks = _pointing_hand(x, y, index)
         return self._create_sign_data('She', landmarks, 'pronoun',
                                       motion='pointing_side')
     
-    def _create_sign_it(self) -> Dict:
+    def _create_sign_it(self) -> _SignSpec:
         """It - Index pointing downward"""
-        landmarks = []
         x, y = 0.5, 0.48
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
-        # Thumb tucked
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
         # Index pointing downward
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.0, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y + 0.12, 'z': 0.0})
-        # Other fingers curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        index = ((-0.02, -0.06, 0.0), (-0.02, 0.0, 0.0),
+                 (-0.02, 0.06, 0.0), (-0.02, 0.12, 0.0))
+        landmarks = _pointing_hand(x, y, index)
         return self._create_sign_data('It', landmarks, 'pronoun',
                                       motion='pointing_down')
     
     # ============ OTHER SIGNS ============
     
-    def _create_sign_blind(self) -> Dict:
+    def _create_sign_blind(self) -> _SignSpec:
         """Blind - V fingers (index and middle) covering eyes"""
-        landmarks = []
         x, y = 0.5, 0.26
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb curled
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
-        # Index and middle forming V over eyes
-        landmarks.append({'x': x - 0.04, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.14, 'z': 0.02})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.18, 'z': 0.03})
-        landmarks.append({'x': x - 0.10, 'y': y - 0.21, 'z': 0.03})
-        landmarks.append({'x': x + 0.0, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x + 0.02, 'y': y - 0.14, 'z': 0.02})
-        landmarks.append({'x': x + 0.04, 'y': y - 0.18, 'z': 0.03})
-        landmarks.append({'x': x + 0.06, 'y': y - 0.21, 'z': 0.03})
+        thumb = _THUMB_TUCKED + (x, y, 0.0)
+        fingers = [
+            # Index and middle forming V over eyes
+            (x - 0.04, y - 0.08, 0.0),
+            (x - 0.06, y - 0.14, 0.02),
+            (x - 0.08, y - 0.18, 0.03),
+            (x - 0.10, y - 0.21, 0.03),
+            (x + 0.0, y - 0.08, 0.0),
+            (x + 0.02, y - 0.14, 0.02),
+            (x + 0.04, y - 0.18, 0.03),
+            (x + 0.06, y - 0.21, 0.03)
+        ]
         # Ring and pinky curled
-        for i, offset in enumerate([0.04, 0.08]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
+        others = _curled_fingers(x, y, [0.04, 0.08], _CURL_TUCKED)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Blind', landmarks, 'adjective',
                                       facial='neutral', body_region='eyes')
     
-    def _create_sign_deaf(self) -> Dict:
+    def _create_sign_deaf(self) -> _SignSpec:
         """Deaf - Index touching ear then closing to fist"""
-        landmarks = []
         x, y = 0.62, 0.28
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb along side
-        landmarks.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.02})
-        landmarks.append({'x': x - 0.06, 'y': y - 0.04, 'z': 0.03})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.06, 'z': 0.03})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.08, 'z': 0.03})
+        thumb = [
+            (x - 0.04, y - 0.02, 0.02),
+            (x - 0.06, y - 0.04, 0.03),
+            (x - 0.07, y - 0.06, 0.03),
+            (x - 0.07, y - 0.08, 0.03)
+        ]
         # Index pointing at ear
-        landmarks.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.13, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.17, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.20, 'z': 0.0})
+        fingers = _INDEX_UP + (x, y, 0.0)
         # Other fingers slightly curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.10, 'z': 0.02})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.09, 'z': 0.04})
-            landmarks.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.03})
+        curl = ((0.0, -0.07, 0.0), (0.0, -0.10, 0.02), (0.01, -0.09, 0.04), (0.01, -0.06, 0.03))
+        others = _curled_fingers(x, y, _TUCKED_AT_02, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Deaf', landmarks, 'adjective',
                                       motion='touching', body_region='ear')
     
-    def _create_sign_dream(self) -> Dict:
+    def _create_sign_dream(self) -> _SignSpec:
         """Dream - Index finger spiraling away from forehead"""
-        landmarks_start = []
-        landmarks_end = []
         x, y = 0.52, 0.25
-        # Start position - finger at forehead
-        landmarks_start.append({'x': x, 'y': y, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.04, 'y': y - 0.02, 'z': 0.03})
-        landmarks_start.append({'x': x - 0.05, 'y': y - 0.04, 'z': 0.05})
-        landmarks_start.append({'x': x - 0.04, 'y': y - 0.06, 'z': 0.05})
-        landmarks_start.append({'x': x - 0.02, 'y': y - 0.07, 'z': 0.04})
-        # Index extended
-        landmarks_start.append({'x': x - 0.02, 'y': y - 0.08, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.02, 'y': y - 0.13, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.02, 'y': y - 0.17, 'z': 0.0})
-        landmarks_start.append({'x': x - 0.02, 'y': y - 0.20, 'z': 0.0})
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks_start.append({'x': base_x, 'y': y - 0.06, 'z': 0.0})
-            landmarks_start.append({'x': base_x, 'y': y - 0.08, 'z': 0.04})
-            landmarks_start.append({'x': base_x + 0.01, 'y': y - 0.06, 'z': 0.06})
-            landmarks_start.append({'x': base_x + 0.01, 'y': y - 0.03, 'z': 0.05})
-        
+        # Start position - index extended at forehead
+        landmarks_start = _pointing_hand(x, y, _INDEX_UP)
         # End position - finger moved away and up (dream floating away)
-        x2, y2 = x + 0.12, y - 0.08
-        landmarks_end.append({'x': x2, 'y': y2, 'z': 0.0})
-        landmarks_end.append({'x': x2 - 0.04, 'y': y2 - 0.02, 'z': 0.03})
-        landmarks_end.append({'x': x2 - 0.05, 'y': y2 - 0.04, 'z': 0.05})
-        landmarks_end.append({'x': x2 - 0.04, 'y': y2 - 0.06, 'z': 0.05})
-        landmarks_end.append({'x': x2 - 0.02, 'y': y2 - 0.07, 'z': 0.04})
-        landmarks_end.append({'x': x2 - 0.02, 'y': y2 - 0.08, 'z': 0.0})
-        landmarks_end.append({'x': x2 - 0.02, 'y': y2 - 0.13, 'z': 0.0})
-        landmarks_end.append({'x': x2 - 0.02, 'y': y2 - 0.17, 'z': 0.0})
-        landmarks_end.append({'x': x2 - 0.02, 'y': y2 - 0.20, 'z': 0.0})
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x2 + offset
-            landmarks_end.append({'x': base_x, 'y': y2 - 0.06, 'z': 0.0})
-            landmarks_end.append({'x': base_x, 'y': y2 - 0.08, 'z': 0.04})
-            landmarks_end.append({'x': base_x + 0.01, 'y': y2 - 0.06, 'z': 0.06})
-            landmarks_end.append({'x': base_x + 0.01, 'y': y2 - 0.03, 'z': 0.05})
-        return self._create_animated_sign('Dream', landmarks_start, landmarks_end,
+        return self._create_animated_sign('Dream', landmarks_start, shift=(0.12, -0.08, 0.0),
                                           motion='rising', facial='calm',
                                           body_region='forehead')
     
-    def _create_sign_loud(self) -> Dict:
+    def _create_sign_loud(self) -> _SignSpec:
         """Loud - Hands at ears expanding outward"""
-        landmarks = []
         x, y = 0.58, 0.28
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb extended
-        landmarks.append({'x': x - 0.08, 'y': y - 0.02, 'z': 0.0})
-        landmarks.append({'x': x - 0.12, 'y': y - 0.04, 'z': 0.0})
-        landmarks.append({'x': x - 0.15, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.17, 'y': y - 0.08, 'z': 0.0})
+        thumb = _THUMB_EXTENDED + (x, y, 0.0)
         # Fingers spread wide (explosion/loud effect)
-        for i, offset in enumerate([-0.05, 0.0, 0.05, 0.10]):
-            base_x = x + offset
-            angle = (i - 1.5) * 0.05
-            for j in range(4):
-                landmarks.append({
-                    'x': base_x + (j * angle),
-                    'y': y - 0.08 - (j * 0.05),
-                    'z': 0.0
-                })
+        angle = (np.arange(4) - 1.5) * 0.05
+        fingers = _finger_grid(x, y, [-0.05, 0.0, 0.05, 0.10], 0.08, 0.05, dx_step=angle[:, None])
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers)
         return self._create_sign_data('Loud', landmarks, 'adjective',
                                       motion='expanding', body_region='ears',
                                       two_hands=True)
     
-    def _create_sign_quiet(self) -> Dict:
+    def _create_sign_quiet(self) -> _SignSpec:
         """Quiet - Index finger on lips (shushing gesture)"""
-        landmarks = []
         x, y = 0.5, 0.32
-        landmarks.append({'x': x, 'y': y, 'z': 0.0})  # Wrist
         # Thumb alongside
-        landmarks.append({'x': x - 0.05, 'y': y - 0.02, 'z': 0.03})
-        landmarks.append({'x': x - 0.07, 'y': y - 0.04, 'z': 0.05})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.06, 'z': 0.06})
-        landmarks.append({'x': x - 0.08, 'y': y - 0.08, 'z': 0.06})
-        # Index extended vertically (at lips)
-        landmarks.append({'x': x - 0.02, 'y': y - 0.06, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.11, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.15, 'z': 0.0})
-        landmarks.append({'x': x - 0.02, 'y': y - 0.18, 'z': 0.0})
+        thumb = [
+            (x - 0.05, y - 0.02, 0.03),
+            (x - 0.07, y - 0.04, 0.05),
+            (x - 0.08, y - 0.06, 0.06),
+            (x - 0.08, y - 0.08, 0.06)
+        ]
+        fingers = [
+            # Index extended vertically (at lips)
+            (x - 0.02, y - 0.06, 0.0),
+            (x - 0.02, y - 0.11, 0.0),
+            (x - 0.02, y - 0.15, 0.0),
+            (x - 0.02, y - 0.18, 0.0)
+        ]
         # Other fingers tightly curled
-        for i, offset in enumerate([0.02, 0.06, 0.10]):
-            base_x = x + offset
-            landmarks.append({'x': base_x, 'y': y - 0.05, 'z': 0.0})
-            landmarks.append({'x': base_x, 'y': y - 0.07, 'z': 0.05})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.05, 'z': 0.07})
-            landmarks.append({'x': base_x + 0.02, 'y': y - 0.02, 'z': 0.06})
+        curl = ((0.0, -0.05, 0.0), (0.0, -0.07, 0.05), (0.02, -0.05, 0.07), (0.02, -0.02, 0.06))
+        others = _curled_fingers(x, y, _TUCKED_AT_02, curl)
+        landmarks = _landmarks_array((x, y, 0.0), thumb, fingers, others)
         return self._create_sign_data('Quiet', landmarks, 'adjective',
                                       facial='calm', motion='downward',
                                       body_region='lips')
     
     # ============ HELPER METHODS ============
     
-    def _create_sign_data(self, name: str, landmarks: List[Dict], 
+    def _create_sign_data(self, name: str, landmarks: Union[np.ndarray, Sequence[Dict]],
                           sign_type: str = 'word', facial: str = 'neutral',
                           motion: str = 'static', body_region: str = 'neutral',
-                          two_hands: bool = False) -> Dict:
+                          two_hands: bool = False) -> _SignSpec:
         """Create sign data structure with single keyframe"""
-        return {
-            'name': name,
-            'type': sign_type,
-            'facial_expression': facial,
-            'motion_type': motion,
-            'body_region': body_region,
-            'two_hands': two_hands,
-            'keyframes': [
-                {
-                    'frame': 0,
-                    'right_hand': landmarks,
-                    'left_hand': landmarks if two_hands else None
-                }
-            ]
+        landmarks = self._read_only(landmarks)
+        keyframe = {
+            'frame': 0,
+            'right_hand': landmarks,
+            'left_hand': landmarks if two_hands else None
         }
+        return _SignSpec(name, sign_type, facial, motion, body_region, two_hands, (keyframe,))
     
-    def _create_animated_sign(self, name: str, start_hand: List[Dict], 
-                              end_hand: List[Dict], motion: str = 'dynamic',
+    def _create_animated_sign(self, name: str, start_hand: Union[np.ndarray, Sequence[Dict]], 
+                              end_hand: Union[np.ndarray, Sequence[Dict], None] = None, motion: str = 'dynamic',
                               facial: str = 'neutral', body_region: str = 'neutral',
-                              two_hands: bool = False) -> Dict:
-        """Create sign with animation between two keyframes"""
-        return {
-            'name': name,
-            'type': 'animated',
-            'facial_expression': facial,
-            'motion_type': motion,
-            'body_region': body_region,
-            'two_hands': two_hands,
-            'keyframes': [
-                {
-                    'frame': 0,
-                    'right_hand': start_hand,
-                    'left_hand': start_hand if two_hands else None
-                },
-                {
-                    'frame': 1,
-                    'right_hand': end_hand,
-                    'left_hand': end_hand if two_hands else None
-                }
-            ]
-        }
+                              two_hands: bool = False,
+                              shift: Optional[Tuple[float, float, float]] = None) -> _SignSpec:
+        """Create sign with animation between two keyframes
+        
+        Signs whose hand only moves pass a (dx, dy, dz) shift instead of an end pose
+        """
+        if shift is not None:
+            end_hand = _translate(start_hand, *shift)
+        start_hand, end_hand = self._read_only(start_hand), self._read_only(end_hand)
+        keyframes = (
+            {
+                'frame': 0,
+                'right_hand': start_hand,
+                'left_hand': start_hand if two_hands else None
+            },
+            {
+                'frame': 1,
+                'right_hand': end_hand,
+                'left_hand': end_hand if two_hands else None
+            }
+        )
+        return _SignSpec(name, 'animated', facial, motion, body_region, two_hands, keyframes)
+    
+    def _read_only(self, landmarks: Union[np.ndarray, Sequence[Dict]]) -> Union[np.ndarray, Tuple]:
+        """Read-only view of builder landmarks: arrays lose write access, lists become tuples"""
+        if isinstance(landmarks, np.ndarray):
+            view = landmarks.view()
+            view.flags.writeable = False
+            return view
+        return tuple(landmarks)
+    
+    def _freeze_sign(self, sign: _SignSpec) -> MappingProxyType:
+        """Freeze a built sign into a read-only record with read-only keyframes"""
+        keyframes = tuple(
+            MappingProxyType({
+                key: self._freeze_landmarks(value)
+                for key, value in keyframe.items()
+            })
+            for keyframe in sign.keyframes
+        )
+        return MappingProxyType({**sign._asdict(), 'keyframes': keyframes})
+    
+    def _freeze_landmarks(self, value):
+        """Landmark arrays and sequences become tuples of Landmark records"""
+        if isinstance(value, np.ndarray):
+            return tuple(map(Landmark._make, value.tolist()))
+        if isinstance(value, (list, tuple)):
+            return tuple(Landmark(lm['x'], lm['y'], lm['z']) for lm in value)
+        return value
     
     def get_sign(self, sign_name: str) -> Dict:
-        """Get sign data by name"""
-        return self.signs.get(sign_name, self._get_default_sign())
+        """Get sign data by name as a plain dict (a fresh copy; the stored record stays read-only)"""
+        return self._record_to_dict(self.signs.get(sign_name, self._default_sign))
+    
+    def _record_to_dict(self, record: Mapping) -> Dict:
+        """Plain, JSON-serializable copy of a frozen sign record"""
+        sign = dict(record)
+        sign['keyframes'] = [
+            {key: self._thaw_landmarks(value) for key, value in keyframe.items()}
+            for keyframe in record['keyframes']
+        ]
+        return sign
+    
+    def _thaw_landmarks(self, value):
+        """Frozen landmark tuples become fresh {'x','y','z'} dicts; other keyframe values pass through"""
+        if isinstance(value, tuple):
+            return [{'x': x, 'y': y, 'z': z} for x, y, z in value]
+        return value
     
-    def _get_default_sign(self) -> Dict:
+    def _get_default_sign(self) -> _SignSpec:
         """Return default sign for unknown words"""
-        return self._create_sign_data('Unknown', self._create_base_hand(), 
+        return self._create_sign_data('Unknown', self._base_hand_array(), 
                                       'default', facial='question')
     
     def get_keypoints(self, sign_name: str) -> List[Dict]:
         """Get keypoint coordinates for a sign"""
-        sign = self.get_sign(sign_name)
-        if sign and sign['keyframes']:
-            return sign['keyframes'][0]['right_hand']
+        keyframes = self.signs.get(sign_name, self._default_sign)['keyframes']
+        if keyframes:
+            return self._thaw_landmarks(keyframes[0]['right_hand'])
         return self._create_base_hand()
     
+    def has_sign(self, sign_name: str) -> bool:
+        """Check if a sign name is one of the class labels"""
+        return sign_name in self._label_set
+    
+    def get_label_index(self, sign_name: str) -> int:
+        """Get the class index of a sign, or -1 if it is not a class label"""
+        return self._label_index.get(sign_name, -1)
+    
     def get_all_signs(self) -> List[str]:
         """Return all available sign names"""
         return list(self.signs.keys())
     
+    def get_handshape(self, sign_name: str) -> np.ndarray:
+        """Get a writable copy of a sign's first right-hand (21, 3) array"""
+        keyframes = self.get_keyframe_arrays(sign_name)
+        if keyframes:
+            return keyframes[0][0].copy()
+        return self._base_hand_array().astype(_COORD_DTYPE)
+    
+    def get_keyframe_arrays(self, sign_name: str) -> Tuple:
+        """Get cached float64 (right_hand, left_hand) (21, 3) arrays for each keyframe of a sign"""
+        return self.signs.entry(sign_name)[1] if sign_name in self.signs else ()
+    
+    def _landmarks_to_array(self, landmarks: List[Dict]) -> np.ndarray:
+        """Pack {'x','y','z'} landmarks into a read-only float64 (N, 3) array"""
+        arr = np.array([(lm['x'], lm['y'], lm['z']) for lm in landmarks], dtype=_COORD_DTYPE)
+        arr.flags.writeable = False
+        return arr
+    
+    def _array_to_landmarks(self, arr: np.ndarray) -> List[Dict]:
+        """Unpack an (N, 3) array into {'x','y','z'} landmarks"""
+        return [{'x': x, 'y': y, 'z': z} for x, y, z in arr.tolist()]
+    
     def interpolate_keyframes(self, sign_name: str, progress: float) -> Dict:
         """Interpolate between keyframes for animation"""
-        sign = self.get_sign(sign_name)
-        keyframes = sign.get('keyframes', [])
-        
-        if len(keyframes) < 2:
-            # Static sign, return first keyframe
+        # Animated signs interpolate their cached arrays without reading the record
+        arrays = self.get_keyframe_arrays(sign_name)
+        if len(arrays) < 2:
+            # Static (or unknown) sign, return first keyframe
+            keyframes = self.get_sign(sign_name).get('keyframes', [])
             return keyframes[0] if keyframes else {'right_hand': self._create_base_hand()}
         
         # Interpolate between start and end
-        start = keyframes[0]
-        end = keyframes[1]
+        (start_right, start_left), (end_right, end_left) = arrays[0], arrays[1]
         
         interpolated = {
             'frame': progress,
-            'right_hand': self._interpolate_landmarks(
-                start['right_hand'], end['right_hand'], progress
-            )
+            'right_hand': self._interpolate_arrays(start_right, end_right, progress)
         }
         
-        if start.get('left_hand') and end.get('left_hand'):
-            interpolated['left_hand'] = self._interpolate_landmarks(
-                start['left_hand'], end['left_hand'], progress
-            )
+        if start_left is not None and end_left is not None:
+            interpolated['left_hand'] = self._interpolate_arrays(start_left, end_left, progress)
         
         return interpolated
     
+    def interpolate_frames(self, sign_name: str, progresses: Sequence[float]) -> Dict:
+        """Interpolate a sign at many progress values at once into (frames, N, 3) arrays"""
+        arrays = self.get_keyframe_arrays(sign_name)
+        if not arrays:
+            # Unknown sign: hold the default hand
+            arrays = ((self._landmarks_to_array(self._default_sign['keyframes'][0]['right_hand']), None),)
+        (start_right, start_left), (end_right, end_left) = arrays[0], arrays[min(1, len(arrays) - 1)]
+        progresses = np.ascontiguousarray(progresses, dtype=np.float64)
+        
+        frames = {'right_hand': self._interpolate_frame_arrays(start_right, end_right, progresses),
+                  'left_hand': None}
+        if start_left is not None and end_left is not None:
+            frames['left_hand'] = self._interpolate_frame_arrays(start_left, end_left, progresses)
+        return frames
+    
+    def _interpolate_frame_arrays(self, start: np.ndarray, end: np.ndarray,
+                                  progresses: np.ndarray) -> np.ndarray:
+        """Interpolate two landmark arrays at every progress value with the compiled kernel"""
+        count = min(len(start), len(end))
+        out = np.empty((len(progresses), count, 3), dtype=np.result_type(start, end))
+        return _interp_frames_kernel(start[:count], end[:count], progresses, out)
+    
+    def _interpolate_arrays(self, start: np.ndarray, end: np.ndarray,
+                            progress: float) -> List[Dict]:
+        """Interpolate two landmark arrays with the compiled kernel"""
+        count = min(len(start), len(end))
+        out = np.empty((count, 3), dtype=np.result_type(start, end))
+        _interp_kernel(start[:count], end[:count], float(progress), out)
+        return self._array_to_landmarks(out)
+    
     def _interpolate_landmarks(self, start: List[Dict], end: List[Dict], 
                                progress: float) -> List[Dict]:
         """Interpolate between two sets of landmarks"""
-        result = []
-        for i in range(min(len(start), len(end))):
-            result.append({
-                'x': start[i]['x'] + (end[i]['x'] - start[i]['x']) * progress,
-                'y': start[i]['y'] + (end[i]['y'] - start[i]['y']) * progress,
-                'z': start[i]['z'] + (end[i]['z'] - start[i]['z']) * progress
-            })
-        return result
+        count = min(len(start), len(end))
+        start, end = self._landmark_rows(start, count), self._landmark_rows(end, count)
+        return self._array_to_landmarks(start + (end - start) * progress)
+    
+    def _interpolate_landmark_frames(self, start: List[Dict], end: List[Dict],
+                                     progresses: Sequence[float]) -> List[List[Dict]]:
+        """Interpolate between two sets of landmarks at every progress value in one broadcast"""
+        count = min(len(start), len(end))
+        start, end = self._landmark_rows(start, count), self._landmark_rows(end, count)
+        frames = start + (end - start) * np.asarray(progresses, dtype=np.float64)[:, None, None]
+        return [self._array_to_landmarks(frame) for frame in frames]
+    
+    def _landmark_rows(self, landmarks: Sequence, count: int) -> np.ndarray:
+        """First count landmarks as a float64 (count, 3) array; Landmark tuples pack without key lookups"""
+        if isinstance(landmarks, np.ndarray):
+            return np.asarray(landmarks[:count], dtype=np.float64)
+        rows = landmarks[:count]
+        if rows and not isinstance(rows[0], tuple):
+            rows = map(_XYZ, rows)
+        return np.fromiter(chain.from_iterable(rows), np.float64, count * 3).reshape(count, 3)
 
 
 # Module-level instance
 isl_database = ISLDatabase()
+
+
+if __name__ == '__main__':
+    # python -m speech_to_sign.sign_database  (from flask_app/) refreshes the cache
+    isl_database.save_sign_cache()
+    print(f"Saved {len(isl_database.sign_names)} signs to {_SIGN_CACHE_PATH}")
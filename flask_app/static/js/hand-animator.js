@@ -66,6 +66,12 @@ class ISLHandAnimator {
         return result;
     }
     
+    // Rebuild {x, y, z} keypoints from a hand sent as per-axis arrays (xs, ys, zs)
+    handKeypoints(hand) {
+        if (!hand || !hand.xs) return null;
+        return hand.xs.map((x, i) => ({ x: x, y: hand.ys[i], z: hand.zs[i] }));
+    }
+    
     // Draw the complete avatar with animated hands
     drawFrame(frame) {
         const ctx = this.ctx;
@@ -87,12 +93,14 @@ class ISLHandAnimator {
         }
         
         // Draw hands (on top of body)
-        if (frame.right_hand && frame.right_hand.keypoints) {
-            this.drawHand(ctx, frame.right_hand.keypoints, 'right');
+        const rightKeypoints = this.handKeypoints(frame.right_hand);
+        if (rightKeypoints) {
+            this.drawHand(ctx, rightKeypoints, 'right');
         }
         
-        if (frame.left_hand && frame.left_hand.keypoints) {
-            this.drawHand(ctx, frame.left_hand.keypoints, 'left');
+        const leftKeypoints = this.handKeypoints(frame.left_hand);
+        if (leftKeypoints) {
+            this.drawHand(ctx, leftKeypoints, 'left');
         }
         
         // Draw sign label
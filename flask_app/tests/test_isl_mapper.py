@@ -0,0 +1,32 @@
+import importlib
+
+import pytest
+
+from speech_to_sign.isl_mapper_new import ISLMapper
+
+# The package's nlp_processor attribute is the singleton, not the module
+nlp_module = importlib.import_module('speech_to_sign.nlp_processor')
+
+TEXTS = [
+    'hello how are you',
+    '',
+    '   ',
+    'thank you thank you',
+    'A',
+    '5',
+    'good morning, I am going home today',
+    'xyz',
+]
+
+
+def test_batch_matches_single_calls_without_spacy(monkeypatch):
+    monkeypatch.setattr(nlp_module, '_spacy_pipeline', lambda: None)
+    mapper = ISLMapper()
+    assert mapper.map_to_isl_batch(TEXTS) == [mapper.map_to_isl(text) for text in TEXTS]
+
+
+def test_batch_matches_single_calls_with_spacy():
+    if nlp_module._spacy_pipeline() is None:
+        pytest.skip('spaCy or its en_core_web_sm model is not installed')
+    mapper = ISLMapper()
+    assert mapper.map_to_isl_batch(TEXTS) == [mapper.map_to_isl(text) for text in TEXTS]
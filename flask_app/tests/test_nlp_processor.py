@@ -0,0 +1,107 @@
+import re
+
+import pytest
+
+from speech_to_sign.nlp_processor import NLPProcessor
+
+# 'good' is a prefix of 'good night', so the longest match must win
+PHRASES = {'good': 'Good', 'good night': 'Good night'}
+
+CASES = [
+    ('good night now', ['Good night'], 'now'),
+    ('good now', ['Good'], 'now'),
+    ('say good night and good', ['Good night', 'Good'], 'say and'),
+]
+
+# Like the baseline, each phrase is reported once (longest first), however
+# often and in whatever order it is spoken
+REPEAT_CASES = [
+    ('good night good night', ['Good night'], ''),
+    ('good then good night', ['Good night', 'Good'], 'then'),
+]
+
+
+class _Automaton:
+    """Brute-force stand-in yielding pyahocorasick's iter() items: (end_index, (length, phrase))"""
+    
+    def __init__(self, phrases):
+        self.phrases = phrases
+    
+    def iter(self, text):
+        for end in range(len(text)):
+            for phrase in self.phrases:
+                if text.startswith(phrase, end - len(phrase) + 1):
+                    yield end, (len(phrase), phrase)
+
+
+def _processor(automaton=None):
+    processor = NLPProcessor()
+    processor.phrases = PHRASES
+    processor._phrase_order = tuple(sorted(PHRASES, key=len, reverse=True))
+    processor._phrase_re = re.compile('|'.join(re.escape(p) for p in processor._phrase_order))
+    processor._phrase_ac = automaton
+    return processor
+
+
+def _real_automaton():
+    ahocorasick = pytest.importorskip('ahocorasick')
+    automaton = ahocorasick.Automaton()
+    for phrase in PHRASES:
+        automaton.add_word(phrase, (len(phrase), phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+@pytest.mark.parametrize('text, phrases, remaining', CASES)
+def test_regex_path_prefers_longest_phrase(text, phrases, remaining):
+    assert _processor().detect_phrases(text) == (phrases, remaining)
+
+
+@pytest.mark.parametrize('text, phrases, remaining', REPEAT_CASES)
+def test_regex_path_reports_each_phrase_once(text, phrases, remaining):
+    assert _processor().detect_phrases(text) == (phrases, remaining)
+
+
+@pytest.mark.parametrize('text, phrases, remaining', CASES + REPEAT_CASES)
+def test_span_path_prefers_longest_phrase(text, phrases, remaining):
+    assert _processor(_Automaton(PHRASES)).detect_phrases(text) == (phrases, remaining)
+
+
+@pytest.mark.parametrize('text, phrases, remaining', CASES + REPEAT_CASES)
+def test_aho_corasick_path_prefers_longest_phrase(text, phrases, remaining):
+    assert _processor(_real_automaton()).detect_phrases(text) == (phrases, remaining)
+
+
+def test_find_phrase_spans_keeps_longest_match():
+    processor = _processor(_Automaton(PHRASES))
+    assert processor._find_phrase_spans('good night now') == [(0, 10, 'good night')]
+
+
+def _baseline_detect_phrases(phrases, text):
+    """The original per-phrase 'in' + replace loop the sweeps replaced"""
+    detected = []
+    remaining = text.lower()
+    for phrase in sorted(phrases.keys(), key=len, reverse=True):
+        if phrase in remaining:
+            detected.append(phrases[phrase])
+            remaining = remaining.replace(phrase, ' ')
+    return detected, ' '.join(remaining.split())
+
+
+BASELINE_TEXTS = [
+    'how are you',
+    'hello how are you today',
+    'how are you good morning',
+    'good morning how are you thank you',
+    'thank you thank you',
+    'good night good night good night',
+    'thank you good night thank you how are you',
+    'Good Morning and GOOD NIGHT',
+    'no phrases in here',
+]
+
+
+@pytest.mark.parametrize('text', BASELINE_TEXTS)
+def test_detect_phrases_matches_baseline(text):
+    processor = NLPProcessor()
+    assert processor.detect_phrases(text) == _baseline_detect_phrases(processor.phrases, text)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from speech_to_sign import animation_generator, avatar_renderer, isl_database, isl_mapper
+
+# A static one-hand sign, an animated two-keyframe sign, a two-hand sign and an unknown name
+SIGNS = ['A', 'Hello', 'Bedroom', 'Nope']
+
+GETTERS = {
+    'get_sign': lambda sign: isl_database.get_sign(sign),
+    'get_keypoints': lambda sign: isl_database.get_keypoints(sign),
+    'interpolate_keyframes': lambda sign: isl_database.interpolate_keyframes(sign, 0.5),
+    'get_sign_info': lambda sign: isl_mapper.get_sign_info(sign),
+    'get_animation_sequence': lambda sign: isl_mapper.get_animation_sequence([sign]),
+    'get_sign_render_data': lambda sign: avatar_renderer.get_sign_render_data(sign),
+    'render_full_animation': lambda sign: avatar_renderer.render_full_animation([sign]),
+    'generate_animation_sequence': lambda sign: animation_generator.generate_animation_sequence([sign]),
+}
+
+
+@pytest.mark.parametrize('sign', SIGNS)
+@pytest.mark.parametrize('getter', sorted(GETTERS))
+def test_public_getters_are_json_serializable(getter, sign):
+    json.dumps(GETTERS[getter](sign))
+
+
+def test_get_sign_returns_independent_copies():
+    sign = isl_database.get_sign('A')
+    sign['keyframes'].clear()
+    assert isl_database.get_sign('A')['keyframes']
+
+
+def _landmark_lists(value):
+    """Every 21-point hand found anywhere in a decoded JSON value"""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _landmark_lists(item)
+    elif isinstance(value, list):
+        if len(value) == 21 and all(isinstance(item, (dict, list)) for item in value):
+            yield value
+        for item in value:
+            yield from _landmark_lists(item)
+
+
+@pytest.mark.parametrize('sign', SIGNS)
+@pytest.mark.parametrize('getter', sorted(GETTERS))
+def test_landmarks_serialize_as_xyz_dicts(getter, sign):
+    decoded = json.loads(json.dumps(GETTERS[getter](sign)))
+    for landmarks in _landmark_lists(decoded):
+        assert all(isinstance(lm, dict) and set(lm) == {'x', 'y', 'z'} for lm in landmarks)
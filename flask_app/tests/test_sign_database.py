@@ -0,0 +1,119 @@
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from speech_to_sign import sign_database
+from speech_to_sign.sign_database import ISLDatabase
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+@pytest.fixture(scope='module')
+def fallback_module():
+    """A second copy of sign_database imported with Numba unavailable (NumPy fallbacks)"""
+    pytest.importorskip('numba')
+    saved = sys.modules.get('numba')
+    sys.modules['numba'] = None  # makes 'from numba import njit' raise ImportError
+    try:
+        spec = importlib.util.spec_from_file_location(
+            'speech_to_sign._sign_database_fallback', sign_database.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules['numba'] = saved
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+def _hand(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).random((21, 3))
+
+
+@pytest.mark.parametrize('progress', [0.0, 0.37, 1.0])
+def test_interp_kernel_matches_fallback(fallback_module, progress):
+    start, end = _hand(0), _hand(1)
+    compiled = sign_database._interp_kernel(start, end, progress, np.empty_like(start))
+    fallback = fallback_module._interp_kernel(start, end, progress, np.empty_like(start))
+    np.testing.assert_allclose(compiled, fallback, rtol=0, atol=1e-12)
+
+
+def test_interp_frames_kernel_matches_fallback(fallback_module):
+    start, end = _hand(2), _hand(3)
+    progresses = np.linspace(0.0, 1.0, 30)
+    out_shape = (len(progresses),) + start.shape
+    compiled = sign_database._interp_frames_kernel(start, end, progresses, np.empty(out_shape))
+    fallback = fallback_module._interp_frames_kernel(start, end, progresses, np.empty(out_shape))
+    np.testing.assert_allclose(compiled, fallback, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('finger', [ISLDatabase.INDEX, ISLDatabase.PINKY])
+def test_extend_finger_kernel_matches_fallback(fallback_module, finger):
+    indices = np.asarray(finger, dtype=np.intp)
+    compiled = sign_database._extend_finger_kernel(_hand(4), indices, 0.01, 0.02)
+    fallback = fallback_module._extend_finger_kernel(_hand(4), indices, 0.01, 0.02)
+    np.testing.assert_allclose(compiled, fallback, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('curl_amount', [0.0, 0.5, 1.0])
+def test_curl_finger_kernel_matches_fallback(fallback_module, curl_amount):
+    indices = np.asarray(ISLDatabase.MIDDLE, dtype=np.intp)
+    compiled = sign_database._curl_finger_kernel(_hand(5), indices, curl_amount)
+    fallback = fallback_module._curl_finger_kernel(_hand(5), indices, curl_amount)
+    np.testing.assert_allclose(compiled, fallback, rtol=0, atol=1e-12)
+
+
+def _coords(hand):
+    return None if hand is None else np.array([[lm['x'], lm['y'], lm['z']] for lm in hand])
+
+
+def test_sign_records_match_baseline():
+    """Every sign record equals the original builders' output (data/sign_records.json)"""
+    with open(os.path.join(DATA_DIR, 'sign_records.json')) as f:
+        expected = json.load(f)
+    
+    db = ISLDatabase()
+    assert sorted(db.get_all_signs()) == sorted(expected)
+    
+    for name, record in expected.items():
+        sign = db.get_sign(name)
+        for key, value in record.items():
+            if key != 'keyframes':
+                assert sign[key] == value, (name, key)
+        
+        assert len(sign['keyframes']) == len(record['keyframes']), name
+        for keyframe, expected_keyframe in zip(sign['keyframes'], record['keyframes']):
+            assert keyframe['frame'] == expected_keyframe['frame'], name
+            for hand in ('right_hand', 'left_hand'):
+                actual = _coords(keyframe[hand])
+                if expected_keyframe[hand] is None:
+                    assert actual is None, (name, hand)
+                else:
+                    np.testing.assert_allclose(actual, expected_keyframe[hand], rtol=0, atol=1e-9,
+                                               err_msg=f'{name} {hand}')
+
+
+def test_sign_cache_round_trip(tmp_path):
+    """Signs read back from a saved .npz cache equal the freshly built ones"""
+    db = ISLDatabase()
+    path = str(tmp_path / 'isl' / 'signs.npz')
+    db.save_sign_cache(path)
+    
+    builders = db._sign_builders()
+    cached = db._cached_sign_builders(path, builders)
+    assert list(cached) == list(builders)
+    for name, build in cached.items():
+        assert db._freeze_sign(build()) == db._freeze_sign(builders[name]()), name
+
+
+def test_sign_cache_from_other_source_is_ignored(tmp_path, monkeypatch):
+    """A cache saved by a different version of the builders is rebuilt, not served"""
+    db = ISLDatabase()
+    path = str(tmp_path / 'signs.npz')
+    db.save_sign_cache(path)
+    
+    monkeypatch.setattr(sign_database, '_sign_cache_version', lambda: 'edited')
+    assert db._cached_sign_builders(path, db._sign_builders()) is None